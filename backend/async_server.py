@@ -0,0 +1,90 @@
+# backend/async_server.py
+"""Asyncio read path for the public listings: GET /api/items and GET /api/categories.
+
+Serves the same SQL (utils.resources) through aiomysql on an asyncio event loop, so thousands of
+readers waiting on MySQL cost a coroutine each instead of a thread each. Responses are byte-for-byte
+what the Flask views return, headers included (X-Change-Version, ETag / 304). Run it next to the
+Flask server and route those two GETs here at the proxy; everything else stays on Flask.
+
+    python async_server.py                # ASYNC_PORT defaults to 5001
+"""
+
+import os
+
+import aiomysql
+from aiohttp import web
+from dotenv import load_dotenv
+from werkzeug.http import generate_etag, parse_etags
+
+from utils.changes import CURRENT_VERSION_PARAMS, CURRENT_VERSION_QUERY, version_from_rows
+from utils.compression import COMPRESS_MIN_BYTES
+from utils.json_provider import json_body
+from utils.resources import CATEGORY_LISTING_QUERY, listing_query
+
+load_dotenv()
+
+ASYNC_HOST = os.getenv('ASYNC_HOST', '0.0.0.0')
+ASYNC_PORT = int(os.getenv('ASYNC_PORT', 5001))
+ASYNC_POOL_MIN = int(os.getenv('ASYNC_POOL_MIN', 2))
+ASYNC_POOL_MAX = int(os.getenv('ASYNC_POOL_MAX', 20))
+
+
+def json_response(body, status=200, headers=None):
+    """body is bytes from json_body(), the encoder the Flask app's jsonify uses."""
+    # Flask-CORS on the Flask app allows any origin; match it
+    headers = {'Access-Control-Allow-Origin': '*', **(headers or {})}
+    response = web.Response(body=body, status=status, content_type='application/json', headers=headers)
+    if len(body) >= COMPRESS_MIN_BYTES:
+        response.enable_compression()  # negotiated from Accept-Encoding, like utils.compression
+    return response
+
+
+async def fetch_all(pool, sql, params=()):
+    async with pool.acquire() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(sql, params)
+            return await cursor.fetchall()
+
+async def get_all_items(request):
+    """Same as item_routes.get_all_items."""
+    pool = request.app['pool']
+    status_filter = request.query.get('status')
+    search_query = request.query.get('search', '').strip()
+    include_resolved = request.query.get('include_resolved', 'false').lower() == 'true'
+
+    # Read the version first so anything committed during the listing shows up in the next delta;
+    # it stops below changes that may still be uncommitted (utils.changes), so none is skipped
+    version = version_from_rows(await fetch_all(pool, CURRENT_VERSION_QUERY, CURRENT_VERSION_PARAMS))
+    items = await fetch_all(pool, *listing_query(status_filter, search_query, include_resolved))
+    return json_response(json_body(items), headers={'X-Change-Version': str(version)})
+
+async def list_categories(request):
+    """Same as category_routes.list_categories, including the ETag revalidation."""
+    categories = await fetch_all(request.app['pool'], CATEGORY_LISTING_QUERY)
+    body = json_body(categories)
+    etag = generate_etag(body)
+    headers = {'ETag': f'"{etag}"'}
+    if parse_etags(request.headers.get('If-None-Match')).contains(etag):
+        return web.Response(status=304, headers={'Access-Control-Allow-Origin': '*', **headers})
+    return json_response(body, headers=headers)
+
+
+async def open_pool(app):
+    # autocommit: every read sees the latest committed data, never a stale snapshot
+    app['pool'] = await aiomysql.create_pool(
+        host=os.getenv('MYSQL_HOST'), user=os.getenv('MYSQL_USER'), password=os.getenv('MYSQL_PASSWORD'),
+        db=os.getenv('MYSQL_DB'), minsize=ASYNC_POOL_MIN, maxsize=ASYNC_POOL_MAX, autocommit=True, charset='utf8mb4')
+    yield
+    app['pool'].close()
+    await app['pool'].wait_closed()
+
+def create_app():
+    app = web.Application()
+    app.cleanup_ctx.append(open_pool)
+    app.router.add_get('/api/items', get_all_items)
+    app.router.add_get('/api/categories', list_categories)
+    return app
+
+
+if __name__ == '__main__':
+    web.run_app(create_app(), host=ASYNC_HOST, port=ASYNC_PORT)
@@ -0,0 +1,2 @@
+# backend/benchmarks/__init__.py
+# Marks the directory as a Python package.
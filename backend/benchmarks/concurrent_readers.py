@@ -0,0 +1,79 @@
+# backend/benchmarks/concurrent_readers.py
+"""Concurrent-reader capacity: threaded Flask path vs. the asyncio read path.
+
+Holds N concurrent readers (each loops on GET /api/items and /api/categories) against each server
+for a fixed time and reports requests/s, p50/p99 latency and errors at every concurrency level.
+Start both servers first (e.g. `python serve.py` and `python async_server.py`).
+
+    python benchmarks/concurrent_readers.py --threaded-url http://127.0.0.1:5000 \\
+        --async-url http://127.0.0.1:5001 --concurrency 16 64 256 1024 --duration 15
+"""
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+
+PATHS = ('/api/items', '/api/categories')
+
+
+def percentile(values, pct):
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_level(base_url, concurrency, duration):
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        async def reader(index):
+            nonlocal errors
+            request_number = index
+            while time.perf_counter() < deadline:
+                path = PATHS[request_number % len(PATHS)]
+                request_number += 1
+                started = time.perf_counter()
+                try:
+                    async with session.get(base_url + path) as response:
+                        await response.read()
+                        ok = response.status == 200
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(reader(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return len(latencies) / elapsed, percentile(latencies, 50), percentile(latencies, 99), errors
+
+
+async def main_async(args):
+    targets = [('threaded', args.threaded_url), ('async', args.async_url)]
+    print(f"{'server':<9} {'readers':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for concurrency in args.concurrency:
+        for name, base_url in targets:
+            rate, p50, p99, errors = await run_level(base_url.rstrip('/'), concurrency, args.duration)
+            print(f"{name:<9} {concurrency:>7} {rate:>9.0f} {p50:>8.1f} {p99:>8.1f} {errors:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threaded-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--async-url', default='http://127.0.0.1:5001')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[16, 64, 256, 1024])
+    parser.add_argument('--duration', type=float, default=15)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
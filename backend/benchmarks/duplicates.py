@@ -0,0 +1,59 @@
+# backend/benchmarks/duplicates.py
+"""Duplicate detection at scale: MinHash/LSH index build, lookup latency and incremental adds.
+
+Builds a DuplicateIndex over --items synthetic open items (the same generator as
+benchmarks.matching), then times find() for reworded copies of existing reports, the check
+report_item makes, and add() for new ones. Needs no database. Run from backend/:
+
+    python -m benchmarks.duplicates --items 100000 --queries 2000
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.matching import percentile, synthetic_items
+from utils.duplicates import DuplicateIndex
+
+
+def reworded(item, rng):
+    """The same report as someone else would write it: words shuffled, a few dropped."""
+    words = f"{item['title']} {item['description']}".split()
+    rng.shuffle(words)
+    return {**item, 'title': ' '.join(words[:4]), 'description': ' '.join(words[4:int(len(words) * 0.9)])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    items = list(synthetic_items(args.items, args.seed))
+    index = DuplicateIndex()
+    started = time.perf_counter()
+    index.rebuild(items)
+    print(f"build     {len(index):>8} items   {time.perf_counter() - started:8.2f} s")
+
+    rng = random.Random(args.seed)
+    queries = [reworded(rng.choice(items), rng) for _ in range(args.queries)]
+    latencies, found = [], 0
+    for query in queries:
+        started = time.perf_counter()
+        duplicates = index.find(query['title'], query['description'], query['category_id'], query['status'])
+        latencies.append((time.perf_counter() - started) * 1000)
+        found += any(item_id == query['item_id'] for item_id, _ in duplicates)
+    print(f"find      p50 {percentile(latencies, 50):7.3f} ms   p99 {percentile(latencies, 99):7.3f} ms   "
+          f"original among the top 5 for {found / len(queries):.0%}")
+
+    latencies = []
+    for n, query in enumerate(queries):
+        started = time.perf_counter()
+        index.add({**query, 'item_id': args.items + n + 1})
+        latencies.append((time.perf_counter() - started) * 1000)
+    print(f"add       p50 {percentile(latencies, 50):7.3f} ms   p99 {percentile(latencies, 99):7.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
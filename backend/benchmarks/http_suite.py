@@ -0,0 +1,264 @@
+# backend/benchmarks/http_suite.py
+"""End-to-end HTTP benchmark: mixed workload, per-endpoint throughput and latency percentiles.
+
+For every scale it seeds a dedicated database with seed_data.py (--reset, fixed --seed), starts
+serve.py against it, drives a weighted mix of logins, item listing and search, claim submission,
+the admin pending-claims view and claim resolution from --threads clients for --duration
+seconds, then stops the server. Results are written as JSON; with --baseline each endpoint's p95
+and throughput are compared to a stored run and regressions beyond --tolerance fail the run.
+The benchmark databases are <MYSQL_DB>_bench_<scale> (or bench_<scale>.db on SQLite), never
+the one the app normally uses. Run from backend/:
+
+    python -m benchmarks.http_suite --scales small medium --duration 30 --output results.json
+    python -m benchmarks.http_suite --scales small --baseline results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# endpoint name -> share of the mix
+WORKLOAD = {
+    'login': 10,
+    'list items': 35,
+    'search items': 20,
+    'submit claim': 10,
+    'pending claims': 15,
+    'resolve claim': 10,
+}
+SEARCH_TERMS = ('phone', 'black', 'library', 'jacket', 'key', 'bottle', 'charger', 'backpack')
+
+# Logins and claims come from users 2..LOGIN_USERS (user 1 is the admin); every scale has at least this many
+LOGIN_USERS = 1000
+
+# The limiter would otherwise throttle a benchmark that hammers the app from one address
+UNLIMITED = {f'RATE_LIMIT_{route_class}': '1000000000,1000000000' for route_class in ('AUTH', 'SEARCH', 'WRITE', 'DEFAULT')}
+
+
+def percentile(values, pct):
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def scale_env(args, scale):
+    env = {**os.environ, **UNLIMITED, 'SLOW_QUERY_MS': '-1', 'PORT': str(args.port), 'WORKERS': str(args.workers)}
+    if env.get('DB_ENGINE', 'mysql') == 'sqlite':
+        env['SQLITE_PATH'] = f"bench_{scale}.db"
+    else:
+        env['MYSQL_DB'] = f"{os.getenv('MYSQL_DB', 'back2u_db')}_bench_{scale}"
+    return env
+
+def start_server(env, base_url, timeout=60):
+    server = subprocess.Popen([sys.executable, 'serve.py'], cwd=BACKEND_DIR, env=env)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"serve.py exited with {server.returncode}")
+        try:
+            if requests.get(f"{base_url}/readyz", timeout=2).status_code == 200:
+                return server
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.5)
+    stop_server(server)
+    raise SystemExit(f"Server not ready after {timeout}s")
+
+def stop_server(server):
+    if os.name == 'posix':
+        server.send_signal(signal.SIGTERM)  # graceful drain, as in production
+    else:
+        server.terminate()
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+class Client:
+    """One simulated user session: a student token for claims, the admin token for admin calls."""
+
+    def __init__(self, base_url, rng, student_ids, admin_token, shared):
+        self.base_url = base_url
+        self.rng = rng
+        self.student_ids = student_ids
+        self.admin_headers = {'Authorization': f'Bearer {admin_token}'}
+        self.shared = shared
+        self.session = requests.Session()
+        self.headers = None
+
+    def login(self, password):
+        email = f"user{self.rng.choice(self.student_ids)}@example.edu"
+        response = self.session.post(f"{self.base_url}/api/auth/login", json={'email': email, 'password': password})
+        if response.status_code == 200:
+            self.headers = {'Authorization': f"Bearer {response.json()['token']}"}
+        return response
+
+    def request(self, endpoint, password):
+        if endpoint == 'login':
+            return self.login(password)
+        if endpoint == 'list items':
+            return self.session.get(f"{self.base_url}/api/items")
+        if endpoint == 'search items':
+            return self.session.get(f"{self.base_url}/api/items", params={'search': self.rng.choice(SEARCH_TERMS)})
+        if endpoint == 'submit claim':
+            item_id = self.rng.choice(self.shared['open_items'])
+            return self.session.post(f"{self.base_url}/api/items/{item_id}/claim", headers=self.headers,
+                                     json={'verification_details': 'It has my initials on the inside of the case.'})
+        if endpoint == 'pending claims':
+            response = self.session.get(f"{self.base_url}/api/admin/claims/pending", headers=self.admin_headers)
+            if response.status_code == 200:
+                claim_ids = [claim['claim_id'] for claim in response.json()]
+                if claim_ids:
+                    self.shared['pending_claims'] = claim_ids
+            return response
+        claim_id = self.rng.choice(self.shared['pending_claims'])
+        return self.session.post(f"{self.base_url}/api/admin/claims/resolve", headers=self.admin_headers,
+                                 json={'claim_id': claim_id, 'resolution_type': self.rng.choice(('approve', 'reject'))})
+
+
+def run_workload(args, base_url):
+    admin = requests.post(f"{base_url}/api/auth/login", json={'email': 'user1@example.edu', 'password': args.password})
+    if admin.status_code != 200 or admin.json().get('role') != 'admin':
+        raise SystemExit(f"Admin login failed: {admin.status_code} {admin.text[:200]}")
+    admin_token = admin.json()['token']
+    open_items = [item['item_id'] for item in requests.get(f"{base_url}/api/items").json()]
+    pending = requests.get(f"{base_url}/api/admin/claims/pending", headers={'Authorization': f'Bearer {admin_token}'}).json()
+    shared = {'open_items': open_items or [1], 'pending_claims': [claim['claim_id'] for claim in pending] or [1]}
+    student_ids = list(range(2, LOGIN_USERS + 1))
+
+    endpoints, weights = list(WORKLOAD), list(WORKLOAD.values())
+    lock = threading.Lock()
+    latencies = {endpoint: [] for endpoint in endpoints}
+    errors = {endpoint: 0 for endpoint in endpoints}
+    stop = threading.Event()
+
+    def worker(index):
+        rng = random.Random(args.seed * 1000 + index)  # the same request sequence every run
+        client = Client(base_url, rng, student_ids, admin_token, shared)
+        client.login(args.password)  # untimed: claims need a token from the first request on
+        while not stop.is_set():
+            endpoint = rng.choices(endpoints, weights=weights)[0]
+            started = time.perf_counter()
+            try:
+                failed = client.request(endpoint, args.password).status_code >= 500
+            except requests.exceptions.RequestException:
+                failed = True
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                if failed:
+                    errors[endpoint] += 1
+                else:
+                    latencies[endpoint].append(elapsed)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    results = {}
+    for endpoint in endpoints:
+        values = latencies[endpoint]
+        results[endpoint] = {
+            'requests': len(values),
+            'errors': errors[endpoint],
+            'rps': len(values) / args.duration,
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'p99': percentile(values, 99),
+        }
+    results['total'] = {'requests': sum(len(v) for v in latencies.values()), 'errors': sum(errors.values()),
+                        'rps': sum(len(v) for v in latencies.values()) / args.duration}
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Regressions against a stored run: p95 up or throughput down by more than tolerance."""
+    regressions = []
+    for scale, endpoints in results['scales'].items():
+        for endpoint, current in endpoints.items():
+            previous = baseline.get('scales', {}).get(scale, {}).get(endpoint)
+            if not previous:
+                continue
+            if 'p95' in current and previous.get('p95') and current['p95'] > previous['p95'] * (1 + tolerance):
+                regressions.append(f"{scale} {endpoint}: p95 {previous['p95']:.1f} -> {current['p95']:.1f} ms")
+            if previous.get('rps') and current['rps'] < previous['rps'] * (1 - tolerance):
+                regressions.append(f"{scale} {endpoint}: {previous['rps']:.1f} -> {current['rps']:.1f} req/s")
+    return regressions
+
+def print_results(scale, results):
+    print(f"\n{scale}: {results['total']['rps']:.1f} req/s total, {results['total']['errors']} errors")
+    print(f"{'endpoint':<16} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for endpoint in WORKLOAD:
+        row = results[endpoint]
+        print(f"{endpoint:<16} {row['rps']:>8.1f} {row['p50']:>8.1f} {row['p95']:>8.1f} {row['p99']:>8.1f} {row['errors']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', nargs='+', default=['small'], choices=('small', 'medium', 'large'))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--workers', type=int, default=2, help='serve.py WORKERS')
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--password', default='password123')
+    parser.add_argument('--skip-seed', action='store_true', help='reuse the databases from a previous run')
+    parser.add_argument('--output', default=f"http_suite_{datetime.now():%Y%m%d_%H%M%S}.json")
+    parser.add_argument('--baseline', help='results JSON of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='allowed relative change before flagging')
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    results = {
+        'meta': {'started': datetime.now().isoformat(timespec='seconds'), 'seed': args.seed, 'threads': args.threads,
+                 'duration': args.duration, 'workers': args.workers, 'python': platform.python_version(),
+                 'db_engine': os.getenv('DB_ENGINE', 'mysql')},
+        'scales': {},
+    }
+    for scale in args.scales:
+        env = scale_env(args, scale)
+        if not args.skip_seed:
+            subprocess.run([sys.executable, 'seed_data.py', '--scale', scale, '--seed', str(args.seed), '--reset',
+                            '--password', args.password], cwd=BACKEND_DIR, env=env, check=True)
+        server = start_server(env, base_url)
+        try:
+            results['scales'][scale] = run_workload(args, base_url)
+        finally:
+            stop_server(server)
+        print_results(scale, results['scales'][scale])
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
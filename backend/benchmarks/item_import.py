@@ -0,0 +1,79 @@
+# backend/benchmarks/item_import.py
+"""Rows per second through POST /api/admin/items/import, against single POST /api/items calls.
+
+Runs the Flask app in-process (test client) on the database configured in .env, uploads a
+generated CSV and NDJSON file, and times a sample of one-at-a-time reports for comparison.
+Imported rows are real rows; point it at a scratch database. Run from backend/:
+
+    python -m benchmarks.item_import --rows 50000 --batch 1000
+"""
+
+import argparse
+import json
+import os
+import time
+
+
+def build_upload(rows, fmt, categories):
+    records = [{'title': f"import {n}", 'description': f"legacy register entry {n}, shelf {n % 40}",
+                'status': ('lost', 'found', 'resolved')[n % 3], 'category': categories[n % len(categories)],
+                'date_reported': f"2023-{n % 12 + 1:02d}-{n % 28 + 1:02d} 10:00"} for n in range(rows)]
+    if fmt == 'ndjson':
+        return ''.join(json.dumps(record) + '\n' for record in records).encode('utf-8')
+    lines = ['title,description,status,category,date_reported']
+    lines += [f"{r['title']},\"{r['description']}\",{r['status']},{r['category']},{r['date_reported']}" for r in records]
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--batch', type=int, default=1000, help='IMPORT_BATCH_ROWS')
+    parser.add_argument('--single', type=int, default=500, help='one-at-a-time reports to time')
+    args = parser.parse_args()
+    os.environ['IMPORT_BATCH_ROWS'] = str(args.batch)
+    os.environ.setdefault('SLOW_QUERY_MS', '-1')
+    for route_class in ('AUTH', 'SEARCH', 'WRITE', 'DEFAULT'):
+        os.environ[f'RATE_LIMIT_{route_class}'] = '1000000000,1000000000'
+
+    from server import app
+    from config.db_connector import db
+    from utils.security import encode_auth_token
+
+    cursor = db.get_cursor()
+    cursor.execute("SELECT user_id FROM Users WHERE email = %s", ('bench-admin@example.com',))
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute("INSERT INTO Users (name, email, role, password_hash) VALUES (%s, %s, %s, %s)",
+                       ('Bench Admin', 'bench-admin@example.com', 'admin', 'not-a-real-hash'))
+        admin_id = cursor.lastrowid
+    else:
+        admin_id = row[0]
+    cursor.execute("SELECT name FROM Categories ORDER BY category_id")
+    categories = [name for (name,) in cursor.fetchall()]
+    db.conn.commit()
+    cursor.close()
+
+    client = app.test_client()
+    headers = {'Authorization': f"Bearer {encode_auth_token(admin_id, 'admin')}"}
+
+    for fmt, mimetype in (('csv', 'text/csv'), ('ndjson', 'application/x-ndjson')):
+        body = build_upload(args.rows, fmt, categories)
+        started = time.perf_counter()
+        response = client.post('/api/admin/items/import', data=body, content_type=mimetype, headers=headers)
+        elapsed = time.perf_counter() - started
+        report = response.get_json()
+        if response.status_code != 200 or report['failed']:
+            raise SystemExit(f"{fmt} import failed: {response.status_code} {str(report)[:300]}")
+        print(f"import {fmt:<7} {report['imported']:>7} rows in {elapsed:6.2f}s  {report['imported'] / elapsed:>9.0f} rows/s")
+
+    item = {'title': 'single report', 'description': 'one at a time', 'status': 'lost', 'category_id': 1}
+    started = time.perf_counter()
+    for _ in range(args.single):
+        client.post('/api/items', json=item, headers=headers)
+    elapsed = time.perf_counter() - started
+    print(f"POST /api/items {args.single:>7} rows in {elapsed:6.2f}s  {args.single / elapsed:>9.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
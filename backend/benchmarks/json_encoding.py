@@ -0,0 +1,77 @@
+# backend/benchmarks/json_encoding.py
+"""Encode time and wire size of a large item listing: Flask's default JSON vs. utils.json_provider.
+
+Builds synthetic rows shaped like GET /api/items (datetimes, free-text descriptions), encodes them
+with the stdlib settings jsonify used before (sort_keys, HTTP-date datetimes) and with the fast
+encoder, then compresses the result with gzip and brotli at the configured levels. Run from backend/:
+
+    python -m benchmarks.json_encoding --items 10000 --rounds 20
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from flask.json.provider import DefaultJSONProvider
+
+from utils import compression, json_provider
+
+WORDS = ('black', 'wallet', 'left', 'near', 'library', 'blue', 'umbrella', 'found', 'cafeteria', 'keys',
+         'with', 'a', 'red', 'keychain', 'charger', 'laptop', 'bag', 'second', 'floor', 'lab')
+
+
+def synthetic_items(count, seed=42):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    return [{
+        'item_id': n,
+        'title': ' '.join(rng.choices(WORDS, k=3)),
+        'description': ' '.join(rng.choices(WORDS, k=rng.randint(10, 40))),
+        'status': rng.choice(('lost', 'found', 'claim_pending')),
+        'date_reported': start + timedelta(minutes=rng.randint(0, 500000)),
+        'category_name': rng.choice(('Electronics', 'Books', 'Clothing', 'Keys', 'Other')),
+        'reporter_name': f"Student {rng.randint(1, 2000)}",
+    } for n in range(count)]
+
+def flask_default(obj):
+    """What jsonify produced before FastJSONProvider, outside debug mode."""
+    return (json.dumps(obj, default=DefaultJSONProvider.default, ensure_ascii=DefaultJSONProvider.ensure_ascii,
+                       sort_keys=DefaultJSONProvider.sort_keys, separators=(',', ':')) + '\n').encode('utf-8')
+
+def timed(fn, rounds):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    items = synthetic_items(args.items)
+    encoders = (('flask default', lambda: flask_default(items)),
+                (f"fast ({'orjson' if json_provider.orjson else 'stdlib'})", lambda: json_provider.json_body(items)))
+    print(f"{args.items} items, median of {args.rounds} rounds")
+    for name, encode in encoders:
+        body, encode_ms = timed(encode, args.rounds)
+        print(f"{name:<20} encode {encode_ms:>8.2f}ms  raw {len(body):>9} B")
+
+    encodings = ['gzip'] + (['br'] if compression.brotli is not None else [])
+    for encoding in encodings:
+        compressed, compress_ms = timed(lambda: compression.compress(body, encoding), args.rounds)
+        print(f"{encoding:<20} compress {compress_ms:>6.2f}ms  wire {len(compressed):>8} B "
+              f"({len(compressed) / len(body):.1%} of raw)")
+    if compression.brotli is None:
+        print("br skipped: pip install brotli")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# backend/benchmarks/login_mixed_load.py
+"""Login throughput vs. item-listing latency under a mixed load.
+
+Runs login workers and listing workers side by side against a running API and reports logins/s
+(with how many were shed as 503) and listing latency percentiles. Compare runs with different
+PASSWORD_WORKERS / PASSWORD_QUEUE_LIMIT / BCRYPT_ROUNDS on the server.
+
+    python benchmarks/login_mixed_load.py --email bench@example.com --password secret \\
+        --login-threads 32 --list-threads 8 --duration 20
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+import requests
+
+
+def percentile(values, pct):
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(args):
+    stop = threading.Event()
+    lock = threading.Lock()
+    stats = {'login_ok': 0, 'login_busy': 0, 'login_failed': 0, 'list_errors': 0}
+    list_latencies = []
+
+    def login_worker():
+        session = requests.Session()
+        while not stop.is_set():
+            try:
+                response = session.post(f"{args.base_url}/api/auth/login",
+                                        json={"email": args.email, "password": args.password}, timeout=30)
+                key = 'login_ok' if response.status_code == 200 else \
+                    'login_busy' if response.status_code == 503 else 'login_failed'
+            except requests.exceptions.RequestException:
+                key = 'login_failed'
+            with lock:
+                stats[key] += 1
+
+    def list_worker():
+        session = requests.Session()
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                ok = session.get(f"{args.base_url}/api/items", timeout=30).status_code == 200
+            except requests.exceptions.RequestException:
+                ok = False
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                if ok:
+                    list_latencies.append(elapsed)
+                else:
+                    stats['list_errors'] += 1
+
+    threads = [threading.Thread(target=login_worker) for _ in range(args.login_threads)]
+    threads += [threading.Thread(target=list_worker) for _ in range(args.list_threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return stats, list_latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--base-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--email', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--login-threads', type=int, default=32)
+    parser.add_argument('--list-threads', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=20)
+    args = parser.parse_args()
+
+    stats, latencies = run(args)
+    print(f"logins/s ok:     {stats['login_ok'] / args.duration:8.1f}")
+    print(f"logins shed 503: {stats['login_busy']:8d}")
+    print(f"logins failed:   {stats['login_failed']:8d}")
+    print(f"listing requests:{len(latencies):8d}  errors: {stats['list_errors']}")
+    if latencies:
+        print(f"listing ms  p50 {percentile(latencies, 50):.1f}  p95 {percentile(latencies, 95):.1f}  "
+              f"p99 {percentile(latencies, 99):.1f}  mean {statistics.mean(latencies):.1f}")
+
+
+if __name__ == '__main__':
+    main()
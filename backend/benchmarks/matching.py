@@ -0,0 +1,89 @@
+# backend/benchmarks/matching.py
+"""Lost-to-found matching at scale: index build, query latency, batched throughput, updates.
+
+Builds a MatchIndex over --items synthetic open items (seed_data.py's vocabulary, so titles
+and descriptions look like the real ones) and times single-item match queries, match_many()
+batches and incremental add()/remove(). Needs no database. Run from backend/:
+
+    python -m benchmarks.matching --items 100000 --queries 1000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from seed_data import ADJECTIVES, FILLER, NOUNS, PLACES
+from utils.matching import MatchIndex
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+def synthetic_items(count, seed, days=365, users=5000, categories=len(NOUNS)):
+    rng = random.Random(seed)
+    end = datetime(2025, 1, 1)
+    nouns = list(NOUNS.values())
+    for item_id in range(1, count + 1):
+        category = rng.randrange(categories)
+        title = f"{rng.choice(ADJECTIVES).capitalize()} {rng.choice(nouns[category])}"
+        if rng.random() < 0.5:
+            title += f" near the {rng.choice(PLACES)}"
+        yield {'item_id': item_id, 'reported_by': rng.randrange(1, users), 'category_id': category + 1,
+               'title': title, 'description': f"{title} {' '.join(rng.choices(FILLER, k=rng.randint(5, 40)))}",
+               'status': rng.choice(('lost', 'found')),
+               'date_reported': end - timedelta(seconds=rng.randrange(days * 86400))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=1000)
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--dimensions', type=int, default=None, help='MATCH_DIMENSIONS')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    items = list(synthetic_items(args.items, args.seed))
+    index = MatchIndex(args.dimensions) if args.dimensions else MatchIndex()
+
+    started = time.perf_counter()
+    index.rebuild(items)
+    build = time.perf_counter() - started
+    print(f"build     {len(index):>8} items   {build:8.2f} s   {index.vectors.nbytes / 2**20:.0f} MiB of vectors")
+
+    rng = random.Random(args.seed)
+    query_ids = [rng.randrange(1, args.items + 1) for _ in range(args.queries)]
+    latencies = []
+    for item_id in query_ids:
+        started = time.perf_counter()
+        index.matches(item_id, args.limit)
+        latencies.append((time.perf_counter() - started) * 1000)
+    print(f"query     p50 {percentile(latencies, 50):7.2f} ms   p99 {percentile(latencies, 99):7.2f} ms   "
+          f"{len(latencies) / (sum(latencies) / 1000):8.0f} queries/s")
+
+    started = time.perf_counter()
+    index.match_many(query_ids, args.limit)
+    elapsed = time.perf_counter() - started
+    print(f"batched   {len(query_ids):>8} queries {elapsed:8.2f} s   {len(query_ids) / elapsed:8.0f} queries/s")
+
+    new_items = list(synthetic_items(args.queries, args.seed + 1))
+    latencies = []
+    for n, item in enumerate(new_items):
+        item['item_id'] = args.items + n + 1
+        started = time.perf_counter()
+        index.add(item)
+        latencies.append((time.perf_counter() - started) * 1000)
+    print(f"add       p50 {percentile(latencies, 50):7.3f} ms   p99 {percentile(latencies, 99):7.3f} ms")
+
+    latencies = []
+    for item in new_items:
+        started = time.perf_counter()
+        index.remove(item['item_id'])
+        latencies.append((time.perf_counter() - started) * 1000)
+    print(f"remove    p50 {percentile(latencies, 50):7.3f} ms   p99 {percentile(latencies, 99):7.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+# backend/benchmarks/micro.py
+"""Micro-benchmarks for the backend's hot functions, with warmup, repeats, median and IQR.
+
+Covers password hashing and verification, token encoding, token decoding (cold and through
+token_required's cache), the item listing SQL construction, jsonify of listing rows and
+send_claim_resolved_emails against a local SMTP sink. Runs on a throwaway SQLite database and
+needs neither MySQL nor a mail server. Run from backend/:
+
+    python -m benchmarks.micro                          # this checkout
+    python -m benchmarks.micro --json after.json        # save the numbers
+    python -m benchmarks.micro --compare ../../main     # this checkout vs. another one
+
+--compare runs this same suite in a subprocess against each checkout's backend/ and prints the
+two side by side; a change is only called out when the interquartile ranges do not overlap.
+Benchmarks whose code a checkout does not have are skipped there.
+"""
+
+import argparse
+import base64
+import json
+import os
+import socketserver
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Each repeat runs the function at least this long, so timer resolution does not matter
+MIN_REPEAT_SECONDS = 0.05
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server that accepts and discards every message (no STARTTLS, any AUTH)."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SMTPSinkHandler)
+        self.messages = 0
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode('ascii') + b'\r\n')
+
+    def handle(self):
+        self.reply('220 sink ready')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('ascii', errors='replace').strip().upper()
+            if command.startswith(('EHLO', 'HELO')):
+                self.wfile.write(b'250-sink\r\n250 AUTH PLAIN LOGIN\r\n')
+            elif command.startswith('AUTH LOGIN'):
+                self.reply('334 ' + base64.b64encode(b'Username:').decode())
+                self.rfile.readline()
+                self.reply('334 ' + base64.b64encode(b'Password:').decode())
+                self.rfile.readline()
+                self.reply('235 ok')
+            elif command.startswith('AUTH'):
+                self.reply('235 ok')
+            elif command == 'DATA':
+                self.reply('354 end with .')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                self.server.messages += 1
+                self.reply('250 queued')
+            elif command == 'QUIT':
+                self.reply('221 bye')
+                return
+            else:  # MAIL, RCPT, RSET, NOOP
+                self.reply('250 ok')
+
+
+def measure(fn, warmup, repeat):
+    """Seconds per call: median, first and third quartile over `repeat` timed runs."""
+    for _ in range(warmup):
+        fn()
+    number = 1
+    while True:  # calibrate calls per repeat, as timeit's autorange does
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - started >= MIN_REPEAT_SECONDS:
+            break
+        number *= 2
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number)
+    q1, median, q3 = statistics.quantiles(samples, n=4) if len(samples) > 1 else samples * 3
+    return {'median': median, 'q1': q1, 'q3': q3, 'iqr': q3 - q1, 'calls_per_repeat': number, 'repeats': repeat}
+
+
+def setup_fixtures():
+    """Seeds the throwaway database; returns (item_id, reporter_id, claimant_id)."""
+    from config.db_connector import db, create_tables_and_seed
+    create_tables_and_seed()
+    cursor = db.get_cursor()
+    ids = []
+    for n in (1, 2):
+        cursor.execute("INSERT INTO Users (name, email, role, password_hash) VALUES (%s, %s, %s, %s)",
+                       (f"Micro User {n}", f"micro{n}@example.edu", 'student', 'not-a-real-hash'))
+        ids.append(cursor.lastrowid)
+    cursor.execute("INSERT INTO Items (reported_by, category_id, title, description, status) VALUES (%s, %s, %s, %s, %s)",
+                   (ids[0], 1, 'Black phone', 'Black phone with a cracked screen', 'lost'))
+    item_id = cursor.lastrowid
+    db.conn.commit()
+    cursor.close()
+    return item_id, ids[0], ids[1]
+
+def listing_rows(count=1000):
+    from datetime import datetime, timedelta
+    start = datetime(2024, 1, 1)
+    return [{'item_id': n, 'reported_by': n % 97, 'category_id': n % 5 + 1, 'title': f"Black phone {n}",
+             'description': 'Black phone near the library with a cracked screen and a blue case ' * 2,
+             'status': ('lost', 'found')[n % 2], 'date_reported': start + timedelta(minutes=n),
+             'reporter_name': f"Student {n % 97}", 'category_name': 'Electronics'} for n in range(count)]
+
+
+def build_benchmarks():
+    """(name, setup) pairs; setup returns the function to time, or raises ImportError/AttributeError
+    when this checkout does not have the code under test."""
+
+    def password_hash():
+        from utils.security import hash_password
+        return lambda: hash_password('correct horse battery staple')
+
+    def password_verify():
+        from utils.security import hash_password, verify_password
+        hashed = hash_password('correct horse battery staple')
+        return lambda: verify_password('correct horse battery staple', hashed)
+
+    def token_encode():
+        from utils.security import encode_auth_token
+        return lambda: encode_auth_token(42, 'student')
+
+    def token_decode():
+        import jwt
+        from utils.security import SECRET_KEY, encode_auth_token
+        token = encode_auth_token(42, 'student')
+        return lambda: jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+
+    def token_required_cached():
+        from flask import Flask
+        from utils.security import encode_auth_token, token_required
+        app = Flask(__name__)
+        view = token_required(lambda: None)
+        context = app.test_request_context(headers={'Authorization': f"Bearer {encode_auth_token(42, 'student')}"})
+        context.push()  # left pushed: the benchmark process ends right after
+        return view
+
+    def listing_sql():
+        from utils.resources import listing_query
+        return lambda: (listing_query(None, '', False), listing_query('lost', 'black phone', True))
+
+    def jsonify_listing():
+        from flask import Flask, jsonify
+        app = Flask(__name__)
+        try:
+            from utils.json_provider import init_json
+            init_json(app)
+        except ImportError:
+            pass  # a checkout from before the fast JSON provider
+        rows = listing_rows()
+        context = app.app_context()
+        context.push()
+        return lambda: jsonify(rows).get_data()
+
+    def claim_resolved_emails():
+        from utils.notification import send_claim_resolved_emails
+        item_id, _, claimant_id = setup_fixtures()
+        return lambda: send_claim_resolved_emails(item_id, claimant_id, 1)
+
+    return [
+        ('hash_password', password_hash),
+        ('verify_password', password_verify),
+        ('encode_auth_token', token_encode),
+        ('jwt decode (token cache miss)', token_decode),
+        ('token_required (cached token)', token_required_cached),
+        ('get_all_items SQL construction', listing_sql),
+        ('jsonify 1000 listing rows', jsonify_listing),
+        ('send_claim_resolved_emails', claim_resolved_emails),
+    ]
+
+
+def run_suite(args):
+    workdir = tempfile.mkdtemp(prefix='micro-bench-')
+    sink = SMTPSink()
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+    # Before the app modules are imported: they read their settings at import time
+    os.environ.update({
+        'DB_ENGINE': 'sqlite', 'SQLITE_PATH': os.path.join(workdir, 'micro.db'),
+        'EMAIL_HOST': '127.0.0.1', 'EMAIL_PORT': str(sink.port), 'EMAIL_USE_TLS': '0',
+        'EMAIL_SENDER': 'bench@example.edu', 'EMAIL_USER': 'bench', 'EMAIL_PASS': 'bench',
+    })
+    os.environ.setdefault('SECRET_KEY', 'micro-benchmark-secret')
+    # email_debug.log and friends land in workdir, not in the checkout; '' on sys.path (python -m
+    # from backend/) must keep pointing at backend/ after the chdir
+    sys.path[:] = [os.path.abspath(entry) for entry in sys.path]
+    os.chdir(workdir)
+
+    results = {}
+    for name, setup in build_benchmarks():
+        if args.only and not any(part.lower() in name.lower() for part in args.only):
+            continue
+        try:
+            fn = setup()
+        except (ImportError, AttributeError) as e:
+            print(f"skip {name}: {e}", file=sys.stderr)
+            continue
+        # bcrypt is tens of ms a call; fewer repeats keep the suite short without hurting the median
+        repeat = max(5, args.repeat // 3) if 'password' in name else args.repeat
+        results[name] = measure(fn, args.warmup, repeat)
+    print(f"SMTP sink received {sink.messages} messages", file=sys.stderr)
+    return results
+
+
+def format_seconds(seconds):
+    if seconds != seconds:  # NaN
+        return '-'
+    for unit, scale in (('s', 1), ('ms', 1e3), ('µs', 1e6)):
+        if seconds >= 1 / scale:
+            return f"{seconds * scale:.2f} {unit}"
+    return f"{seconds * 1e9:.0f} ns"
+
+def print_results(results):
+    print(f"{'benchmark':<34} {'median':>11} {'IQR':>11}")
+    for name, row in results.items():
+        print(f"{name:<34} {format_seconds(row['median']):>11} {format_seconds(row['iqr']):>11}")
+
+def print_comparison(base_label, base, head_label, head):
+    print(f"{'benchmark':<34} {base_label[-14:]:>14} {head_label[-14:]:>14} {'ratio':>7}")
+    for name in dict.fromkeys(list(base) + list(head)):
+        before, after = base.get(name), head.get(name)
+        if before is None or after is None:
+            print(f"{name:<34} {format_seconds(before['median']) if before else '-':>14} "
+                  f"{format_seconds(after['median']) if after else '-':>14}")
+            continue
+        ratio = after['median'] / before['median']
+        # Called out only when the interquartile ranges are disjoint
+        verdict = 'faster' if after['q3'] < before['q1'] else 'slower' if after['q1'] > before['q3'] else ''
+        print(f"{name:<34} {format_seconds(before['median']):>14} {format_seconds(after['median']):>14} "
+              f"{ratio:>6.2f}x {verdict}")
+
+
+def run_checkout(path, args):
+    """Runs this suite against another checkout's backend/ in a subprocess; returns its results."""
+    backend = os.path.abspath(path)
+    if os.path.isdir(os.path.join(backend, 'backend')):
+        backend = os.path.join(backend, 'backend')
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        output = f.name
+    command = [sys.executable, os.path.abspath(__file__), '--json', output,
+               '--repeat', str(args.repeat), '--warmup', str(args.warmup)]
+    if args.only:
+        command += ['--only', *args.only]
+    env = {**os.environ, 'PYTHONPATH': backend}
+    subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+    with open(output) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--only', nargs='+', help='run benchmarks whose name contains any of these')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--compare', metavar='CHECKOUT', help='another checkout (its root or backend/) to compare with')
+    args = parser.parse_args()
+
+    if args.compare:
+        here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        base = run_checkout(args.compare, args)
+        head = run_checkout(here, args)
+        print_comparison(args.compare, base, 'this checkout', head)
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump({'base': base, 'head': head}, f, indent=2)
+        return
+
+    json_path = os.path.abspath(args.json) if args.json else None
+    results = run_suite(args)
+    print_results(results)
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# backend/benchmarks/prepared_statements.py
+"""Statement throughput on the hot paths, plain text protocol vs. cached prepared statements.
+
+Runs each hot statement (login lookup, item listing, claim existence check, resolve_claim's
+status updates) back to back on one connection, first through a plain cursor, then through
+Database.get_cursor(prepared=True), and reports statements/s for both. Writes are rolled back.
+Needs a seeded database (the server's own .env); run from backend/:
+
+    python -m benchmarks.prepared_statements --iterations 2000
+"""
+
+import argparse
+import time
+
+from config.db_connector import db
+from utils.resources import LISTING_QUERIES
+
+
+def hot_statements(cursor):
+    """(name, sql, params) for the hot paths, with ids taken from the current data."""
+    cursor.execute("SELECT email FROM Users ORDER BY user_id LIMIT 1")
+    email = cursor.fetchone()['email']
+    cursor.execute("SELECT claim_id, item_id, claimant_id, claim_status FROM Claims ORDER BY claim_id LIMIT 1")
+    claim = cursor.fetchone() or {'claim_id': 0, 'item_id': 0, 'claimant_id': 0, 'claim_status': 'pending'}
+    cursor.execute("SELECT item_id, status FROM Items ORDER BY item_id LIMIT 1")
+    item = cursor.fetchone() or {'item_id': 0, 'status': 'lost'}
+    return [
+        ('login lookup', "SELECT user_id, password_hash, role FROM Users WHERE email = %s", (email,)),
+        ('item listing', LISTING_QUERIES[(False, False, False)], ('lost', 'found')),
+        ('claim exists', """
+            SELECT claim_id FROM Claims
+            WHERE item_id = %s AND claimant_id = %s AND claim_status = %s
+        """, (claim['item_id'], claim['claimant_id'], 'pending')),
+        ('claim status update', "UPDATE Claims SET claim_status = %s WHERE claim_id = %s",
+         (claim['claim_status'], claim['claim_id'])),
+        ('item status update', "UPDATE Items SET status = %s WHERE item_id = %s", (item['status'], item['item_id'])),
+    ]
+
+
+def measure(prepared, sql, params, iterations):
+    cursor = db.get_cursor(dictionary=True, prepared=prepared)
+    try:
+        cursor.execute(sql, params)  # warm up: the prepared path pays its PREPARE here
+        cursor.fetchall()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            cursor.execute(sql, params)
+            cursor.fetchall()
+        elapsed = time.perf_counter() - started
+    finally:
+        cursor.close()
+        db.conn.rollback()
+    return iterations / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    cursor = db.get_cursor(dictionary=True)
+    try:
+        statements = hot_statements(cursor)
+    finally:
+        cursor.close()
+
+    print(f"{'statement':<22} {'plain/s':>10} {'prepared/s':>11} {'speedup':>8}")
+    for name, sql, params in statements:
+        plain = measure(False, sql, params, args.iterations)
+        prepared = measure(True, sql, params, args.iterations)
+        print(f"{name:<22} {plain:>10.0f} {prepared:>11.0f} {prepared / plain:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# backend/benchmarks/storage_engines.py
+"""Request latency on the embedded SQLite engine vs. MySQL over the network, on one node.
+
+Runs the Flask app in-process (test client, so no HTTP overhead) once per engine in a separate
+process, seeds the same number of items into each, and reports p50/p99 per request type.
+MySQL settings come from .env as usual; SQLite uses its own file. Run from backend/:
+
+    python -m benchmarks.storage_engines --items 5000 --requests 500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+WORKLOAD = (
+    ('list items', 'GET', '/api/items', None),
+    ('search items', 'GET', '/api/items?search=bench+7', None),
+    ('list categories', 'GET', '/api/categories', None),
+    ('item changes', 'GET', '/api/items/changes?since=0', None),
+    ('report item', 'POST', '/api/items', 'report'),
+)
+
+# The limiter would otherwise throttle a benchmark that hammers the app from one address
+UNLIMITED = {f'RATE_LIMIT_{route_class}': '1000000000,1000000000' for route_class in ('AUTH', 'SEARCH', 'WRITE', 'DEFAULT')}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed(db, items):
+    cursor = db.get_cursor()
+    try:
+        cursor.execute("SELECT COUNT(*) FROM Items")
+        existing = cursor.fetchone()[0]
+        cursor.execute("SELECT user_id FROM Users WHERE email = %s", ('bench@example.com',))
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute("INSERT INTO Users (name, email, role, password_hash) VALUES (%s, %s, %s, %s)",
+                           ('Bench User', 'bench@example.com', 'student', 'not-a-real-hash'))
+            user_id = cursor.lastrowid
+        else:
+            user_id = row[0]
+        cursor.execute("SELECT category_id FROM Categories ORDER BY category_id LIMIT 1")
+        category_id = cursor.fetchone()[0]
+        if existing < items:
+            cursor.executemany(
+                "INSERT INTO Items (reported_by, category_id, title, description, status) VALUES (%s, %s, %s, %s, %s)",
+                [(user_id, category_id, f"bench {n}", f"benchmark item number {n}", ('lost', 'found')[n % 2])
+                 for n in range(existing, items)])
+        db.conn.commit()
+        return user_id
+    finally:
+        cursor.close()
+
+
+def run_worker(args):
+    from server import app
+    from config.db_connector import db
+    from utils.security import encode_auth_token
+
+    user_id = seed(db, args.items)
+    token = encode_auth_token(user_id, 'student')
+    client = app.test_client()
+    report = {'title': 'bench report', 'description': 'written by the benchmark', 'status': 'lost', 'category_id': 1}
+    results = {}
+    for name, method, path, body in WORKLOAD:
+        kwargs = {'headers': {'Authorization': f'Bearer {token}'}}
+        if body == 'report':
+            kwargs['json'] = report
+        for _ in range(min(20, args.requests)):  # warm up caches and statement handles
+            client.open(path, method=method, **kwargs)
+        latencies = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            response = client.open(path, method=method, **kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                raise SystemExit(f"{method} {path} failed: {response.status_code} {response.get_data(as_text=True)[:200]}")
+        results[name] = {'p50': statistics.median(latencies), 'p99': percentile(latencies, 99)}
+    print(json.dumps(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--sqlite-path', default='benchmark.db')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        return run_worker(args)
+
+    results = {}
+    for engine in ('mysql', 'sqlite'):
+        env = {**os.environ, **UNLIMITED, 'DB_ENGINE': engine, 'SQLITE_PATH': args.sqlite_path, 'SLOW_QUERY_MS': '-1'}
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.storage_engines', '--worker',
+             '--items', str(args.items), '--requests', str(args.requests)],
+            env=env, capture_output=True, text=True, check=True).stdout
+        results[engine] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'request':<16} {'mysql p50':>10} {'mysql p99':>10} {'sqlite p50':>11} {'sqlite p99':>11}")
+    for name, _, _, _ in WORKLOAD:
+        mysql, sqlite = results['mysql'][name], results['sqlite'][name]
+        print(f"{name:<16} {mysql['p50']:>9.2f}ms {mysql['p99']:>9.2f}ms {sqlite['p50']:>10.2f}ms {sqlite['p99']:>10.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
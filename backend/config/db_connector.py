@@ -1,7 +1,13 @@
+import itertools
 import mysql.connector
 import os
+import threading
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
 from utils.security import hash_password
+from utils.lifecycle import register_after_fork
+from config import sqlite_engine
 
 load_dotenv()
 
@@ -13,62 +19,438 @@ db_config = {
     'database': os.getenv('MYSQL_DB')
 }
 
-# If database doesn't exist, connect without it first
-try:
-    db_config_temp = db_config.copy()
-    del db_config_temp['database']
-    temp_conn = mysql.connector.connect(**db_config_temp)
-    temp_cursor = temp_conn.cursor()
-    temp_cursor.execute("CREATE DATABASE IF NOT EXISTS back2u")
-    temp_conn.commit()
-    temp_cursor.close()
-    temp_conn.close()
-    print("✅ Database 'back2u' created successfully!")
-except mysql.connector.Error as err:
-    print(f"❌ Error creating database: {err}")
-    exit(1)
+# Storage engine: mysql (default) or sqlite (embedded file, see config/sqlite_engine.py)
+DB_ENGINE = os.getenv('DB_ENGINE', 'mysql').lower()
+
+if DB_ENGINE == 'sqlite':
+    _connect = sqlite_engine.connect
+else:
+    _connect = mysql.connector.connect
+    # If database doesn't exist, connect without it first
+    try:
+        db_config_temp = db_config.copy()
+        del db_config_temp['database']
+        temp_conn = mysql.connector.connect(**db_config_temp)
+        temp_cursor = temp_conn.cursor()
+        temp_cursor.execute("CREATE DATABASE IF NOT EXISTS back2u")
+        temp_conn.commit()
+        temp_cursor.close()
+        temp_conn.close()
+        print("✅ Database 'back2u' created successfully!")
+    except mysql.connector.Error as err:
+        print(f"❌ Error creating database: {err}")
+        exit(1)
+
+# Called as observer(statement, params, seconds, cursor) after every execute/executemany
+query_observers = []
+
+def add_query_observer(observer):
+    query_observers.append(observer)
+
+class InstrumentedCursor:
+    """Wraps a mysql.connector cursor and reports each statement and its duration to query_observers."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, statement, params=None, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(statement, params, *args, **kwargs)
+        finally:
+            self._observe(statement, params, time.perf_counter() - started)
+
+    def executemany(self, statement, seq_params, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(statement, seq_params, *args, **kwargs)
+        finally:
+            self._observe(statement, seq_params, time.perf_counter() - started)
+
+    def _observe(self, statement, params, seconds):
+        for observer in query_observers:
+            try:
+                observer(statement, params, seconds, self._cursor)
+            except Exception as e:
+                print(f"Query observer failed: {e}")
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+# Server-side prepared statements kept open per connection (MySQL caps them server-wide)
+STATEMENT_CACHE_SIZE = int(os.getenv('STATEMENT_CACHE_SIZE', 128))
+
+def normalize_sql(statement):
+    """Canonical statement text: one statement shape, one cache entry, however it was indented."""
+    return ' '.join(statement.split())
+
+class StatementCache:
+    """LRU of prepared cursors for one connection, keyed by normalized SQL.
+
+    MySQLCursorPrepared re-uses its server-side statement while it is handed the same SQL, so
+    keeping one such cursor per statement means each is parsed and planned once per connection.
+    """
+
+    def __init__(self, conn, max_size=STATEMENT_CACHE_SIZE):
+        self.conn = conn
+        self.max_size = max_size
+        self.connection_id = conn.connection_id
+        self._cursors = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sql):
+        with self._lock:
+            if self.conn.connection_id != self.connection_id:
+                # ping(reconnect=True) opened a new session; the old statement handles died with it
+                self._cursors.clear()
+                self.connection_id = self.conn.connection_id
+            cursor = self._cursors.get(sql)
+            if cursor is None:
+                cursor = self._cursors[sql] = self.conn.cursor(prepared=True)
+            self._cursors.move_to_end(sql)
+            while len(self._cursors) > self.max_size:
+                _, evicted = self._cursors.popitem(last=False)
+                evicted.close()
+            return cursor
+
+    def clear(self):
+        with self._lock:
+            for cursor in self._cursors.values():
+                cursor.close()
+            self._cursors.clear()
+
+class PreparedCursor:
+    """Cursor facade over a StatementCache with the plain cursor's interface.
+
+    Rows are read in full right after execute (like a buffered cursor) so the cached cursor and the
+    connection are free for the next statement; dictionary rows are built from column_names.
+    """
+
+    def __init__(self, statements, dictionary=False):
+        self._statements = statements
+        self._dictionary = dictionary
+        self._rows = []
+        self.rowcount = -1
+        self.lastrowid = None
+        self.column_names = ()
+        self.description = None
+
+    def execute(self, statement, params=()):
+        statement = normalize_sql(statement)
+        cursor = self._statements.get(statement)
+        cursor.execute(statement, tuple(params or ()))
+        self._collect(cursor)
+
+    def executemany(self, statement, seq_params):
+        statement = normalize_sql(statement)
+        cursor = self._statements.get(statement)
+        cursor.executemany(statement, [tuple(params) for params in seq_params])
+        self._collect(cursor)
+
+    def _collect(self, cursor):
+        self.description = cursor.description
+        self.column_names = tuple(cursor.column_names) if cursor.description else ()
+        rows = cursor.fetchall() if cursor.description else []
+        if self._dictionary:
+            rows = [dict(zip(self.column_names, row)) for row in rows]
+        self._rows = rows
+        self.rowcount = cursor.rowcount
+        self.lastrowid = cursor.lastrowid
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=1):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        # The underlying prepared cursor stays in the cache for the next request
+        self._rows = []
+
+# Idle connections kept per worker process; requests beyond this open (and then close) extra ones
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 32))
+
+# Read replicas as "host[:port],host[:port]"; same user, password and database as the primary
+MYSQL_REPLICA_HOSTS = os.getenv('MYSQL_REPLICA_HOSTS', '')
+# Replicas further behind than this are skipped and reads go to the primary
+REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', 2))
+# How long a replica's measured lag (or failure) is trusted before it is checked again
+REPLICA_CHECK_SECONDS = float(os.getenv('REPLICA_CHECK_SECONDS', 1))
+
+class ConnectionPool:
+    """Idle (connection, StatementCache) pairs for one server."""
+
+    def __init__(self, config, size=DB_POOL_SIZE):
+        self.config = config
+        self.size = size
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def open(self):
+        conn = _connect(**self.config)
+        return conn, StatementCache(conn)
+
+    def acquire(self):
+        with self._lock:
+            entry = self._idle.pop() if self._idle else None
+        return entry or self.open()
+
+    def put(self, entry):
+        """Takes a connection back, ending its transaction; closes it when the pool is full or it is broken."""
+        conn = entry[0]
+        try:
+            conn.rollback()
+        except mysql.connector.Error:
+            try:
+                conn.close()
+            except mysql.connector.Error:
+                pass  # the socket is gone either way
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(entry)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, statements in idle:
+            conn.close()
+
+class Replica:
+    """A read replica with its pool and a cached replication lag measurement."""
+
+    def __init__(self, host, port):
+        self.name = f"{host}:{port}"
+        self.pool = ConnectionPool({**db_config, 'host': host, 'port': port})
+        self.lag = None  # seconds; None when unknown, broken or not replicating
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def usable(self, max_lag):
+        if time.monotonic() - self._checked_at > REPLICA_CHECK_SECONDS and self._lock.acquire(blocking=False):
+            try:
+                self._checked_at = time.monotonic()
+                self.lag = self._measure_lag()
+            finally:
+                self._lock.release()
+        return self.lag is not None and self.lag <= max_lag
+
+    def _measure_lag(self):
+        try:
+            entry = self.pool.acquire()
+        except mysql.connector.Error as err:
+            print(f"Replica {self.name} unreachable: {err}")
+            return None
+        cursor = entry[0].cursor(dictionary=True, buffered=True)
+        try:
+            try:
+                cursor.execute("SHOW REPLICA STATUS")
+            except mysql.connector.Error:
+                cursor.execute("SHOW SLAVE STATUS")  # before MySQL 8.0.22
+            status = cursor.fetchone() or {}
+            lag = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+            return None if lag is None else float(lag)
+        except mysql.connector.Error as err:
+            print(f"Replica {self.name} status check failed: {err}")
+            return None
+        finally:
+            cursor.close()
+            self.pool.put(entry)
+
+def _parse_replicas(hosts):
+    replicas = []
+    for address in filter(None, (part.strip() for part in hosts.split(','))):
+        host, _, port = address.partition(':')
+        replicas.append(Replica(host, int(port or 3306)))
+    return replicas
 
 class Database:
-    def __init__(self):
-        self.conn = None
-        self.cursor = None
+    """Per-thread connections from small per-process pools.
+
+    A thread binds a primary connection on first use and keeps it until release(): request threads
+    give theirs back at the end of every request, long-lived threads (pollers) keep theirs. Each
+    connection carries its own StatementCache. After fork the child starts with empty pools
+    rather than sharing the parent's sockets.
+
+    get_cursor(read_only=True) reads from a replica (round-robin over those within
+    REPLICA_MAX_LAG_SECONDS) unless the thread is pinned to the primary; everything else, writes
+    and transactions included, uses the primary.
+    """
+
+    def __init__(self, pool_size=DB_POOL_SIZE, replica_hosts=MYSQL_REPLICA_HOSTS):
+        self.pool_size = pool_size
+        self.replica_hosts = replica_hosts
+        self._reset()
+
+    def _reset(self):
+        self._local = threading.local()
+        self._pool = ConnectionPool(db_config, self.pool_size)
+        # Replication is a MySQL deployment feature; an embedded SQLite file has no replicas
+        self.replicas = _parse_replicas(self.replica_hosts) if DB_ENGINE == 'mysql' else []
+        # next() on a count is atomic, so concurrent requests still take turns over the replicas
+        self._replica_turns = itertools.count()
+
+    def _bind(self):
+        self._local.entry = self._pool.acquire()
+        return self._local.entry
+
+    @property
+    def conn(self):
+        entry = getattr(self._local, 'entry', None) or self._bind()
+        return entry[0]
+
+    @property
+    def statements(self):
+        entry = getattr(self._local, 'entry', None) or self._bind()
+        return entry[1]
 
     def connect(self):
+        """Opens a fresh primary connection for the current thread (replacing any it had)."""
         try:
-            self.conn = mysql.connector.connect(**db_config)
-            self.cursor = self.conn.cursor(dictionary=True)
-            print("✅ MySQL Database connected successfully!")
+            self._local.entry = self._pool.open()
+            if DB_ENGINE == 'sqlite':
+                print(f"✅ SQLite database {sqlite_engine.SQLITE_PATH} opened successfully!")
+            else:
+                print("✅ MySQL Database connected successfully!")
         except mysql.connector.Error as err:
             print(f"❌ Error connecting to MySQL: {err}")
             exit(1)
 
-    def get_cursor(self, dictionary=False):
-        try:
-            self.conn.ping(reconnect=True)
-        except mysql.connector.Error:
-            print("Connection lost, reconnecting...")
-            self.connect()
-        return self.conn.cursor(dictionary=dictionary)
+    def pin_primary(self):
+        """Sends this thread's reads to the primary until release(), e.g. right after the client wrote."""
+        self._local.primary_only = True
 
-    def close(self):
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
+    def _replica_entry(self):
+        """The thread's bound replica connection, binding a usable one if needed; None means use the primary."""
+        if getattr(self._local, 'primary_only', False) or not self.replicas:
+            return None
+        bound = getattr(self._local, 'replica', None)
+        if bound is not None:
+            return bound[1]
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._replica_turns) % len(self.replicas)]
+            if replica.usable(REPLICA_MAX_LAG_SECONDS):
+                try:
+                    entry = replica.pool.acquire()
+                    entry[0].ping(reconnect=True)
+                except mysql.connector.Error as err:
+                    print(f"Replica {replica.name} unavailable, trying the next: {err}")
+                    replica.lag = None
+                    continue
+                self._local.replica = (replica, entry)
+                return entry
+        return None
+
+    def get_cursor(self, dictionary=False, buffered=True, prepared=False, read_only=False):
+        """Buffered by default so a statement's timing covers fetching its rows too.
+
+        prepared=True runs statements as server-side prepared statements from this connection's
+        StatementCache; use it for hot, fixed-shape statements. read_only=True may read from a replica.
+        """
+        entry = self._replica_entry() if read_only else None
+        if entry is None:
+            try:
+                self.conn.ping(reconnect=True)
+            except mysql.connector.Error:
+                print("Connection lost, reconnecting...")
+                self.connect()
+            entry = self._local.entry
+        conn, statements = entry
+        if prepared:
+            return InstrumentedCursor(PreparedCursor(statements, dictionary=dictionary))
+        return InstrumentedCursor(conn.cursor(dictionary=dictionary, buffered=buffered))
+
+    def release(self, exc=None):
+        """Returns the current thread's connections to their pools; registered as a request teardown.
+
+        The rollback ends any open read snapshot, so the next user starts from current data.
+        """
+        self._local.primary_only = False
+        replica = getattr(self._local, 'replica', None)
+        if replica is not None:
+            self._local.replica = None
+            replica[0].pool.put(replica[1])
+        entry = getattr(self._local, 'entry', None)
+        if entry is not None:
+            self._local.entry = None
+            self._pool.put(entry)
+
+    def discard(self):
+        """Closes the current thread's connections instead of pooling them.
+
+        For a streamed result abandoned part way: giving the connection back would roll it back,
+        and the rollback first reads every remaining row of the result.
+        """
+        self._local.primary_only = False
+        for entry in (getattr(self._local, 'entry', None), (getattr(self._local, 'replica', None) or (None, None))[1]):
+            if entry is not None:
+                try:
+                    entry[0].close()
+                except mysql.connector.Error:
+                    pass
+        self._local.entry = None
+        self._local.replica = None
+
+    def reset_after_fork(self):
+        # The parent's sockets are not ours to close (that would end the parent's sessions); drop them
+        self._reset()
 
     def close(self):
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
+        self.release()
+        self._pool.close()
+        for replica in self.replicas:
+            replica.pool.close()
 
 db = Database()
 db.connect()
+register_after_fork(db.reset_after_fork)
 
 def create_tables_and_seed():
     cursor = db.get_cursor()
-    item_ids = []
-    
+    if DB_ENGINE == 'sqlite':
+        sqlite_engine.create_schema(db.conn)
+        print("✅ SQLite schema and trigger checked/created.")
+    else:
+        _create_mysql_tables(cursor)
+
+    # Seed categories if empty
+    cursor.execute("SELECT COUNT(*) FROM Categories")
+    count = cursor.fetchone()[0]
+    print(f"Categories table has {count} entries.")
+    if count == 0:
+        categories = ['Electronics', 'Clothing', 'Books', 'Accessories', 'Other']
+        print(f"🌱 Seeding {len(categories)} default categories...")
+        for cat in categories:
+            try:
+                cursor.execute("INSERT INTO Categories (name) VALUES (%s)", (cat,))
+                print(f"✅ Inserted category: {cat}")
+            except mysql.connector.Error as err:
+                print(f"❌ Failed to insert category '{cat}': {err}")
+                # Continue with other categories even if one fails
+        print("Category seeding completed.")
+    else:
+        print("✅ Categories already seeded.")
+
+    # Only ensure tables exist; do not insert any sample data
+    db.conn.commit()
+    cursor.close()
+    print("✅ Database tables checked/created successfully.")
+
+
+def _create_mysql_tables(cursor):
     # --- 1. Users Table ---
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS Users (
@@ -126,7 +508,40 @@ def create_tables_and_seed():
             type ENUM('email', 'system') NOT NULL,
             status ENUM('sent', 'pending', 'read') NOT NULL DEFAULT 'pending',
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES Users(user_id)
+            FOREIGN KEY (user_id) REFERENCES Users(user_id),
+            INDEX idx_notifications_user_status_created (user_id, status, created_at),
+            INDEX idx_notifications_user_id (user_id, notification_id)
+        )
+    """)
+    # Tables created before the inbox API lack the indexes; 1061 = it already exists
+    for index in ("idx_notifications_user_status_created ON Notifications (user_id, status, created_at)",
+                  # The inbox's keyset pages: ORDER BY notification_id within one user
+                  "idx_notifications_user_id ON Notifications (user_id, notification_id)"):
+        try:
+            cursor.execute(f"CREATE INDEX {index}")
+        except mysql.connector.Error as err:
+            if err.errno != 1061:
+                print(f"❌ Failed to create notifications index: {err}")
+    
+    # --- 6. Changes Table (change log; change_id is the version clients sync from) ---
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS Changes (
+            change_id BIGINT PRIMARY KEY AUTO_INCREMENT,
+            entity ENUM('item', 'claim', 'category') NOT NULL,
+            entity_id INT NOT NULL,
+            action ENUM('created', 'updated', 'deleted') NOT NULL,
+            changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # --- 7. RevokedTokens Table (JWT denylist; rows are useless after expires_at) ---
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS RevokedTokens (
+            jti VARCHAR(64) PRIMARY KEY,
+            user_id INT,
+            expires_at DATETIME NOT NULL,
+            revoked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_revoked_tokens_expires (expires_at)
         )
     """)
     
@@ -146,26 +561,3 @@ def create_tables_and_seed():
         print("✅ Trigger 'update_item_status_on_claim_approval' created successfully.")
     except mysql.connector.Error as err:
         print(f"❌ Failed to create trigger: {err}")
-    
-    # Seed categories if empty
-    cursor.execute("SELECT COUNT(*) FROM Categories")
-    count = cursor.fetchone()[0]
-    print(f"Categories table has {count} entries.")
-    if count == 0:
-        categories = ['Electronics', 'Clothing', 'Books', 'Accessories', 'Other']
-        print(f"🌱 Seeding {len(categories)} default categories...")
-        for cat in categories:
-            try:
-                cursor.execute("INSERT INTO Categories (name) VALUES (%s)", (cat,))
-                print(f"✅ Inserted category: {cat}")
-            except mysql.connector.Error as err:
-                print(f"❌ Failed to insert category '{cat}': {err}")
-                # Continue with other categories even if one fails
-        print("Category seeding completed.")
-    else:
-        print("✅ Categories already seeded.")
-
-    # Only ensure tables exist; do not insert any sample data
-    db.conn.commit()
-    cursor.close()
-    print("✅ Database tables checked/created successfully.")
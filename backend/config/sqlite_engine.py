@@ -0,0 +1,235 @@
+# backend/config/sqlite_engine.py
+# Embedded SQLite storage (DB_ENGINE=sqlite) for single-node deployments and tests.
+#
+# Connections and cursors mimic the parts of mysql.connector the app uses, so blueprints run
+# unchanged: %s placeholders, dictionary rows, lastrowid/rowcount, DATETIME columns as datetime,
+# and sqlite3 errors re-raised as mysql.connector errors with the matching MySQL errno.
+
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+import mysql.connector
+
+SQLITE_PATH = os.getenv('SQLITE_PATH', 'back2u.db')
+
+# WAL lets readers run alongside the single writer; NORMAL sync is durable across app crashes
+# (an OS crash may lose the last transactions), which suits a single-node install.
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA cache_size = -65536",      # 64 MB page cache per connection
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",    # 256 MB
+)
+
+# Same tables as the MySQL schema. ENUM columns become CHECK constraints; AUTO_INCREMENT becomes
+# INTEGER PRIMARY KEY AUTOINCREMENT so ids are never reused, as in InnoDB.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS Users (
+    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL COLLATE NOCASE,
+    role TEXT NOT NULL DEFAULT 'student' CHECK (role IN ('student', 'faculty', 'admin')),
+    password_hash VARCHAR(255) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS Categories (
+    category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(50) UNIQUE NOT NULL COLLATE NOCASE
+);
+
+CREATE TABLE IF NOT EXISTS Items (
+    item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    reported_by INT NOT NULL REFERENCES Users(user_id),
+    category_id INT NOT NULL REFERENCES Categories(category_id),
+    title VARCHAR(100) NOT NULL,
+    description TEXT,
+    status TEXT NOT NULL CHECK (status IN ('lost', 'found', 'claim_pending', 'resolved')),
+    date_reported DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS Claims (
+    claim_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id INT NOT NULL REFERENCES Items(item_id),
+    claimant_id INT NOT NULL REFERENCES Users(user_id),
+    claim_status TEXT NOT NULL DEFAULT 'pending' CHECK (claim_status IN ('pending', 'approved', 'rejected')),
+    verification_details TEXT,
+    claimed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS Notifications (
+    notification_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NOT NULL REFERENCES Users(user_id),
+    message TEXT NOT NULL,
+    type TEXT NOT NULL CHECK (type IN ('email', 'system')),
+    status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('sent', 'pending', 'read')),
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_user_status_created ON Notifications (user_id, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_notifications_user_id ON Notifications (user_id, notification_id);
+
+CREATE TABLE IF NOT EXISTS Changes (
+    change_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL CHECK (entity IN ('item', 'claim', 'category')),
+    entity_id INT NOT NULL,
+    action TEXT NOT NULL CHECK (action IN ('created', 'updated', 'deleted')),
+    changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS RevokedTokens (
+    jti VARCHAR(64) PRIMARY KEY,
+    user_id INT,
+    expires_at DATETIME NOT NULL,
+    revoked_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires ON RevokedTokens (expires_at);
+
+-- Same status transition as the MySQL trigger: approving a claim resolves its item
+CREATE TRIGGER IF NOT EXISTS update_item_status_on_claim_approval
+AFTER UPDATE OF claim_status ON Claims
+FOR EACH ROW WHEN NEW.claim_status = 'approved'
+BEGIN
+    UPDATE Items SET status = 'resolved' WHERE item_id = NEW.item_id;
+END;
+"""
+
+# DATETIME columns come back as datetime objects, as from mysql.connector
+sqlite3.register_converter('DATETIME', lambda value: datetime.fromisoformat(value.decode('utf-8')))
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' ', timespec='seconds'))
+
+_PLACEHOLDER = re.compile(r'%s|%%')
+_INSERT_IGNORE = re.compile(r'^\s*INSERT\s+IGNORE\b', re.IGNORECASE)
+_INSERT = re.compile(r'^\s*INSERT\b', re.IGNORECASE)
+
+
+def translate(statement):
+    """MySQL-flavoured SQL as used by the app -> SQLite."""
+    statement = _PLACEHOLDER.sub(lambda match: '?' if match.group() == '%s' else '%', statement)
+    return _INSERT_IGNORE.sub('INSERT OR IGNORE', statement)
+
+def _mysql_error(err):
+    """Re-raises sqlite3 errors as the mysql.connector error the callers already handle."""
+    message = str(err)
+    if isinstance(err, sqlite3.IntegrityError):
+        if message.startswith('UNIQUE'):
+            errno = 1062   # ER_DUP_ENTRY
+        elif message.startswith('FOREIGN KEY'):
+            errno = 1452   # ER_NO_REFERENCED_ROW_2
+        elif message.startswith('NOT NULL'):
+            errno = 1048   # ER_BAD_NULL_ERROR
+        else:
+            errno = 1265   # CHECK on a former ENUM: "Data truncated", as MySQL strict mode reports
+        return mysql.connector.errors.IntegrityError(msg=message, errno=errno)
+    if isinstance(err, sqlite3.OperationalError) and 'locked' in message:
+        return mysql.connector.errors.DatabaseError(msg=message, errno=1205)  # ER_LOCK_WAIT_TIMEOUT
+    return mysql.connector.errors.DatabaseError(msg=message)
+
+
+class SQLiteCursor:
+    def __init__(self, conn, dictionary=False, buffered=True):
+        self._cursor = conn.cursor()
+        self._dictionary = dictionary
+        self._buffered = buffered
+        self._rows = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self.column_names = ()
+        self.description = None
+
+    def execute(self, statement, params=None, multi=False):
+        try:
+            self._cursor.execute(translate(statement), tuple(params or ()))
+        except sqlite3.Error as err:
+            raise _mysql_error(err) from err
+        self._after_execute()
+
+    def executemany(self, statement, seq_params):
+        try:
+            self._cursor.executemany(translate(statement), [tuple(params) for params in seq_params])
+        except sqlite3.Error as err:
+            raise _mysql_error(err) from err
+        self._after_execute()
+        if self.rowcount > 0 and _INSERT.match(statement):
+            # mysql.connector reports the first id of a multi-row INSERT; the rows of one batch
+            # get consecutive ids because the connection holds the write lock throughout
+            self.lastrowid = self._cursor.execute("SELECT last_insert_rowid()").fetchone()[0] - self.rowcount + 1
+
+    def _after_execute(self):
+        self.description = self._cursor.description
+        self.column_names = tuple(column[0] for column in self.description) if self.description else ()
+        self.lastrowid = self._cursor.lastrowid
+        self.rowcount = self._cursor.rowcount
+        self._rows = None
+        if self.description and self._buffered:
+            # Like a buffered MySQL cursor: rows read up front and rowcount is the row count
+            self._rows = [self._shape(row) for row in self._cursor.fetchall()]
+            self.rowcount = len(self._rows)
+
+    def _shape(self, row):
+        return dict(zip(self.column_names, row)) if self._dictionary else row
+
+    def fetchone(self):
+        if self._rows is not None:
+            return self._rows.pop(0) if self._rows else None
+        row = self._cursor.fetchone()
+        return None if row is None else self._shape(row)
+
+    def fetchmany(self, size=1):
+        if self._rows is not None:
+            rows, self._rows = self._rows[:size], self._rows[size:]
+            return rows
+        return [self._shape(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        if self._rows is not None:
+            rows, self._rows = self._rows, []
+            return rows
+        return [self._shape(row) for row in self._cursor.fetchall()]
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """The mysql.connector connection interface over one sqlite3 connection."""
+
+    def __init__(self, path=SQLITE_PATH):
+        # Pools hand connections between threads (never to two at once), hence check_same_thread=False.
+        # IMMEDIATE takes the write lock when a transaction starts, so two writers queue on
+        # busy_timeout instead of failing on a deadlocked lock upgrade.
+        self._conn = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False,
+                                     isolation_level='IMMEDIATE', cached_statements=256)
+        for pragma in PRAGMAS:
+            self._conn.execute(pragma)
+        self.connection_id = id(self._conn)
+
+    def cursor(self, dictionary=False, buffered=True, prepared=False):
+        # sqlite3 already caches compiled statements per connection, so prepared is a plain cursor
+        return SQLiteCursor(self._conn, dictionary=dictionary, buffered=buffered)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def ping(self, reconnect=False):
+        pass  # nothing to lose: the database is a local file
+
+    def close(self):
+        self._conn.close()
+
+
+def connect(**config):
+    return SQLiteConnection(SQLITE_PATH)
+
+def create_schema(conn):
+    conn._conn.executescript(SCHEMA)
+    conn.commit()
@@ -4,4 +4,5 @@ from .user_model import User
 from .category_model import Category
 from .item_model import Item
 from .claim_model import Claim
-from .notification_model import Notification
\ No newline at end of file
+from .notification_model import Notification
+from .change_model import Change
\ No newline at end of file
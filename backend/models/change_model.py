@@ -0,0 +1,17 @@
+# backend/models/change_model.py
+
+class Change:
+    TABLE_NAME = "Changes"
+
+    # Entities and actions defined in the ENUMs
+    ENTITIES = {
+        'ITEM': 'item',
+        'CLAIM': 'claim',
+        'CATEGORY': 'category',
+    }
+
+    ACTIONS = {
+        'CREATED': 'created',
+        'UPDATED': 'updated',
+        'DELETED': 'deleted',
+    }
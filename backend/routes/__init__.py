@@ -5,3 +5,5 @@ from .auth_routes import auth_bp
 from .item_routes import item_bp
 from .admin_routes import admin_bp
 from .category_routes import category_bp
+from .event_routes import event_bp
+from .notification_routes import notification_bp
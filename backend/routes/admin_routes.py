@@ -1,42 +1,169 @@
 # backend/routes/admin_routes.py
 
 import mysql.connector
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from config.db_connector import db
 from utils.security import admin_required
 from utils.notification import send_claim_resolved_emails
+from utils.events import notify_change
+from utils.changes import record_change, record_changes, current_version, changes_since
+from utils.resources import CLAIM_LISTING_QUERY, fetch_claim, fetch_item, in_list
+from utils.rate_limit import admission
+from utils.metrics import metrics, render_admission
+from utils.export import EXPORTS, FORMATS, parse_date, stream_rows
+from utils.item_import import ItemImporter, read_rows
 from models.item_model import Item
 from models.claim_model import Claim
+from models.change_model import Change
 
 admin_bp = Blueprint('admin_bp', __name__)
 
+# Complex query to fetch claim details along with item titles and user emails
+PENDING_CLAIMS_QUERY = CLAIM_LISTING_QUERY + " WHERE c.claim_status = 'pending'"
+
 @admin_bp.route('/claims/pending', methods=['GET'])
 @admin_required
 def get_pending_claims():
     """Admin dashboard view: lists all pending claims."""
     try:
-        cursor = db.get_cursor(dictionary=True)
-
-        # Complex query to fetch claim details along with item titles and user emails
-        query = """
-            SELECT
-                c.claim_id, c.claimed_at, c.verification_details,
-                i.item_id, i.title AS item_title, i.status AS item_status, i.reported_by,
-                u_claim.name AS claimant_name, u_claim.email AS claimant_email
-            FROM Claims c
-            JOIN Items i ON c.item_id = i.item_id
-            JOIN Users u_claim ON c.claimant_id = u_claim.user_id
-            WHERE c.claim_status = 'pending'
-        """
-        cursor.execute(query)
+        cursor = db.get_cursor(dictionary=True, read_only=True)
+        # Read the version first so anything committed during the listing shows up in the next delta;
+        # it stops below changes that may still be uncommitted (utils.changes), so none is skipped
+        version = current_version(cursor)
+        cursor.execute(PENDING_CLAIMS_QUERY)
         claims = cursor.fetchall()
         cursor.close()
-        return jsonify(claims)
+        response = jsonify(claims)
+        response.headers['X-Change-Version'] = str(version)
+        return response
     except Exception as err:
         return jsonify({"error": f"Database error: {err}"}), 500
     except Exception as e:
         return jsonify({"error": f"An unexpected error occurred: {str(e)}"}), 500
 
+@admin_bp.route('/changes', methods=['GET'])
+@admin_required
+def get_admin_changes():
+    """Delta for the admin dashboard: pending claims and categories changed since a version.
+
+    Rows that changed but no longer qualify (resolved claims, deleted categories) are listed by id
+    under removed_* so the client can drop them from its tables.
+    """
+    since = request.args.get('since', type=int)
+    if since is None or since < 0:
+        return jsonify({"error": "Query parameter 'since' must be a non-negative integer."}), 400
+
+    cursor = db.get_cursor(dictionary=True)
+    try:
+        version, changed, has_more = changes_since(
+            cursor, since, [Change.ENTITIES['CLAIM'], Change.ENTITIES['CATEGORY']])
+
+        claim_ids = list(changed[Change.ENTITIES['CLAIM']])
+        claims = []
+        if claim_ids:
+            placeholders, params = in_list(claim_ids)
+            cursor.execute(PENDING_CLAIMS_QUERY + f" AND c.claim_id IN ({placeholders})", params)
+            claims = cursor.fetchall()
+        pending_ids = {claim['claim_id'] for claim in claims}
+
+        category_ids = list(changed[Change.ENTITIES['CATEGORY']])
+        categories = []
+        if category_ids:
+            placeholders, params = in_list(category_ids)
+            cursor.execute(f"SELECT category_id, name FROM Categories WHERE category_id IN ({placeholders})", params)
+            categories = cursor.fetchall()
+        existing_category_ids = {category['category_id'] for category in categories}
+
+        return jsonify({
+            "version": version,
+            "has_more": has_more,
+            "claims": claims,
+            "removed_claims": [cid for cid in claim_ids if cid not in pending_ids],
+            "categories": categories,
+            "removed_categories": [cid for cid in category_ids if cid not in existing_category_ids],
+        }), 200
+    except Exception as err:
+        return jsonify({"error": f"Database error: {err}"}), 500
+    finally:
+        cursor.close()
+
+@admin_bp.route('/rate-limits', methods=['GET'])
+@admin_required
+def get_rate_limit_metrics():
+    """Admitted, shed (503) and rate-limited (429, per route class) counts for this worker."""
+    return jsonify(admission.snapshot()), 200
+
+@admin_bp.route('/metrics', methods=['GET'])
+@admin_required
+def get_metrics():
+    """Prometheus text for this worker: per-route latency, DB queries and time, response sizes, admission."""
+    body = metrics.render(extra=render_admission(admission.snapshot()))
+    return Response(body, mimetype='text/plain; version=0.0.4')
+
+@admin_bp.route('/export/<entity>', methods=['GET'])
+@admin_required
+def export_rows(entity):
+    """Streams items, claims or notifications as NDJSON (default) or CSV (?format=csv).
+
+    Filters: from / to (ISO dates, to exclusive), status, category_id (items and claims).
+    Rows come in primary key order; ?after=<key> resumes an interrupted export after that row.
+    """
+    export = EXPORTS.get(entity)
+    if export is None:
+        return jsonify({"error": f"Unknown export '{entity}'. Use one of: {', '.join(EXPORTS)}."}), 404
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in FORMATS:
+        return jsonify({"error": "format must be 'ndjson' or 'csv'."}), 400
+    try:
+        date_from = parse_date(request.args.get('from'))
+        date_to = parse_date(request.args.get('to'))
+    except ValueError:
+        return jsonify({"error": "from and to must be ISO 8601 dates, e.g. 2024-05-01."}), 400
+    status = request.args.get('status') or None
+    if status is not None and status not in export.statuses:
+        return jsonify({"error": f"status must be one of: {', '.join(sorted(export.statuses))}."}), 400
+    after = request.args.get('after', 0, type=int)
+    category_id = request.args.get('category_id', type=int)
+    if category_id is not None and export.category_column is None:
+        return jsonify({"error": f"{entity} cannot be filtered by category."}), 400
+
+    # Unbuffered: rows are pulled from the server as they are written out, never all held at once
+    cursor = db.get_cursor(dictionary=True, buffered=False, read_only=True)
+    try:
+        cursor.execute(*export.build(after, date_from, date_to, status, category_id))
+    except Exception as err:
+        cursor.close()
+        return jsonify({"error": f"Database error: {err}"}), 500
+    return Response(
+        stream_with_context(stream_rows(cursor, fmt)),
+        mimetype=FORMATS[fmt],
+        headers={'Content-Disposition': f'attachment; filename="{entity}.{fmt}"', 'X-Accel-Buffering': 'no'},
+    )
+
+@admin_bp.route('/items/import', methods=['POST'])
+@admin_required
+def import_items():
+    """Bulk-creates items from a CSV (Content-Type: text/csv) or NDJSON request body.
+
+    The body is read as it arrives and committed in batches; the response counts imported and
+    failed rows and lists the failures by row number. Rows that fail validation are skipped.
+    """
+    fmt = request.args.get('format') or {'text/csv': 'csv', 'application/x-ndjson': 'ndjson',
+                                         'application/jsonl': 'ndjson'}.get(request.mimetype)
+    if fmt not in ('csv', 'ndjson'):
+        return jsonify({"error": "Send the file as the request body with Content-Type text/csv or "
+                                 "application/x-ndjson (or ?format=csv|ndjson)."}), 415
+
+    cursor = db.get_cursor()
+    try:
+        report = ItemImporter(cursor, request.user_id).run(read_rows(request.stream, fmt))
+        return jsonify(report), 200
+    except mysql.connector.Error as err:
+        db.conn.rollback()
+        return jsonify({"error": f"Database error: {err}"}), 500
+    finally:
+        cursor.close()
+
 @admin_bp.route('/claims/resolve', methods=['POST'])
 @admin_required
 def resolve_claim():
@@ -49,7 +176,7 @@ def resolve_claim():
     if not claim_id or resolution_type not in ['approve', 'reject']:
         return jsonify({"error": "Missing claim ID or invalid resolution type."}), 400
 
-    cursor = db.get_cursor(dictionary=True)
+    cursor = db.get_cursor(dictionary=True, prepared=True)
 
     try:
         if resolution_type == 'approve':
@@ -68,22 +195,39 @@ def resolve_claim():
 
             cursor.execute("UPDATE Items SET status = %s WHERE item_id = %s",
                            (Item.STATUSES['RESOLVED'], item_id))
+            record_change(cursor, Change.ENTITIES['CLAIM'], claim_id, Change.ACTIONS['UPDATED'])
+            version = record_change(cursor, Change.ENTITIES['ITEM'], item_id, Change.ACTIONS['UPDATED'])
+
+            claim = fetch_claim(cursor, claim_id)
+            item = fetch_item(cursor, item_id)
+            db.conn.commit()
+            notify_change()
 
-            # 3. Fetch item reporter and send notification emails (utility function)
+            # 3. Fetch item reporter and send notification emails (utility function). After the
+            # commit: SMTP is slow, and the change ids above stay invisible gaps until it is done
             try:
                 send_claim_resolved_emails(item_id, claimant_id, admin_id)
             except Exception as e:
                 print(f"Warning: Failed to send notification emails: {e}")
                 # Continue with approval even if email fails
 
-            db.conn.commit()
-            return jsonify({"message": "Claim approved and resolved successfully. Notifications sent."}), 200
+            return jsonify({"message": "Claim approved and resolved successfully. Notifications sent.",
+                            "claim": claim, "item": item, "version": version}), 200
 
         elif resolution_type == 'reject':
             cursor.execute("UPDATE Claims SET claim_status = %s WHERE claim_id = %s",
                            (Claim.STATUSES['REJECTED'], claim_id))
+            cursor.execute("SELECT item_id FROM Claims WHERE claim_id = %s", (claim_id,))
+            claim_info = cursor.fetchone()
+            if not claim_info:
+                db.conn.rollback()
+                return jsonify({"error": "Claim not found."}), 404
+            version = record_change(cursor, Change.ENTITIES['CLAIM'], claim_id, Change.ACTIONS['UPDATED'])
+            claim = fetch_claim(cursor, claim_id)
+            item = fetch_item(cursor, claim_info['item_id'])
             db.conn.commit()
-            return jsonify({"message": "Claim rejected."}), 200
+            notify_change()
+            return jsonify({"message": "Claim rejected.", "claim": claim, "item": item, "version": version}), 200
 
     except Exception as err:
         db.conn.rollback()
@@ -120,8 +264,11 @@ def admin_create_category():
     cursor = db.get_cursor()
     try:
         cursor.execute("INSERT INTO Categories (name) VALUES (%s)", (name,))
+        category_id = cursor.lastrowid
+        record_change(cursor, Change.ENTITIES['CATEGORY'], category_id, Change.ACTIONS['CREATED'])
         db.conn.commit()
-        return jsonify({'message': 'Category created', 'category_id': cursor.lastrowid}), 201
+        notify_change()
+        return jsonify({'message': 'Category created', 'category_id': category_id}), 201
     except Exception as err:
         db.conn.rollback()
         return jsonify({'error': f'Database error: {err}'}), 400
@@ -142,7 +289,9 @@ def admin_update_category(category_id: int):
         if cursor.rowcount == 0:
             db.conn.rollback()
             return jsonify({'error': 'Category not found.'}), 404
+        record_change(cursor, Change.ENTITIES['CATEGORY'], category_id, Change.ACTIONS['UPDATED'])
         db.conn.commit()
+        notify_change()
         return jsonify({'message': 'Category updated'}), 200
     except Exception as err:
         db.conn.rollback()
@@ -165,10 +314,14 @@ def admin_delete_category(category_id: int):
             item_ids = [item[0] for item in items]
             # 2. Delete Claims associated with these items
             format_strings = ',' .join(['%s'] * len(item_ids))
+            cursor.execute(f"SELECT claim_id FROM Claims WHERE item_id IN ({format_strings})", tuple(item_ids))
+            claim_ids = [row[0] for row in cursor.fetchall()]
             cursor.execute(f"DELETE FROM Claims WHERE item_id IN ({format_strings})", tuple(item_ids))
             
             # 3. Delete Items in this category
             cursor.execute("DELETE FROM Items WHERE category_id = %s", (category_id,))
+            record_changes(cursor, Change.ENTITIES['CLAIM'], claim_ids, Change.ACTIONS['DELETED'])
+            record_changes(cursor, Change.ENTITIES['ITEM'], item_ids, Change.ACTIONS['DELETED'])
 
         # 4. Delete the Category
         cursor.execute("DELETE FROM Categories WHERE category_id = %s", (category_id,))
@@ -176,7 +329,9 @@ def admin_delete_category(category_id: int):
         if cursor.rowcount == 0:
             db.conn.rollback()
             return jsonify({'error': 'Category not found.'}), 404
+        record_change(cursor, Change.ENTITIES['CATEGORY'], category_id, Change.ACTIONS['DELETED'])
         db.conn.commit()
+        notify_change()
         return jsonify({'message': 'Category and all associated items deleted successfully.'}), 200
     except mysql.connector.Error as err:
         db.conn.rollback()
@@ -3,7 +3,8 @@ import os
 import mysql.connector
 from flask import Blueprint, request, jsonify
 from config.db_connector import db
-from utils.security import hash_password, verify_password, encode_auth_token
+from utils.security import (hash_password, verify_password, needs_rehash, encode_auth_token, token_required,
+                            revoke_token, PasswordPoolSaturated, password_pool_busy_response)
 
 auth_bp = Blueprint('auth_bp', __name__)
 
@@ -14,7 +15,10 @@ def signup():
     if not all([name, email, password]):
         return jsonify({"error": "Missing fields"}), 400
 
-    password_hash = hash_password(password)
+    try:
+        password_hash = hash_password(password)
+    except PasswordPoolSaturated as e:
+        return password_pool_busy_response(e)
     cursor = db.get_cursor()
 
     try:
@@ -31,13 +35,46 @@ def signup():
 def login():
     data = request.json
     email, password = data.get('email'), data.get('password')
-    cursor = db.get_cursor(dictionary=True)
+    cursor = db.get_cursor(dictionary=True, prepared=True)
     cursor.execute("SELECT user_id, password_hash, role FROM Users WHERE email = %s", (email,))
     user = cursor.fetchone()
     cursor.close()
 
-    if user and verify_password(password, user['password_hash']):
+    try:
+        valid = bool(user) and verify_password(password, user['password_hash'])
+    except PasswordPoolSaturated as e:
+        return password_pool_busy_response(e)
+
+    if valid:
+        if needs_rehash(user['password_hash']):
+            _rehash_password(user['user_id'], password)
         token = encode_auth_token(user['user_id'], user['role'])
         return jsonify({"message": "Login successful", "token": token, "role": user['role'], "user_id": user['user_id']}), 200
 
     return jsonify({"error": "Invalid email or password"}), 401
+
+def _rehash_password(user_id, password):
+    """Upgrades a hash made at an old BCRYPT_ROUNDS; skipped (until the next login) if the pool is busy."""
+    try:
+        new_hash = hash_password(password)
+    except PasswordPoolSaturated:
+        return
+    cursor = db.get_cursor()
+    try:
+        cursor.execute("UPDATE Users SET password_hash = %s WHERE user_id = %s", (new_hash, user_id))
+        db.conn.commit()
+    except mysql.connector.Error as err:
+        db.conn.rollback()
+        print(f"Warning: Failed to rehash password for user {user_id}: {err}")
+    finally:
+        cursor.close()
+
+@auth_bp.route('/logout', methods=['POST'])
+@token_required
+def logout():
+    """Revokes the presented token for the rest of its lifetime."""
+    try:
+        revoke_token(request.token_claims)
+    except mysql.connector.Error as err:
+        return jsonify({"error": f"Could not revoke token. {err}"}), 500
+    return jsonify({"message": "Logged out"}), 200
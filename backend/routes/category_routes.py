@@ -1,18 +1,26 @@
 # backend/routes/category_routes.py
 
+import mysql.connector
 from flask import Blueprint, jsonify, request
 from config.db_connector import db
 from utils.security import admin_required
+from utils.events import notify_change
+from utils.changes import record_change
+from utils.resources import CATEGORY_LISTING_QUERY
+from models.change_model import Change
 
 category_bp = Blueprint('category_bp', __name__)
 
 @category_bp.route('', methods=['GET'])
 def list_categories():
-    cursor = db.get_cursor(dictionary=True)
-    cursor.execute("SELECT category_id, name FROM Categories ORDER BY name ASC")
+    cursor = db.get_cursor(dictionary=True, read_only=True)
+    cursor.execute(CATEGORY_LISTING_QUERY)
     categories = cursor.fetchall()
     cursor.close()
-    return jsonify(categories), 200
+    # ETag lets clients revalidate their cached copy with If-None-Match and get a 304
+    response = jsonify(categories)
+    response.add_etag()
+    return response.make_conditional(request)
 
 @category_bp.route('', methods=['POST'])
 @admin_required
@@ -24,8 +32,11 @@ def create_category():
     cursor = db.get_cursor()
     try:
         cursor.execute("INSERT INTO Categories (name) VALUES (%s)", (name,))
+        category_id = cursor.lastrowid
+        record_change(cursor, Change.ENTITIES['CATEGORY'], category_id, Change.ACTIONS['CREATED'])
         db.conn.commit()
-        return jsonify({'message': 'Category created', 'category_id': cursor.lastrowid}), 201
+        notify_change()
+        return jsonify({'message': 'Category created', 'category_id': category_id}), 201
     except mysql.connector.Error as err:
         db.conn.rollback()
         if err.errno == 1062:  # Duplicate entry error
@@ -0,0 +1,54 @@
+# backend/routes/event_routes.py
+
+from flask import Blueprint, Response, request, json, stream_with_context
+from utils.events import broadcaster
+from utils.lifecycle import lifecycle
+
+event_bp = Blueprint('event_bp', __name__)
+
+# Comment line sent when idle so proxies and clients don't time the connection out
+KEEPALIVE_INTERVAL = 15
+
+@event_bp.route('', methods=['GET'])
+def stream_events():
+    """Server-Sent Events stream of item, claim and category changes.
+
+    Event ids are change log versions: reconnecting with a Last-Event-ID header (or ?last_event_id=)
+    resumes from that event. Changes that commit out of change_id order can make a resumed stream
+    repeat a few events, never skip one. Without an id the stream starts from now. The stream
+    ends when the worker shuts down; the client reconnects to another one.
+    """
+    last_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_id = int(last_id) if last_id is not None else None
+    except ValueError:
+        return Response("Invalid Last-Event-ID", status=400)
+
+    broadcaster.start()
+    if last_id is None:
+        last_id = broadcaster.resume_id
+
+    def generate(resume):
+        yield "retry: 3000\n\n"
+        seq = broadcaster.seq
+        events = broadcaster.replay(resume)  # may repeat events that follow: clients apply idempotently
+        while not lifecycle.streams_closed:
+            for event in events:
+                resume = event['resume']
+                yield f"id: {resume}\nevent: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+                seq = event.get('seq', seq)
+            events = broadcaster.events_after(seq, timeout=KEEPALIVE_INTERVAL)
+            if lifecycle.streams_closed:
+                return
+            if events is None:
+                # Fell behind the in-memory backlog: catch up from the change log
+                seq = broadcaster.seq
+                events = broadcaster.replay(resume)
+            elif not events:
+                yield ": keepalive\n\n"
+
+    return Response(
+        stream_with_context(generate(last_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
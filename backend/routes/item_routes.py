@@ -4,6 +4,14 @@ import mysql.connector
 from flask import Blueprint, request, jsonify
 from config.db_connector import db
 from utils.security import token_required
+from utils.events import notify_change
+from utils.changes import record_change, record_changes, current_version, changes_since
+from utils.resources import listing_query, fetch_item, fetch_items, fetch_claim, in_list
+from utils.item_indexes import item_indexes
+from utils.matching import find_matches
+from utils.duplicates import find_duplicates
+from models.change_model import Change
+from models.item_model import Item
 
 item_bp = Blueprint('item_bp', __name__)
 
@@ -20,15 +28,23 @@ def report_item():
     if not all([user_id, title, status, category_id]):
         return jsonify({"error": "Missing essential item details."}), 400
 
-    cursor = db.get_cursor()
+    cursor = db.get_cursor(dictionary=True)
     try:
         query = """
             INSERT INTO Items (reported_by, category_id, title, description, status)
             VALUES (%s, %s, %s, %s, %s)
         """
         cursor.execute(query, (user_id, category_id, title, description, status))
+        item_id = cursor.lastrowid
+        version = record_change(cursor, Change.ENTITIES['ITEM'], item_id, Change.ACTIONS['CREATED'])
+        item = fetch_item(cursor, item_id)
+        # Open reports of the same thing, so the reporter can merge theirs into one (POST /<id>/merge)
+        duplicates = with_scores(cursor, find_duplicates(item), 'duplicate', ('similarity',))
         db.conn.commit()
-        return jsonify({"message": "Item reported successfully!", "id": cursor.lastrowid}), 201
+        notify_change()
+        item_indexes.add_item(item)
+        return jsonify({"message": "Item reported successfully!", "id": item_id, "item": item, "version": version,
+                        "duplicates": duplicates}), 201
     except mysql.connector.Error as err:
         return jsonify({"error": f"Could not submit report. {err}"}), 500
     finally:
@@ -44,14 +60,14 @@ def claim_item(item_id):
     if not verification_details:
         return jsonify({"error": "Verification details are required."}), 400
 
-    cursor = db.get_cursor()
+    cursor = db.get_cursor(dictionary=True, prepared=True)
     try:
         # Check if item exists and is claimable
         cursor.execute("SELECT status FROM Items WHERE item_id = %s", (item_id,))
         item = cursor.fetchone()
         if not item:
             return jsonify({"error": "Item not found."}), 404
-        if item[0] == 'resolved':
+        if item['status'] == 'resolved':
             return jsonify({"error": "Item already resolved."}), 400
 
         # Check if there is already a pending claim for this item by this user
@@ -69,53 +85,151 @@ def claim_item(item_id):
             VALUES (%s, %s, %s, %s)
         """
         cursor.execute(insert_query, (item_id, user_id, verification_details, 'pending'))
+        claim_id = cursor.lastrowid
+        version = record_change(cursor, Change.ENTITIES['CLAIM'], claim_id, Change.ACTIONS['CREATED'])
 
         # Update item status to claim_pending only if current status is not already claim_pending or resolved
         cursor.execute("SELECT status FROM Items WHERE item_id = %s", (item_id,))
-        current_status = cursor.fetchone()[0]
+        current_status = cursor.fetchone()['status']
         if current_status not in ['claim_pending', 'resolved']:
             cursor.execute("UPDATE Items SET status = %s WHERE item_id = %s", ('claim_pending', item_id))
+            version = record_change(cursor, Change.ENTITIES['ITEM'], item_id, Change.ACTIONS['UPDATED'])
 
+        claim = fetch_claim(cursor, claim_id)
+        item = fetch_item(cursor, item_id)
         db.conn.commit()
-        return jsonify({"message": "Claim submitted successfully."}), 201
+        notify_change()
+        return jsonify({"message": "Claim submitted successfully.", "claim": claim, "item": item, "version": version}), 201
     except mysql.connector.Error as err:
         return jsonify({"error": f"Could not submit claim. {err}"}), 500
     finally:
         cursor.close()
 
+def with_scores(cursor, scored, key, fields):
+    """Listing rows for [(item_id, *scores)], best first, each with its scores under `key`.
+
+    Rows no longer open are left out: the in-memory indexes may not have heard of the change yet.
+    """
+    rows = {row['item_id']: row for row in fetch_items(cursor, [entry[0] for entry in scored])}
+    results = []
+    for item_id, *scores in scored:
+        row = rows.get(item_id)
+        if row is not None and row['status'] in ('lost', 'found'):
+            results.append({**row, key: dict(zip(fields, scores))})
+    return results
+
+@item_bp.route('/<int:item_id>/matches', methods=['GET'])
+def get_item_matches(item_id):
+    """Likely counterparts of an open item: found items for a lost one and vice versa, best first."""
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+    matches = find_matches(item_id, limit)
+    if matches is None:
+        return jsonify({"error": "Item not found or no longer open."}), 404
+
+    cursor = db.get_cursor(dictionary=True, read_only=True)
+    try:
+        results = with_scores(cursor, matches, 'match', ('score', 'text_similarity', 'same_category', 'days_apart'))
+        return jsonify({"item_id": item_id, "matches": results}), 200
+    except mysql.connector.Error as err:
+        return jsonify({"error": f"Database error: {err}"}), 500
+    finally:
+        cursor.close()
+
+def report_side(status):
+    return Item.STATUSES['FOUND'] if status == Item.STATUSES['CLAIM_PENDING'] else status
+
+@item_bp.route('/<int:item_id>/merge', methods=['POST'])
+@token_required
+def merge_item(item_id):
+    """Folds a duplicate report into another open report of the same item: its claims move over
+    and the duplicate is deleted. Allowed for the duplicate's reporter and for admins."""
+    data = request.json or {}
+    into_id = data.get('into')
+    if not isinstance(into_id, int) or into_id == item_id:
+        return jsonify({"error": "'into' must be the id of another item."}), 400
+
+    cursor = db.get_cursor(dictionary=True)
+    try:
+        placeholders, params = in_list([item_id, into_id])
+        cursor.execute(f"SELECT item_id, reported_by, category_id, status FROM Items WHERE item_id IN ({placeholders})", params)
+        items = {row['item_id']: row for row in cursor.fetchall()}
+        duplicate, target = items.get(item_id), items.get(into_id)
+        if duplicate is None or target is None:
+            return jsonify({"error": "Item not found."}), 404
+        if duplicate['reported_by'] != request.user_id and request.user_role != 'admin':
+            return jsonify({"error": "Only the reporter or an admin can merge this item."}), 403
+        if duplicate['category_id'] != target['category_id'] or 'resolved' in (duplicate['status'], target['status']):
+            return jsonify({"error": "Only unresolved items in the same category can be merged."}), 400
+        # A lost report and a found report are counterparts, not duplicates; only found items get
+        # claims, so claim_pending counts as found
+        if report_side(duplicate['status']) != report_side(target['status']):
+            return jsonify({"error": "Only two lost or two found reports can be merged."}), 400
+
+        cursor.execute("SELECT claim_id, claim_status FROM Claims WHERE item_id = %s", (item_id,))
+        claims = cursor.fetchall()
+        cursor.execute("UPDATE Claims SET item_id = %s WHERE item_id = %s", (into_id, item_id))
+        if any(claim['claim_status'] == 'pending' for claim in claims) and target['status'] != 'claim_pending':
+            cursor.execute("UPDATE Items SET status = %s WHERE item_id = %s", ('claim_pending', into_id))
+        cursor.execute("DELETE FROM Items WHERE item_id = %s", (item_id,))
+        record_changes(cursor, Change.ENTITIES['CLAIM'], [claim['claim_id'] for claim in claims], Change.ACTIONS['UPDATED'])
+        record_change(cursor, Change.ENTITIES['ITEM'], item_id, Change.ACTIONS['DELETED'])
+        version = record_change(cursor, Change.ENTITIES['ITEM'], into_id, Change.ACTIONS['UPDATED'])
+        item = fetch_item(cursor, into_id)
+        db.conn.commit()
+        notify_change()
+        item_indexes.remove_item(item_id)
+        item_indexes.add_item(item)
+        return jsonify({"message": "Reports merged.", "item": item, "removed": item_id,
+                        "moved_claims": len(claims), "version": version}), 200
+    except mysql.connector.Error as err:
+        db.conn.rollback()
+        return jsonify({"error": f"Could not merge reports. {err}"}), 500
+    finally:
+        cursor.close()
+
 @item_bp.route('', methods=['GET'])
 def get_all_items():
     status_filter = request.args.get('status')
     search_query = request.args.get('search', '').strip()
     include_resolved = request.args.get('include_resolved', 'false').lower() == 'true'
 
-    cursor = db.get_cursor(dictionary=True)
+    cursor = db.get_cursor(dictionary=True, prepared=True, read_only=True)
+    # Read the version first so anything committed during the listing shows up in the next delta;
+    # it stops below changes that may still be uncommitted (utils.changes), so none is skipped
+    version = current_version(cursor)
 
-    # Include resolved items if requested
-    allowed_statuses = ['lost', 'found']
-    if include_resolved:
-        allowed_statuses.append('resolved')
-
-    base_query = """
-        SELECT i.*, u.name AS reporter_name, c.name AS category_name
-        FROM Items i
-        JOIN Users u ON i.reported_by = u.user_id
-        JOIN Categories c ON i.category_id = c.category_id
-        WHERE i.status IN ({})
-    """.format(','.join(['%s'] * len(allowed_statuses)))
-
-    params = allowed_statuses[:]
-    if status_filter in allowed_statuses:
-        base_query += " AND i.status = %s"
-        params.append(status_filter)
-
-    if search_query:
-        base_query += " AND (i.title LIKE %s OR i.description LIKE %s)"
-        like_pattern = f"%{search_query}%"
-        params.extend([like_pattern, like_pattern])
-
-    cursor.execute(base_query, tuple(params))
+    cursor.execute(*listing_query(status_filter, search_query, include_resolved))
     items = cursor.fetchall()
     cursor.close()
 
-    return jsonify(items), 200
+    response = jsonify(items)
+    response.headers['X-Change-Version'] = str(version)
+    return response, 200
+
+@item_bp.route('/changes', methods=['GET'])
+def get_item_changes():
+    """Item delta feed: rows (as the listing shows them) changed after ?since=<version>.
+
+    Every changed row is returned whatever its status, so a client can tell an item that left
+    its list (e.g. now claim_pending) from one that was deleted, listed under `removed`.
+    """
+    since = request.args.get('since', type=int)
+    if since is None or since < 0:
+        return jsonify({"error": "Query parameter 'since' must be a non-negative integer."}), 400
+
+    cursor = db.get_cursor(dictionary=True)
+    try:
+        version, changed, has_more = changes_since(cursor, since, [Change.ENTITIES['ITEM']])
+        item_ids = list(changed[Change.ENTITIES['ITEM']])
+        items = fetch_items(cursor, item_ids)
+        found_ids = {item['item_id'] for item in items}
+        return jsonify({
+            "version": version,
+            "has_more": has_more,
+            "items": items,
+            "removed": [item_id for item_id in item_ids if item_id not in found_ids],
+        }), 200
+    except mysql.connector.Error as err:
+        return jsonify({"error": f"Database error: {err}"}), 500
+    finally:
+        cursor.close()
@@ -0,0 +1,129 @@
+# backend/routes/notification_routes.py
+
+import threading
+import mysql.connector
+from flask import Blueprint, request, jsonify
+from config.db_connector import db
+from utils.security import token_required
+from utils.notification import wait_for_notifications
+from models.notification_model import Notification
+from utils.resources import in_list
+
+notification_bp = Blueprint('notification_bp', __name__)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+MAX_WAIT_SECONDS = 30
+# Long-polls each hold a request thread (not a database connection); beyond this many, requests
+# answer immediately
+MAX_LONG_POLL_WAITERS = 64
+_long_poll_slots = threading.BoundedSemaphore(MAX_LONG_POLL_WAITERS)
+
+UNREAD_STATUSES = (Notification.STATUSES['SENT'], Notification.STATUSES['PENDING'])
+
+def _fetch_page(cursor, user_id, before, after, unread_only, limit):
+    query = """
+        SELECT notification_id, message, type, status, created_at
+        FROM Notifications
+        WHERE user_id = %s
+    """
+    params = [user_id]
+    if unread_only:
+        query += " AND status IN (%s, %s)"
+        params.extend(UNREAD_STATUSES)
+    if before is not None:
+        query += " AND notification_id < %s"
+        params.append(before)
+    if after is not None:
+        query += " AND notification_id > %s"
+        params.append(after)
+    query += " ORDER BY notification_id DESC LIMIT %s"
+    params.append(limit + 1)  # one extra row tells us whether there is a next page
+    cursor.execute(query, tuple(params))
+    rows = cursor.fetchall()
+    return rows[:limit], len(rows) > limit
+
+def _unread_count(cursor, user_id):
+    # Served from idx_notifications_user_status_created
+    cursor.execute("SELECT COUNT(*) AS unread FROM Notifications WHERE user_id = %s AND status IN (%s, %s)",
+                   (user_id, *UNREAD_STATUSES))
+    return cursor.fetchone()['unread']
+
+@notification_bp.route('', methods=['GET'])
+@token_required
+def list_notifications():
+    """The current user's inbox, newest first.
+
+    Keyset pagination: pass next_cursor back as ?before=<id>. With ?after=<id>&wait=<seconds> the
+    request is held until a notification newer than <id> exists or the wait runs out.
+    """
+    user_id = request.user_id
+    limit = min(max(request.args.get('limit', DEFAULT_PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+    before = request.args.get('before', type=int)
+    after = request.args.get('after', type=int)
+    unread_only = request.args.get('unread', 'false').lower() == 'true'
+    wait = min(max(request.args.get('wait', 0, type=float), 0), MAX_WAIT_SECONDS)
+
+    def load():
+        cursor = db.get_cursor(dictionary=True)
+        try:
+            return _fetch_page(cursor, user_id, before, after, unread_only, limit)
+        finally:
+            cursor.close()
+
+    def load_new():
+        rows, has_more = load()
+        return (rows, has_more) if rows else None
+
+    try:
+        rows, has_more = load()
+        if not rows and wait and after is not None and _long_poll_slots.acquire(blocking=False):
+            try:
+                page = wait_for_notifications(load_new, wait)
+            finally:
+                _long_poll_slots.release()
+            if page:
+                rows, has_more = page
+
+        cursor = db.get_cursor(dictionary=True)
+        try:
+            unread = _unread_count(cursor, user_id)
+        finally:
+            cursor.close()
+        return jsonify({
+            "notifications": rows,
+            "unread_count": unread,
+            "next_cursor": rows[-1]['notification_id'] if rows and has_more else None,
+        }), 200
+    except mysql.connector.Error as err:
+        return jsonify({"error": f"Database error: {err}"}), 500
+
+@notification_bp.route('/read', methods=['POST'])
+@token_required
+def mark_notifications_read():
+    """Bulk mark-as-read: {"ids": [...]} for specific notifications or {"all": true} for the whole inbox."""
+    user_id = request.user_id
+    data = request.json or {}
+    ids = data.get('ids') or []
+    mark_all = bool(data.get('all'))
+    if not mark_all and (not isinstance(ids, list) or not all(isinstance(i, int) for i in ids) or not ids):
+        return jsonify({"error": "Provide a non-empty list of notification ids or all=true."}), 400
+
+    query = "UPDATE Notifications SET status = %s WHERE user_id = %s AND status IN (%s, %s)"
+    params = [Notification.STATUSES['READ'], user_id, *UNREAD_STATUSES]
+    if not mark_all:
+        placeholders, id_params = in_list(ids)
+        query += f" AND notification_id IN ({placeholders})"
+        params.extend(id_params)
+
+    cursor = db.get_cursor(dictionary=True)
+    try:
+        cursor.execute(query, tuple(params))
+        updated = cursor.rowcount
+        db.conn.commit()
+        return jsonify({"updated": updated, "unread_count": _unread_count(cursor, user_id)}), 200
+    except mysql.connector.Error as err:
+        db.conn.rollback()
+        return jsonify({"error": f"Database error: {err}"}), 500
+    finally:
+        cursor.close()
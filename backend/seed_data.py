@@ -0,0 +1,321 @@
+# backend/seed_data.py
+"""Synthetic dataset generator: realistic volumes of users, items, claims and notifications.
+
+The same --seed (and scale) always produces the same rows, so benchmark runs compare like with
+like; use --reset to start from empty tables so ids line up too. Distributions:
+
+  * categories follow a Zipf-like mix (Electronics far ahead of Other)
+  * a few prolific reporters, many occasional ones
+  * items resolve more often the older they are, leaving a long tail of resolved items
+  * most open items have no claim, some have several; resolved items have one approved claim
+  * titles, descriptions and verification details have log-normal word counts
+
+Rows are written with multi-row INSERTs, foreign key and unique checks off and the secondary
+indexes dropped, then the indexes are rebuilt once at the end. Every generated user can log in
+as user<id>@example.edu with --password; the first one of a run is an admin. Run from backend/:
+
+    python seed_data.py --scale medium --seed 42 --reset
+"""
+
+import argparse
+import math
+import random
+import time
+from datetime import datetime, timedelta
+
+import mysql.connector
+
+from config.db_connector import db, create_tables_and_seed, DB_ENGINE
+from utils.security import hash_password
+
+SCALES = {
+    # users, items, notifications per user (mean)
+    'small': (1000, 10000, 3),
+    'medium': (10000, 100000, 5),
+    'large': (50000, 1000000, 8),
+}
+
+# Rows per multi-row INSERT (and per commit)
+INSERT_BATCH_ROWS = 5000
+
+CATEGORIES = ['Electronics', 'Clothing', 'Books', 'Accessories', 'Other',
+              'Keys', 'ID Cards', 'Bags', 'Bottles', 'Sports Equipment']
+
+# Dropped during the load and rebuilt afterwards: (table, name, columns)
+SECONDARY_INDEXES = (
+    ('Notifications', 'idx_notifications_user_status_created', '(user_id, status, created_at)'),
+    ('RevokedTokens', 'idx_revoked_tokens_expires', '(expires_at)'),
+)
+
+ADJECTIVES = ('black', 'blue', 'red', 'silver', 'small', 'large', 'old', 'new', 'leather', 'plastic',
+              'green', 'white', 'grey', 'striped', 'worn', 'metal', 'wooden', 'pink', 'dark', 'bright')
+NOUNS = {
+    'Electronics': ('phone', 'laptop', 'charger', 'earbuds', 'calculator', 'tablet', 'power bank', 'mouse'),
+    'Clothing': ('jacket', 'hoodie', 'scarf', 'cap', 'sweater', 'gloves', 'raincoat'),
+    'Books': ('textbook', 'notebook', 'novel', 'lab manual', 'dictionary', 'binder'),
+    'Accessories': ('watch', 'bracelet', 'sunglasses', 'ring', 'umbrella', 'glasses case'),
+    'Keys': ('key ring', 'car key', 'locker key', 'bike key'),
+    'ID Cards': ('student ID', 'library card', 'bus pass', 'driving licence'),
+    'Bags': ('backpack', 'tote bag', 'gym bag', 'pencil case', 'laptop sleeve'),
+    'Bottles': ('water bottle', 'flask', 'travel mug'),
+    'Sports Equipment': ('football', 'racket', 'shin guards', 'yoga mat', 'skateboard'),
+}
+PLACES = ('library', 'cafeteria', 'main hall', 'lab 3', 'gym', 'parking lot', 'bus stop', 'lecture room 101',
+          'second floor corridor', 'student union', 'auditorium', 'computer lab', 'sports field', 'hostel lobby')
+FILLER = ('it', 'has', 'a', 'small', 'scratch', 'on', 'the', 'side', 'with', 'sticker', 'name', 'written',
+          'inside', 'near', 'around', 'afternoon', 'morning', 'left', 'found', 'table', 'bench', 'under',
+          'cover', 'zip', 'pocket', 'brand', 'label', 'colour', 'marks', 'initials', 'strap', 'case')
+FIRST_NAMES = ('Aarav', 'Ananya', 'Diya', 'Ishaan', 'Kavya', 'Rohan', 'Sara', 'Vihaan', 'Meera', 'Arjun',
+               'Emma', 'Liam', 'Noah', 'Olivia', 'Mia', 'Lucas', 'Zara', 'Omar', 'Lena', 'Chen')
+LAST_NAMES = ('Sharma', 'Gowda', 'Rao', 'Iyer', 'Patel', 'Khan', 'Smith', 'Garcia', 'Müller', 'Kim',
+              'Nair', 'Reddy', 'Das', 'Singh', 'Lopez', 'Brown', 'Wang', 'Silva', 'Costa', 'Hughes')
+NOTIFICATION_MESSAGES = (
+    "Claim approved. Check your email for reporter's contact info.",
+    "Item successfully matched and resolved. Check your email for details!",
+    "A new claim was submitted for your item.",
+    "Your claim was rejected. Contact the admin office for details.",
+)
+
+
+class Generator:
+    """Deterministic row source: everything drawn from one Random(seed) in a fixed order."""
+
+    def __init__(self, seed, users, items, notifications_per_user, days, end):
+        self.rng = random.Random(seed)
+        self.users = users
+        self.items = items
+        self.notifications_per_user = notifications_per_user
+        self.days = days
+        self.end = end
+
+    def words(self, vocabulary, median, sigma=0.6, cap=200):
+        count = max(1, min(cap, int(self.rng.lognormvariate(math.log(median), sigma))))
+        return ' '.join(self.rng.choices(vocabulary, k=count))
+
+    def when(self, oldest_days):
+        return self.end - timedelta(seconds=self.rng.randrange(int(oldest_days * 86400)))
+
+    def user_rows(self, first_id, password_hash):
+        roles = ('student', 'faculty', 'admin')
+        for user_id in range(first_id, first_id + self.users):
+            name = f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+            role = self.rng.choices(roles, weights=(85, 14, 1))[0]
+            if user_id == first_id:
+                role = 'admin'  # a known admin login for benchmark harnesses
+            yield user_id, name, f"user{user_id}@example.edu", role, password_hash
+
+    def item_and_claim_rows(self, first_item_id, first_user_id, categories):
+        """Items with their claims, interleaved: ('item', row) and ('claim', row) in id order."""
+        # Zipf-like category mix and a heavy-tailed reporter activity
+        category_weights = [1 / (rank + 1) ** 1.1 for rank in range(len(categories))]
+        reporter_weights = [self.rng.paretovariate(1.3) for _ in range(self.users)]
+        reporter_ids = list(range(first_user_id, first_user_id + self.users))
+        reporters = self.rng.choices(reporter_ids, weights=reporter_weights, k=self.items)
+        claim_id = 0
+        for n in range(self.items):
+            item_id = first_item_id + n
+            category_id, category = self.rng.choices(categories, weights=category_weights)[0]
+            reported = self.when(self.days)
+            age = (self.end - reported).days / self.days
+            nouns = NOUNS.get(category, ('item', 'thing', 'belonging'))
+            title = f"{self.rng.choice(ADJECTIVES).capitalize()} {self.rng.choice(nouns)}"
+            if self.rng.random() < 0.5:
+                title += f" near the {self.rng.choice(PLACES)}"
+            description = f"{title} {self.words(FILLER, median=25)}" if self.rng.random() < 0.9 else None
+
+            resolved = self.rng.random() < 0.15 + 0.7 * age
+            claim_count = self.rng.choices((0, 1, 2, 3, 4, 6), weights=(55, 28, 9, 4, 3, 1))[0]
+            if resolved:
+                claim_count = max(1, claim_count)
+            claim_statuses = []
+            if claim_count:
+                if resolved:
+                    claim_statuses = ['rejected'] * (claim_count - 1) + ['approved']
+                else:
+                    claim_statuses = [self.rng.choice(('pending', 'rejected')) for _ in range(claim_count)]
+            if resolved:
+                status = 'resolved'
+            elif 'pending' in claim_statuses:
+                status = 'claim_pending'
+            else:
+                status = self.rng.choices(('lost', 'found'), weights=(55, 45))[0]
+            yield 'item', (item_id, reporters[n], category_id, title[:100], description, status, reported)
+
+            for claim_status in claim_statuses:
+                claim_id += 1
+                claimant = self.rng.choice(reporter_ids)
+                claimed = min(self.end, reported + timedelta(hours=self.rng.expovariate(1 / 72)))
+                yield 'claim', (claim_id, item_id, claimant, claim_status,
+                                self.words(FILLER, median=18, cap=120), claimed)
+
+    def notification_rows(self, first_user_id):
+        for user_id in range(first_user_id, first_user_id + self.users):
+            for _ in range(int(self.rng.expovariate(1 / self.notifications_per_user))):
+                created = self.when(self.days)
+                # Older notifications have usually been read
+                if (self.end - created).days > 14 and self.rng.random() < 0.8:
+                    status = 'read'
+                else:
+                    status = self.rng.choice(('sent', 'pending'))
+                yield (user_id, self.rng.choice(NOTIFICATION_MESSAGES),
+                       self.rng.choices(('email', 'system'), weights=(30, 70))[0], status, created)
+
+
+class BulkLoader:
+    """Buffers rows per table and writes each full buffer as one multi-row INSERT."""
+
+    STATEMENTS = {
+        'Users': "INSERT INTO Users (user_id, name, email, role, password_hash) VALUES (%s, %s, %s, %s, %s)",
+        'Items': """INSERT INTO Items (item_id, reported_by, category_id, title, description, status, date_reported)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+        'Claims': """INSERT INTO Claims (claim_id, item_id, claimant_id, claim_status, verification_details, claimed_at)
+                     VALUES (%s, %s, %s, %s, %s, %s)""",
+        'Notifications': """INSERT INTO Notifications (user_id, message, type, status, created_at)
+                            VALUES (%s, %s, %s, %s, %s)""",
+    }
+
+    def __init__(self, cursor, batch_rows=INSERT_BATCH_ROWS):
+        self.cursor = cursor
+        self.batch_rows = batch_rows
+        self.buffers = {table: [] for table in self.STATEMENTS}
+        self.counts = {table: 0 for table in self.STATEMENTS}
+
+    def add(self, table, row):
+        buffer = self.buffers[table]
+        buffer.append(row)
+        if len(buffer) >= self.batch_rows:
+            self.flush(table)
+
+    def flush(self, table=None):
+        for name in ([table] if table else self.buffers):
+            rows = self.buffers[name]
+            if rows:
+                self.cursor.executemany(self.STATEMENTS[name], rows)
+                db.conn.commit()
+                self.counts[name] += len(rows)
+                self.buffers[name] = []
+
+
+def _set_load_mode(cursor, loading):
+    if DB_ENGINE == 'sqlite':
+        # Takes effect outside a transaction only
+        db.conn.commit()
+        cursor.execute(f"PRAGMA foreign_keys = {'OFF' if loading else 'ON'}")
+        cursor.execute(f"PRAGMA synchronous = {'OFF' if loading else 'NORMAL'}")
+    else:
+        value = 0 if loading else 1
+        cursor.execute(f"SET SESSION foreign_key_checks = {value}, unique_checks = {value}")
+
+def _drop_indexes(cursor):
+    dropped = []
+    for table, name, columns in SECONDARY_INDEXES:
+        try:
+            if DB_ENGINE == 'sqlite':
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+            else:
+                cursor.execute(f"ALTER TABLE {table} DROP INDEX {name}")
+            dropped.append((table, name, columns))
+        except mysql.connector.Error as err:
+            # 1553: InnoDB keeps an index a foreign key depends on; 1091: not there
+            print(f"Keeping index {name} during the load: {err}")
+    return dropped
+
+def _create_indexes(cursor, indexes):
+    for table, name, columns in indexes:
+        started = time.perf_counter()
+        cursor.execute(f"CREATE INDEX {name} ON {table} {columns}")
+        print(f"✅ Rebuilt {name} in {time.perf_counter() - started:.1f}s")
+
+def _reset(cursor):
+    """Empties the generated tables and restarts their ids; call in load mode (no foreign key checks)."""
+    print("🧹 Emptying Users, Items, Claims, Notifications and Changes...")
+    for table in ('Notifications', 'Claims', 'Items', 'Changes', 'RevokedTokens', 'Users'):
+        if DB_ENGINE == 'sqlite':
+            cursor.execute(f"DELETE FROM {table}")
+            cursor.execute("DELETE FROM sqlite_sequence WHERE name = %s", (table,))
+        else:
+            cursor.execute(f"TRUNCATE TABLE {table}")
+    db.conn.commit()
+
+def _next_id(cursor, table, column):
+    cursor.execute(f"SELECT COALESCE(MAX({column}), 0) + 1 FROM {table}")
+    return int(cursor.fetchone()[0])
+
+def _ensure_categories(cursor):
+    for name in CATEGORIES:
+        cursor.execute("INSERT IGNORE INTO Categories (name) VALUES (%s)", (name,))
+    db.conn.commit()
+    cursor.execute("SELECT category_id, name FROM Categories")
+    by_name = {name: category_id for category_id, name in cursor.fetchall()}
+    # Fixed order (not id order), so the skew lands on the same categories in every database
+    return [(by_name[name], name) for name in CATEGORIES if name in by_name]
+
+
+def seed(scale='small', seed_value=42, reset=False, password='password123', days=365,
+         end=datetime(2025, 1, 1), users=None, items=None, notifications_per_user=None):
+    """Loads one generated dataset; returns the row counts per table."""
+    default_users, default_items, default_notifications = SCALES[scale]
+    generator = Generator(seed_value, users or default_users, items or default_items,
+                          notifications_per_user or default_notifications, days, end)
+
+    create_tables_and_seed()
+    cursor = db.get_cursor()
+    try:
+        _set_load_mode(cursor, loading=True)
+        if reset:
+            _reset(cursor)
+        categories = _ensure_categories(cursor)
+        password_hash = hash_password(password)  # one hash for every generated user
+        first_user = _next_id(cursor, 'Users', 'user_id')
+        first_item = _next_id(cursor, 'Items', 'item_id')
+        claim_offset = _next_id(cursor, 'Claims', 'claim_id') - 1
+
+        dropped = _drop_indexes(cursor)
+        loader = BulkLoader(cursor)
+        started = time.perf_counter()
+        for row in generator.user_rows(first_user, password_hash):
+            loader.add('Users', row)
+        for table, row in generator.item_and_claim_rows(first_item, first_user, categories):
+            if table == 'item':
+                loader.add('Items', row)
+            else:
+                loader.add('Claims', (row[0] + claim_offset,) + row[1:])
+        for row in generator.notification_rows(first_user):
+            loader.add('Notifications', row)
+        loader.flush()
+        elapsed = time.perf_counter() - started
+        total = sum(loader.counts.values())
+        print(f"✅ Loaded {total} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} rows/s): "
+              + ', '.join(f"{table} {count}" for table, count in loader.counts.items()))
+
+        _create_indexes(cursor, dropped)
+        _set_load_mode(cursor, loading=False)
+        db.conn.commit()
+        return loader.counts
+    except Exception:
+        db.conn.rollback()
+        _set_load_mode(cursor, loading=False)
+        raise
+    finally:
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--users', type=int, help='overrides the scale')
+    parser.add_argument('--items', type=int, help='overrides the scale')
+    parser.add_argument('--notifications-per-user', type=float, help='overrides the scale (mean)')
+    parser.add_argument('--days', type=int, default=365, help='how far back item dates go')
+    parser.add_argument('--end', type=datetime.fromisoformat, default=datetime(2025, 1, 1),
+                        help='newest timestamp; fixed by default so runs are reproducible')
+    parser.add_argument('--password', default='password123', help='password of every generated user')
+    parser.add_argument('--reset', action='store_true', help='empty the tables first (deletes ALL users and items)')
+    args = parser.parse_args()
+    seed(args.scale, args.seed, args.reset, args.password, args.days, args.end,
+         args.users, args.items, args.notifications_per_user)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# backend/serve.py
+"""Production entry point: a pre-forked pool of threaded worker processes.
+
+The parent imports the app once (creating tables and seed data), opens the listening socket and
+forks WORKERS children that accept on it; each child serves requests on threads. Connections,
+pools, caches and background threads are re-created in each child (see utils.lifecycle).
+
+On SIGTERM/SIGINT the parent signals every worker. A worker reports not-ready on /readyz but keeps
+serving for DRAIN_GRACE seconds, so load balancers see the 503 and stop routing to it before its
+socket stops accepting. It then stops accepting, ends open event streams, waits up to
+GRACEFUL_TIMEOUT for in-flight requests and exits. Workers that die unexpectedly are replaced.
+
+    python serve.py                       # WORKERS defaults to the CPU count
+    WORKERS=4 PORT=8000 python serve.py
+"""
+
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+from werkzeug.serving import make_server
+
+from server import app
+from utils.lifecycle import lifecycle
+
+HOST = os.getenv('HOST', '0.0.0.0')
+PORT = int(os.getenv('PORT', 5000))
+WORKERS = int(os.getenv('WORKERS', os.cpu_count() or 1))
+GRACEFUL_TIMEOUT = float(os.getenv('GRACEFUL_TIMEOUT', 30))
+# Seconds a draining worker keeps accepting while /readyz fails; at least the balancer's probe interval
+DRAIN_GRACE = float(os.getenv('DRAIN_GRACE', 5))
+
+
+def open_listener(host, port):
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen(1024)
+    listener.set_inheritable(True)
+    return listener
+
+
+def run_worker(listener):
+    """Serves on the shared socket until SIGTERM, then drains. Never returns."""
+    server = make_server(HOST, PORT, app, threaded=True, fd=listener.fileno())
+
+    def drain():
+        lifecycle.start_draining()
+        time.sleep(DRAIN_GRACE)
+        server.shutdown()  # stop accepting; returns once serve_forever has exited
+        lifecycle.close_streams()
+        if not lifecycle.wait_drained(GRACEFUL_TIMEOUT):
+            print(f"Worker {os.getpid()}: {lifecycle.in_flight} request(s) still running after {GRACEFUL_TIMEOUT:g}s")
+
+    # shutdown() blocks until the serve loop notices, so it can't run on the loop's own thread
+    drainer = threading.Thread(target=drain, name="drain")
+
+    def on_term(signum, frame):
+        if drainer.ident is None:  # a second SIGTERM while draining changes nothing
+            drainer.start()
+
+    signal.signal(signal.SIGTERM, on_term)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C reaches the parent, which sends SIGTERM
+    print(f"Worker {os.getpid()} serving on {HOST}:{PORT}")
+    server.serve_forever()
+    # serve_forever returned because drain() called shutdown(); let it finish waiting
+    drainer.join()
+    server.server_close()
+    os._exit(0)
+
+
+def spawn(listener):
+    pid = os.fork()
+    if pid == 0:
+        try:
+            run_worker(listener)
+        finally:
+            os._exit(1)
+    return pid
+
+
+def run_master(listener, workers):
+    children = {spawn(listener) for _ in range(workers)}
+    stopping = False
+
+    def on_stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, on_stop)
+    signal.signal(signal.SIGINT, on_stop)
+
+    while not stopping:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid:
+            children.discard(pid)
+            print(f"Worker {pid} exited with status {status}; starting a replacement")
+            children.add(spawn(listener))
+        else:
+            time.sleep(0.5)
+
+    print(f"Stopping {len(children)} worker(s), draining up to {DRAIN_GRACE + GRACEFUL_TIMEOUT:g}s")
+    for pid in children:
+        os.kill(pid, signal.SIGTERM)
+    deadline = time.monotonic() + DRAIN_GRACE + GRACEFUL_TIMEOUT + 5
+    while children and time.monotonic() < deadline:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid:
+            children.discard(pid)
+        else:
+            time.sleep(0.1)
+    for pid in children:
+        print(f"Worker {pid} did not stop in time; killing it")
+        os.kill(pid, signal.SIGKILL)
+    listener.close()
+
+
+def main():
+    if not hasattr(os, 'fork') or WORKERS <= 1:
+        # No fork on Windows: one threaded process, still without the debugger and reloader
+        print(f"Serving on {HOST}:{PORT} (single process)")
+        make_server(HOST, PORT, app, threaded=True).serve_forever()
+        return
+    listener = open_listener(HOST, PORT)
+    print(f"Master {os.getpid()} listening on {HOST}:{PORT} with {WORKERS} workers")
+    run_master(listener, WORKERS)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
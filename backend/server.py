@@ -5,11 +5,22 @@ from flask_cors import CORS
 from dotenv import load_dotenv
 import os
 
-from config.db_connector import create_tables_and_seed
+from config.db_connector import db, create_tables_and_seed
+from utils.lifecycle import lifecycle, init_lifecycle
+from utils.metrics import init_metrics
+from utils.query_log import init_slow_query_log
+from utils.profiler import init_profiler
+from utils.rate_limit import init_rate_limiting
+from utils.read_routing import init_read_routing
+from utils.json_provider import init_json
+from utils.compression import init_compression
+from utils.item_indexes import init_item_indexes
 from routes.auth_routes import auth_bp
 from routes.item_routes import item_bp
 from routes.category_routes import category_bp
 from routes.admin_routes import admin_bp
+from routes.event_routes import event_bp
+from routes.notification_routes import notification_bp
 
 load_dotenv()
 
@@ -17,21 +28,57 @@ app = Flask(__name__)
 # Load secret key from .env file
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'default-secret-key') 
 CORS(app) 
+# orjson-backed jsonify (stdlib fallback); datetimes as ISO 8601
+init_json(app)
+# In-flight tracking for graceful drains (serve.py), and each request's DB connection back to the pool
+init_lifecycle(app)
+app.teardown_appcontext(db.release)
+# Latency, response size and query count per route; registered first so shed requests are timed too
+init_metrics(app)
+# Statements over SLOW_QUERY_MS go to slow_query.log; PROFILE_SAMPLE_RATE > 0 profiles that share of requests
+init_slow_query_log()
+init_profiler(app)
+# Per-client token buckets and a global concurrency cap, checked before every request
+init_rate_limiting(app)
+# With MYSQL_REPLICA_HOSTS set, listings read from replicas; clients that just wrote stay on the primary
+init_read_routing(app)
+# Registered last so it runs first among after_request hooks and metrics see bytes on the wire
+init_compression(app)
 
 # Initialize database and tables within app context
 with app.app_context():
     create_tables_and_seed()
+    # Match suggestions and duplicate checks are served from memory; workers inherit the indexes on fork
+    init_item_indexes()
 
 # Register blueprints
 app.register_blueprint(auth_bp, url_prefix='/api/auth')
 app.register_blueprint(item_bp, url_prefix='/api/items')
 app.register_blueprint(category_bp, url_prefix='/api/categories')
 app.register_blueprint(admin_bp, url_prefix='/api/admin')
+app.register_blueprint(event_bp, url_prefix='/api/events')
+app.register_blueprint(notification_bp, url_prefix='/api/notifications')
 
 @app.route('/', methods=['GET'])
 def home():
     return jsonify({"message": "Back2U Flask API is running!"})
 
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    """Liveness: the worker process is up and answering."""
+    return jsonify({"status": "ok"}), 200
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness: not draining and the database answers. Load balancers route traffic on this."""
+    if lifecycle.draining:
+        return jsonify({"status": "draining"}), 503
+    try:
+        db.conn.ping(reconnect=True)
+    except Exception as e:
+        return jsonify({"status": "unavailable", "error": str(e)}), 503
+    return jsonify({"status": "ready"}), 200
+
 if __name__ == '__main__':
-    # Run the server
+    # Development server; use serve.py for production
     app.run(debug=True, port=5000)
\ No newline at end of file
@@ -0,0 +1,38 @@
+# backend/tests/conftest.py
+# The suite runs on the embedded SQLite engine, so it needs no database server. Run from backend/:
+#
+#     python -m pytest tests
+
+import os
+import sys
+import tempfile
+
+# Before anything imports config: the engine and its file are chosen at import time
+os.environ['DB_ENGINE'] = 'sqlite'
+os.environ['SQLITE_PATH'] = os.path.join(tempfile.mkdtemp(prefix='back2u-tests-'), 'back2u.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from config.db_connector import db, create_tables_and_seed
+
+
+@pytest.fixture(scope='session')
+def database():
+    create_tables_and_seed()
+    yield db
+    db.release()
+
+
+@pytest.fixture
+def cursor(database):
+    """A dictionary cursor on an empty change log; whatever the test leaves uncommitted is rolled back."""
+    cursor = database.get_cursor(dictionary=True)
+    cursor.execute("DELETE FROM Changes")
+    # Restart change_ids at 1 too, or ids committed by an earlier test would look like a gap
+    cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'Changes'")
+    database.conn.commit()
+    yield cursor
+    cursor.close()
+    database.conn.rollback()
+    database.release()
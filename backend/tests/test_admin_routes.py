@@ -0,0 +1,15 @@
+# backend/tests/test_admin_routes.py
+
+from server import app
+from utils.changes import current_version
+from utils.security import encode_auth_token
+
+
+def test_resolving_an_unknown_claim_records_no_change(cursor):
+    client = app.test_client()
+    headers = {'Authorization': f"Bearer {encode_auth_token(1, 'admin')}"}
+    for resolution_type in ('approve', 'reject'):
+        response = client.post('/api/admin/claims/resolve', headers=headers,
+                               json={'claim_id': 999999, 'resolution_type': resolution_type})
+        assert response.status_code == 404
+    assert current_version(cursor) == 0
@@ -0,0 +1,68 @@
+# backend/tests/test_async_server.py
+
+import asyncio
+
+import async_server
+from utils.changes import current_version, record_change
+
+
+class Pool:
+    """Stands in for an aiomysql pool over the test database, formatting statements the way
+    aiomysql does (`query % args` whenever args is not None) before running them."""
+
+    def __init__(self, database):
+        self.database = database
+
+    def acquire(self):
+        return self
+
+    def cursor(self, cursor_class=None):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        if params is not None:
+            sql % tuple('?' for _ in params)  # TypeError on a placeholder/argument mismatch
+        self._cursor = self.database.get_cursor(dictionary=True)
+        self._cursor.execute(sql, params or ())
+
+    async def fetchall(self):
+        try:
+            return self._cursor.fetchall()
+        finally:
+            self._cursor.close()
+
+
+class Request:
+    def __init__(self, database, query=None):
+        self.app = {'pool': Pool(database)}
+        self.query = query or {}
+        self.headers = {}
+
+
+def async_version(database):
+    response = asyncio.run(async_server.get_all_items(Request(database)))
+    assert response.status == 200
+    return int(response.headers['X-Change-Version'])
+
+
+def test_async_listing_version_on_an_empty_log(cursor, database):
+    assert async_version(database) == 0
+
+
+def test_async_listing_version_matches_the_flask_view(cursor, database):
+    record_change(cursor, 'item', 1, 'created')
+    missing = record_change(cursor, 'item', 2, 'created')
+    record_change(cursor, 'item', 3, 'created')
+    database.conn.commit()
+    assert async_version(database) == current_version(cursor) == 3
+
+    # A young gap holds both back alike
+    cursor.execute("DELETE FROM Changes WHERE change_id = %s", (missing,))
+    database.conn.commit()
+    assert async_version(database) == current_version(cursor) == missing - 1
@@ -0,0 +1,88 @@
+# backend/tests/test_changes.py
+
+from datetime import datetime, timedelta
+
+from utils import changes
+from utils.changes import changes_since, current_version, record_change, record_changes, settled_version
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def rows(*ids_and_ages):
+    return [{'change_id': change_id, 'changed_at': NOW - timedelta(seconds=age)} for change_id, age in ids_and_ages]
+
+
+def test_settled_version_advances_over_contiguous_rows():
+    assert settled_version(0, rows((1, 0), (2, 0), (3, 0)), NOW) == 3
+
+
+def test_settled_version_stops_below_a_young_gap():
+    assert settled_version(0, rows((1, 0), (2, 0), (4, 0), (5, 0)), NOW) == 2
+
+
+def test_settled_version_passes_a_gap_older_than_the_grace_period():
+    assert settled_version(0, rows((1, 0), (3, 120), (4, 0)), NOW, grace=60) == 4
+
+
+def test_settled_version_reads_the_clock_only_for_gaps():
+    def clock():
+        raise AssertionError("no gap, no clock")
+    assert settled_version(5, rows((6, 0), (7, 0)), clock) == 7
+
+
+def test_changes_since_pages_with_has_more(cursor):
+    record_changes(cursor, 'item', [1, 2, 3, 4, 5], 'created')
+    version, changed, has_more = changes_since(cursor, 0, limit=2)
+    first_ids = sorted(changed['item'])
+    assert len(first_ids) == 2 and has_more
+
+    seen = set(first_ids)
+    while has_more:
+        version, changed, has_more = changes_since(cursor, version, limit=2)
+        seen.update(changed['item'])
+    assert seen == {1, 2, 3, 4, 5}
+    assert version == current_version(cursor)
+
+
+def test_changes_since_collapses_to_the_latest_action(cursor):
+    record_change(cursor, 'item', 9, 'created')
+    record_change(cursor, 'item', 9, 'updated')
+    record_change(cursor, 'category', 2, 'deleted')
+    version, changed, has_more = changes_since(cursor, 0)
+    assert changed['item'] == {9: 'updated'}
+    assert changed['category'] == {2: 'deleted'}
+    assert not has_more
+
+
+def test_changes_since_filters_entities_without_treating_them_as_gaps(cursor):
+    record_change(cursor, 'item', 1, 'created')
+    record_change(cursor, 'claim', 1, 'created')
+    last = record_change(cursor, 'item', 2, 'created')
+    version, changed, _ = changes_since(cursor, 0, entities=['item'])
+    assert changed['item'] == {1: 'created', 2: 'created'}
+    assert changed['claim'] == {}
+    assert version == last
+
+
+def test_a_young_gap_holds_the_version_back_until_it_expires(cursor, monkeypatch):
+    first = record_change(cursor, 'item', 1, 'created')
+    missing = record_change(cursor, 'item', 2, 'created')
+    last = record_change(cursor, 'item', 3, 'created')
+    # Stands in for a transaction that has taken an id but not committed yet
+    cursor.execute("DELETE FROM Changes WHERE change_id = %s", (missing,))
+
+    version, changed, has_more = changes_since(cursor, 0, limit=3)
+    assert version == first
+    assert changed['item'] == {1: 'created', 3: 'created'}  # read again next time
+    assert not has_more  # a gap ends the page: clients wait for their next delta
+    assert current_version(cursor) == first
+
+    # Once the grace period is over the gap is taken as a rollback
+    monkeypatch.setattr(changes, 'settled_version',
+                        lambda since, rows, now, grace=0: settled_version(since, rows, now, grace))
+    assert changes_since(cursor, 0)[0] == last
+    assert current_version(cursor) == last
+
+
+def test_current_version_of_an_empty_log_is_zero(cursor):
+    assert current_version(cursor) == 0
@@ -0,0 +1,48 @@
+# backend/tests/test_db_connector.py
+
+import mysql.connector
+
+from config.db_connector import ConnectionPool, normalize_sql
+
+
+def test_normalize_sql_collapses_whitespace():
+    assert normalize_sql("""
+        SELECT item_id,
+               title
+        FROM Items\tWHERE status = %s
+    """) == "SELECT item_id, title FROM Items WHERE status = %s"
+
+
+def test_normalize_sql_maps_differently_indented_statements_to_one_key():
+    assert normalize_sql("SELECT 1  FROM  Items") == normalize_sql("\n  SELECT 1\nFROM Items\n")
+
+
+def test_prepared_cursor_runs_normalized_statements(database):
+    cursor = database.get_cursor(dictionary=True, prepared=True)
+    try:
+        cursor.execute("""
+            SELECT name
+            FROM Categories WHERE name = %s
+        """, ('Books',))
+        assert cursor.fetchall() == [{'name': 'Books'}]
+    finally:
+        cursor.close()
+        database.release()
+
+
+class BrokenConnection:
+    closed = False
+
+    def rollback(self):
+        raise mysql.connector.errors.OperationalError("MySQL Connection not available.")
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_closes_connections_it_cannot_roll_back():
+    pool = ConnectionPool({}, size=4)
+    conn = BrokenConnection()
+    pool.put((conn, None))
+    assert conn.closed
+    assert pool._idle == []
@@ -0,0 +1,87 @@
+# backend/tests/test_duplicates.py
+
+from utils import duplicates
+from utils.duplicates import DuplicateIndex
+
+TITLE = 'Black leather wallet'
+DESCRIPTION = 'brown stitching, student card, library card and a bus pass inside'
+
+
+def item(item_id, title=TITLE, description=DESCRIPTION, status='found', category_id=1):
+    return {'item_id': item_id, 'title': title, 'description': description,
+            'status': status, 'category_id': category_id}
+
+
+def found_ids(index, title=TITLE, description=DESCRIPTION, status='found', category_id=1, **kwargs):
+    return [item_id for item_id, _ in index.find(title, description, category_id, status, **kwargs)]
+
+
+def test_finds_the_same_report_reworded():
+    index = DuplicateIndex()
+    index.rebuild([item(1), item(2, 'Blue umbrella', 'folding, wooden handle')])
+    reworded = 'inside a bus pass, library card, student card; brown stitching'
+    matches = index.find('Leather wallet black', reworded, 1, 'found')
+    assert [item_id for item_id, _ in matches] == [1]
+    assert matches[0][1] >= duplicates.DUPLICATE_MIN_SIMILARITY
+
+
+def test_only_the_same_category_and_status_are_duplicates():
+    index = DuplicateIndex()
+    index.rebuild([item(1), item(2, status='lost'), item(3, category_id=2)])
+    assert found_ids(index) == [1]
+    assert found_ids(index, status='lost') == [2]
+    assert found_ids(index, status='resolved') == []
+
+
+def test_exclude_leaves_out_the_item_itself():
+    index = DuplicateIndex()
+    index.rebuild([item(1), item(2)])
+    assert found_ids(index, exclude=1) == [2]
+
+
+def test_add_and_remove_are_visible_before_a_reindex():
+    index = DuplicateIndex()
+    index.rebuild([])
+    index.add(item(1))
+    assert found_ids(index) == [1]
+    index.add(item(1, 'Blue umbrella', 'folding, wooden handle'))  # edited: old row is dead
+    assert found_ids(index) == []
+    index.remove(1)
+    assert len(index) == 0 and found_ids(index, 'Blue umbrella', 'folding, wooden handle') == []
+
+
+def test_items_leaving_the_open_statuses_are_dropped():
+    index = DuplicateIndex()
+    index.rebuild([item(1)])
+    index.add(item(1, status='claim_pending'))
+    assert len(index) == 0 and found_ids(index) == []
+
+
+def test_pending_rows_are_merged_into_the_sorted_keys(monkeypatch):
+    monkeypatch.setattr(duplicates, 'PENDING_ROWS', 2)
+    index = DuplicateIndex()
+    index.rebuild([])
+    for item_id in (1, 2, 3):
+        index.add(item(item_id))
+    assert index._pending_rows == 0 and len(index._sorted_keys) == 3 * index.bands
+    assert sorted(found_ids(index)) == [1, 2, 3]
+
+
+def test_compaction_keeps_live_rows_and_drops_dead_ones():
+    index = DuplicateIndex()
+    index.rebuild([])
+    for n in range(1, 1025):  # fills the initial capacity
+        index.add(item(n))
+    for n in range(1, 1001):
+        index.remove(n)
+    index.add(item(5000))  # past capacity: live rows are copied over
+    assert len(index) == 25
+    assert index._size == 25
+    assert sorted(found_ids(index, limit=100)) == list(range(1001, 1025)) + [5000]
+
+
+def test_text_without_indexable_words_is_never_a_duplicate():
+    index = DuplicateIndex()
+    index.rebuild([item(1, 'the a', 'of it')])
+    assert len(index) == 0
+    assert found_ids(index, 'a the', 'it of') == []
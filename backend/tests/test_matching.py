@@ -0,0 +1,78 @@
+# backend/tests/test_matching.py
+
+from datetime import datetime, timedelta
+
+from utils.matching import MatchIndex, tokenize
+
+REPORTED = datetime(2026, 3, 1, 9, 0, 0)
+
+
+def item(item_id, status, title, description='', category_id=1, reported_by=None, days=0):
+    return {
+        'item_id': item_id, 'status': status, 'title': title, 'description': description,
+        'category_id': category_id, 'reported_by': reported_by if reported_by is not None else item_id,
+        'date_reported': REPORTED + timedelta(days=days),
+    }
+
+
+def matched_ids(index, item_id):
+    return [match[0] for match in index.matches(item_id)]
+
+
+def test_tokenize_weights_the_title_and_drops_stopwords():
+    assert tokenize('Lost black wallet', 'near the library') == ['black', 'wallet', 'black', 'wallet', 'library']
+
+
+def test_lost_items_match_found_items_best_first():
+    index = MatchIndex(dimensions=256)
+    index.rebuild([
+        item(1, 'lost', 'Black leather wallet', 'cards and a bus pass'),
+        item(2, 'found', 'Black leather wallet', 'found with a bus pass inside'),
+        item(3, 'found', 'Leather jacket', 'black, size M'),
+        item(4, 'lost', 'Black leather wallet', 'another lost one'),
+        item(5, 'found', 'Blue umbrella'),
+    ])
+    assert matched_ids(index, 1)[:2] == [2, 3]
+    best = index.matches(1)[0]
+    assert best[1] > index.matches(1)[1][1]  # score
+    assert best[3] is True and best[4] == 0.0  # same category, same day
+    assert 4 not in matched_ids(index, 1)  # lost never matches lost
+    assert 5 not in matched_ids(index, 1)  # no shared words
+
+
+def test_category_and_time_break_text_ties():
+    index = MatchIndex(dimensions=256)
+    index.rebuild([
+        item(1, 'lost', 'Silver keyring'),
+        item(2, 'found', 'Silver keyring', category_id=2),
+        item(3, 'found', 'Silver keyring', days=30),
+        item(4, 'found', 'Silver keyring', days=1),
+    ])
+    assert matched_ids(index, 1) == [4, 3, 2]
+
+
+def test_own_reports_are_not_suggested():
+    index = MatchIndex(dimensions=256)
+    index.rebuild([item(1, 'lost', 'Red scarf', reported_by=7), item(2, 'found', 'Red scarf', reported_by=7)])
+    assert index.matches(1) == []
+
+
+def test_updates_and_removals_follow_the_item():
+    index = MatchIndex(dimensions=256)
+    index.rebuild([item(1, 'lost', 'Red scarf'), item(2, 'found', 'Red scarf')])
+    index.add(item(3, 'found', 'Red wool scarf'))
+    assert set(matched_ids(index, 1)) == {2, 3}
+    index.add(item(2, 'resolved', 'Red scarf'))
+    assert 2 not in index and matched_ids(index, 1) == [3]
+    index.remove(3)
+    assert index.matches(1) == []
+    assert index.matches(99) is None
+
+
+def test_match_many_agrees_with_matches():
+    index = MatchIndex(dimensions=256)
+    index.rebuild([item(1, 'lost', 'Grey backpack'), item(2, 'lost', 'Blue bottle'),
+                   item(3, 'found', 'Grey backpack'), item(4, 'found', 'Blue water bottle')])
+    results = index.match_many([1, 2, 42])
+    assert results[1] == index.matches(1) and results[2] == index.matches(2)
+    assert results[42] is None
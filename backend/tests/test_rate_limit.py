@@ -0,0 +1,58 @@
+# backend/tests/test_rate_limit.py
+
+from utils import rate_limit
+from utils.rate_limit import MemoryBackend
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def backend_with_clock(monkeypatch, **kwargs):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, 'monotonic', clock)
+    return MemoryBackend(**kwargs), clock
+
+
+def test_bucket_allows_a_burst_up_to_capacity(monkeypatch):
+    backend, _ = backend_with_clock(monkeypatch)
+    assert [backend.take('client', 3, 1.0)[0] for _ in range(4)] == [True, True, True, False]
+
+
+def test_bucket_refills_over_time(monkeypatch):
+    backend, clock = backend_with_clock(monkeypatch)
+    for _ in range(2):
+        backend.take('client', 2, 0.5)
+    allowed, retry_after = backend.take('client', 2, 0.5)
+    assert not allowed and retry_after == 2  # one token at 0.5/s
+    clock.now += 2
+    assert backend.take('client', 2, 0.5) == (True, 0)
+    assert not backend.take('client', 2, 0.5)[0]
+
+
+def test_bucket_never_fills_past_capacity(monkeypatch):
+    backend, clock = backend_with_clock(monkeypatch)
+    backend.take('client', 2, 1.0)
+    clock.now += 3600
+    assert [backend.take('client', 2, 1.0)[0] for _ in range(3)] == [True, True, False]
+
+
+def test_buckets_are_per_key(monkeypatch):
+    backend, _ = backend_with_clock(monkeypatch)
+    assert backend.take('a', 1, 1.0)[0]
+    assert not backend.take('a', 1, 1.0)[0]
+    assert backend.take('b', 1, 1.0)[0]
+
+
+def test_least_recently_used_keys_are_evicted(monkeypatch):
+    backend, _ = backend_with_clock(monkeypatch, max_keys=2)
+    backend.take('a', 1, 0.001)
+    backend.take('b', 1, 0.001)
+    backend.take('c', 1, 0.001)
+    # 'a' was dropped, so it starts again from a full bucket
+    assert backend.take('a', 1, 0.001)[0]
+    assert not backend.take('c', 1, 0.001)[0]
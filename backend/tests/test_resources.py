@@ -0,0 +1,21 @@
+# backend/tests/test_resources.py
+
+from utils.resources import in_list
+
+
+def test_in_list_pads_to_the_next_power_of_two():
+    assert in_list([7]) == ('%s', (7,))
+    assert in_list([1, 2]) == ('%s,%s', (1, 2))
+    assert in_list([1, 2, 3]) == ('%s,%s,%s,%s', (1, 2, 3, 3))
+    placeholders, params = in_list(range(1, 6))
+    assert placeholders.count('%s') == 8
+    assert params == (1, 2, 3, 4, 5, 5, 5, 5)
+
+
+def test_in_list_sizes_share_a_statement():
+    shapes = {in_list(range(n))[0] for n in range(5, 9)}
+    assert len(shapes) == 1
+
+
+def test_in_list_accepts_any_iterable():
+    assert in_list(x for x in (4, 5, 6)) == ('%s,%s,%s,%s', (4, 5, 6, 6))
@@ -0,0 +1,64 @@
+# backend/tests/test_security.py
+
+import time
+
+from utils.security import TokenDenylist, VerifiedTokenCache
+
+
+def claims(expires_in=60):
+    return {'user_id': 1, 'role': 'student', 'exp': time.time() + expires_in}
+
+
+def test_token_cache_serves_until_the_token_expires():
+    cache = VerifiedTokenCache()
+    cache.put('live', claims())
+    cache.put('expired', claims(expires_in=-1))
+    assert cache.get('live')['user_id'] == 1
+    assert cache.get('expired') is None
+    assert cache.get('unknown') is None
+
+
+def test_token_cache_evicts_the_least_recently_used():
+    cache = VerifiedTokenCache(max_size=2)
+    cache.put('a', claims())
+    cache.put('b', claims())
+    cache.get('a')
+    cache.put('c', claims())
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+
+
+def test_token_cache_clear():
+    cache = VerifiedTokenCache()
+    cache.put('a', claims())
+    cache.clear()
+    assert cache.get('a') is None
+
+
+def test_denylist_revocation_is_seen_locally_and_by_other_workers(database):
+    revoking, other = TokenDenylist(), TokenDenylist()
+    jti = 'revoked-' + str(time.time_ns())
+    revoking.revoke(jti, 1, time.time() + 60)
+    assert revoking.is_revoked(jti)
+    # Another worker picks it up from RevokedTokens on its next sync
+    assert other.is_revoked(jti)
+    assert not other.is_revoked('never-revoked')
+    database.release()
+
+
+def test_denylist_drops_expired_revocations_on_sync(database):
+    denylist = TokenDenylist()
+    jti = 'expired-' + str(time.time_ns())
+    denylist.revoke(jti, 1, time.time() - 1)
+    denylist.sync()
+    assert not denylist.is_revoked(jti)
+    database.release()
+
+
+def test_denylist_syncs_at_most_once_per_interval(database, monkeypatch):
+    denylist = TokenDenylist(sync_seconds=3600)
+    syncs = []
+    monkeypatch.setattr(denylist, 'sync', lambda: syncs.append(1) or setattr(denylist, '_synced_at', time.monotonic()))
+    for _ in range(5):
+        denylist.is_revoked('anything')
+    assert len(syncs) == 1
@@ -0,0 +1,111 @@
+# backend/utils/changes.py
+#
+# change_id is handed out when a change row is INSERTed, not when its transaction commits, so a
+# transaction holding id N can commit after another one has committed N+1. Readers therefore see
+# a gap at N until it commits. A version handed to a client must never pass such a gap, or the
+# client would never ask for N again. Versions here stop just below the lowest gap younger than
+# CHANGE_GAP_GRACE_SECONDS, and rows past it are read again on the next call. Older gaps are
+# taken to be rolled-back inserts.
+
+import os
+from datetime import datetime
+
+from models.change_model import Change
+
+# Upper bound on change rows read per delta request; clients page with has_more
+MAX_CHANGES_PER_REQUEST = 1000
+# How long a missing change_id is assumed to belong to a transaction that has not committed yet
+CHANGE_GAP_GRACE_SECONDS = float(os.getenv('CHANGE_GAP_GRACE_SECONDS', 60))
+# current_version() looks for young gaps among this many most recent change rows
+GAP_SCAN_ROWS = 100
+
+def record_change(cursor, entity, entity_id, action):
+    """Appends one row to the change log. Call inside the writer's transaction, before commit."""
+    cursor.execute("INSERT INTO Changes (entity, entity_id, action) VALUES (%s, %s, %s)",
+                   (entity, entity_id, action))
+    return cursor.lastrowid
+
+def record_changes(cursor, entity, entity_ids, action):
+    """Bulk variant of record_change for cascades and imports."""
+    if not entity_ids:
+        return
+    cursor.executemany("INSERT INTO Changes (entity, entity_id, action) VALUES (%s, %s, %s)",
+                       [(entity, entity_id, action) for entity_id in entity_ids])
+
+CHANGE_COLUMNS = ('change_id', 'entity', 'entity_id', 'action', 'changed_at')
+# The database clock comes with the rows, so the Flask and asyncio servers need one round trip each
+CURRENT_VERSION_QUERY = ("SELECT change_id, changed_at, CURRENT_TIMESTAMP AS now FROM Changes "
+                         "ORDER BY change_id DESC LIMIT %s")
+CURRENT_VERSION_PARAMS = (GAP_SCAN_ROWS,)
+
+def _as_dict(row, columns):
+    return row if isinstance(row, dict) else dict(zip(columns, row))
+
+def _as_datetime(value):
+    # SQLite returns CURRENT_TIMESTAMP as a string
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+def _database_now(cursor):
+    # The database clock, which also stamped changed_at
+    cursor.execute("SELECT CURRENT_TIMESTAMP AS now")
+    row = cursor.fetchone()
+    return _as_datetime(row['now'] if isinstance(row, dict) else row[0])
+
+def settled_version(since, rows, now, grace=CHANGE_GAP_GRACE_SECONDS):
+    """Highest change_id up to which every change is visible: `since`, advanced over `rows`
+    (dicts with change_id and changed_at, ascending) until the first gap younger than grace.
+
+    A missing id was handed out before the row that follows it, so that row's changed_at bounds
+    how long the gap has been open. `now` may be a callable, evaluated only if there is a gap.
+    """
+    version = since
+    for row in rows:
+        if row['change_id'] > version + 1:
+            if callable(now):
+                now = now()
+            if (now - row['changed_at']).total_seconds() < grace:
+                break
+        version = row['change_id']
+    return version
+
+def version_from_rows(rows):
+    """current_version() from the rows of CURRENT_VERSION_QUERY run with CURRENT_VERSION_PARAMS,
+    for callers that run the query themselves (the asyncio server)."""
+    rows = [_as_dict(row, ('change_id', 'changed_at', 'now')) for row in rows]
+    if not rows:
+        return 0
+    rows.reverse()
+    # Rows older than the scanned tail are taken as settled
+    return int(settled_version(rows[0]['change_id'] - 1, rows, _as_datetime(rows[0]['now'])))
+
+def current_version(cursor):
+    """Version to hand a client together with a snapshot read: the highest change_id with no
+    possibly uncommitted change below it; 0 on an empty log."""
+    cursor.execute(CURRENT_VERSION_QUERY, CURRENT_VERSION_PARAMS)
+    return version_from_rows(cursor.fetchall())
+
+def read_changes(cursor, since, limit):
+    """Change rows after `since` (at most limit, ascending) and the version the next read should
+    start from. Rows past a young gap are included but the version stays below the gap, so they
+    will be returned again: consumers must apply changes idempotently."""
+    cursor.execute("SELECT change_id, entity, entity_id, action, changed_at FROM Changes "
+                   "WHERE change_id > %s ORDER BY change_id LIMIT %s", (since, limit))
+    rows = [_as_dict(row, CHANGE_COLUMNS) for row in cursor.fetchall()]
+    return rows, settled_version(since, rows, lambda: _database_now(cursor))
+
+def changes_since(cursor, since, entities=None, limit=MAX_CHANGES_PER_REQUEST):
+    """Reads the change log after `since`, collapsed to the latest action per entity.
+
+    Returns (version, changed, has_more) where changed maps entity -> {entity_id: action} and
+    version is the change_id the caller should pass as `since` next time. Every entity is read
+    and filtered here rather than in SQL, so other entities' ids are not mistaken for gaps.
+    has_more is only set when the page ended without a young gap, so clients paging with it do
+    not spin on a gap; they pick its changes up on their next regular delta.
+    """
+    rows, version = read_changes(cursor, since, limit)
+    changed = {entity: {} for entity in Change.ENTITIES.values()}
+    for row in rows:
+        if not entities or row['entity'] in entities:
+            changed[row['entity']][row['entity_id']] = row['action']
+    has_more = len(rows) == limit and version == rows[-1]['change_id']
+    return version, changed, has_more
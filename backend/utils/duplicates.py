@@ -0,0 +1,188 @@
+# backend/utils/duplicates.py
+# Near-duplicate detection for new reports: the same found wallet reported by several people.
+# Every open item gets a MinHash signature of the words in its title and description; locality
+# sensitive hashing over bands of the signature turns "which open items in this category and
+# status share most of these words" into a few exact key lookups. The index is built at startup
+# and follows the change log from then on (utils.item_indexes).
+
+import os
+import threading
+import zlib
+
+import numpy as np
+
+from utils.item_indexes import item_indexes
+from utils.matching import OPEN_STATUSES, tokenize
+
+# Signature length is bands x rows; items sharing all rows of any band become candidates, so
+# more rows per band mean fewer, closer candidates (~50% shared words with the defaults)
+DUPLICATE_BANDS = int(os.getenv('DUPLICATE_BANDS', 16))
+DUPLICATE_ROWS = int(os.getenv('DUPLICATE_ROWS', 4))
+# Candidates whose estimated share of common words (Jaccard similarity) is below this are dropped
+DUPLICATE_MIN_SIMILARITY = float(os.getenv('DUPLICATE_MIN_SIMILARITY', 0.5))
+# Band keys of items added since the last reindex live in a dict; past this many rows they are
+# merged into the sorted array
+PENDING_ROWS = 4096
+
+_PRIME = (1 << 31) - 1  # hash values stay below 2**31, so signatures fit uint32
+_MIX = np.uint64(0x100000001B3)
+_DEAD = -1
+
+
+class DuplicateIndex:
+    """MinHash signatures of open items with an LSH band index.
+
+    Rows live in NumPy columns (signature, item id, category, status). Each row has one key per
+    band, a hash of the band's signature values salted with band number, category and status,
+    so a key hit is already a same-category, same-status candidate. Keys are kept in one sorted
+    array (searched with np.searchsorted) plus a dict for rows added since it was last sorted.
+    Updated or removed items leave dead rows behind until the next reindex.
+    """
+
+    def __init__(self, bands=DUPLICATE_BANDS, rows=DUPLICATE_ROWS, seed=1):
+        self.bands, self.rows_per_band = bands, rows
+        rng = np.random.default_rng(seed)  # fixed: every worker must hash alike
+        permutations = bands * rows
+        self._a = rng.integers(1, _PRIME, permutations, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, permutations, dtype=np.uint64)
+        self._band_salts = rng.integers(1, 1 << 62, bands, dtype=np.uint64)
+        self._lock = threading.RLock()
+        self._clear(1024)
+
+    def _clear(self, capacity):
+        self._rows = {}  # item_id -> current row
+        self._size = 0
+        self._allocate(capacity)
+        self._sorted_keys = np.zeros(0, dtype=np.uint64)
+        self._sorted_rows = np.zeros(0, dtype=np.int64)
+        self._pending = {}  # band key -> [rows], for rows added since the keys were sorted
+        self._pending_rows = 0
+
+    def _allocate(self, capacity):
+        self.signatures = np.zeros((capacity, self.bands * self.rows_per_band), dtype=np.uint32)
+        self.keys = np.zeros((capacity, self.bands), dtype=np.uint64)
+        self.item_ids = np.zeros(capacity, dtype=np.int64)
+        self.categories = np.zeros(capacity, dtype=np.int64)
+        self.statuses = np.full(capacity, _DEAD, dtype=np.int8)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def signature(self, title, description):
+        """MinHash over the item's distinct words; None when it has no indexable words."""
+        words = set(tokenize(title, description))
+        if not words:
+            return None
+        hashes = np.fromiter((zlib.crc32(word.encode('utf-8')) for word in words), dtype=np.uint64, count=len(words))
+        # One universal hash (a*x + b) mod p per permutation, minimised over the words
+        return ((hashes[:, None] * self._a + self._b) % _PRIME).min(axis=0).astype(np.uint32)
+
+    def band_keys(self, signature, category_id, status):
+        bands = signature.reshape(self.bands, self.rows_per_band).astype(np.uint64)
+        keys = self._band_salts ^ np.uint64((category_id << 2) | status)
+        for column in range(self.rows_per_band):  # FNV-style mixing, wrapping at 2**64
+            keys = (keys * _MIX) ^ bands[:, column]
+        return keys
+
+    def rebuild(self, items):
+        with self._lock:
+            self._clear(max(1024, len(items) * 5 // 4))
+            for item in items:
+                self.add(item, reindex=False)
+            self._reindex()
+
+    def add(self, item, reindex=True):
+        """Adds or refreshes one item from its listing row; items no longer open are removed."""
+        with self._lock:
+            self.remove(item['item_id'])
+            if item['status'] not in OPEN_STATUSES:
+                return
+            signature = self.signature(item['title'], item.get('description'))
+            if signature is None:
+                return
+            status = OPEN_STATUSES[item['status']]
+            if self._size == len(self.item_ids):
+                self._compact(max(1024, len(self._rows) * 2))
+            row = self._size
+            self._size += 1
+            self._rows[item['item_id']] = row
+            self.signatures[row] = signature
+            self.keys[row] = self.band_keys(signature, item['category_id'], status)
+            self.item_ids[row] = item['item_id']
+            self.categories[row] = item['category_id']
+            self.statuses[row] = status
+            if reindex:
+                for key in self.keys[row].tolist():
+                    self._pending.setdefault(key, []).append(row)
+                self._pending_rows += 1
+                if self._pending_rows > PENDING_ROWS:
+                    self._reindex()
+
+    def remove(self, item_id):
+        with self._lock:
+            row = self._rows.pop(item_id, None)
+            if row is not None:
+                self.statuses[row] = _DEAD
+
+    def _compact(self, capacity):
+        """Copies the live rows into arrays of the given capacity; the key index must be redone."""
+        live = sorted(self._rows.values())
+        old = (self.signatures, self.keys, self.item_ids, self.categories, self.statuses)
+        self._allocate(capacity)
+        for source, target in zip(old, (self.signatures, self.keys, self.item_ids, self.categories, self.statuses)):
+            target[:len(live)] = source[live]
+        self._rows = {int(item_id): row for row, item_id in enumerate(self.item_ids[:len(live)])}
+        self._size = len(live)
+        self._reindex()
+
+    def _reindex(self):
+        """Sorts the band keys of every live row into one array and empties the pending dict."""
+        live = np.flatnonzero(self.statuses[:self._size] != _DEAD)
+        keys = self.keys[live].ravel()
+        order = np.argsort(keys, kind='stable')
+        self._sorted_keys = keys[order]
+        self._sorted_rows = np.repeat(live, self.bands)[order]
+        self._pending = {}
+        self._pending_rows = 0
+
+    def find(self, title, description, category_id, status, limit=5, exclude=None):
+        """[(item_id, similarity)] of open items in the same category and status whose words
+        overlap the given text by at least DUPLICATE_MIN_SIMILARITY, most similar first."""
+        if status not in OPEN_STATUSES:
+            return []
+        signature = self.signature(title, description)
+        if signature is None:
+            return []
+        keys = self.band_keys(signature, category_id, OPEN_STATUSES[status])
+        with self._lock:
+            starts = np.searchsorted(self._sorted_keys, keys, side='left')
+            ends = np.searchsorted(self._sorted_keys, keys, side='right')
+            candidates = [self._sorted_rows[start:end] for start, end in zip(starts, ends) if end > start]
+            for key in keys.tolist():
+                if key in self._pending:
+                    candidates.append(np.array(self._pending[key], dtype=np.int64))
+            if not candidates:
+                return []
+            # A row found through several bands is scored more than once: cheaper than deduplicating
+            # every candidate first, and only the few that pass are deduplicated below
+            rows = np.concatenate(candidates)
+            # Dead rows, and keys that collided across categories or statuses
+            rows = rows[(self.statuses[rows] == OPEN_STATUSES[status]) & (self.categories[rows] == category_id)]
+            if exclude is not None:
+                rows = rows[self.item_ids[rows] != exclude]
+            # The share of equal signature positions estimates the Jaccard similarity of the word sets
+            equal = np.count_nonzero(self.signatures[rows] == signature, axis=1)
+            rows = rows[equal >= DUPLICATE_MIN_SIMILARITY * len(signature)]
+            rows = np.unique(rows)
+            similarity = np.count_nonzero(self.signatures[rows] == signature, axis=1) / len(signature)
+            order = np.argsort(-similarity, kind='stable')[:limit]
+            return [(int(self.item_ids[rows[i]]), round(float(similarity[i]), 3)) for i in order]
+
+
+duplicate_index = item_indexes.register(DuplicateIndex())
+
+def find_duplicates(item, limit=5):
+    """Likely duplicates of an item's listing row (the item itself excluded)."""
+    item_indexes.follow()
+    return duplicate_index.find(item['title'], item.get('description'), item['category_id'], item['status'],
+                                limit, exclude=item['item_id'])
@@ -0,0 +1,239 @@
+# backend/utils/events.py
+
+import threading
+import time
+from collections import deque
+
+from config.db_connector import db
+from models.change_model import Change
+from utils.changes import CHANGE_GAP_GRACE_SECONDS, current_version
+from utils.resources import fetch_items, in_list
+from utils.lifecycle import add_stream_close_listener, register_after_fork
+
+# How often the poller re-reads the change log when nobody calls notify_change()
+POLL_INTERVAL = 1.0
+# Events kept in memory for subscribers that fall behind; older ones are replayed from the database
+BACKLOG_SIZE = 2000
+BATCH_SIZE = 500
+# Longer runs of missing change_ids are not waited for (no transaction writes that many changes)
+MAX_TRACKED_GAP = 10000
+
+# Called from the poller thread with each batch of new events, e.g. to keep in-memory indexes current
+event_listeners = []
+
+def add_event_listener(listener):
+    event_listeners.append(listener)
+
+
+class EventBroadcaster:
+    """One per worker process. A single poller thread tails the Changes table and fans events out
+    to every SSE connection, so N listeners cost one query per poll rather than N.
+
+    The change log is the source of truth: writes committed by other workers or processes are
+    picked up on the next poll. change_ids are handed out before commit, so an id can become
+    visible after higher ones (see utils.changes); the poller remembers every id it skipped over
+    and re-reads those for CHANGE_GAP_GRACE_SECONDS. Events therefore arrive in delivery order,
+    not id order: subscribers follow the local `seq`, and the SSE event id is `resume`, the
+    version below which nothing is still missing.
+    """
+
+    def __init__(self, poll_interval=POLL_INTERVAL, backlog_size=BACKLOG_SIZE):
+        self.poll_interval = poll_interval
+        self.backlog_size = backlog_size
+        self._reset()
+
+    def _reset(self):
+        self._events = deque(maxlen=self.backlog_size)
+        self._cond = threading.Condition()
+        self._wake = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.latest_id = 0  # highest change_id read
+        self._gaps = {}     # change_id skipped over -> time.monotonic() it was first missed
+        self.seq = 0        # events delivered by this process so far
+
+    def reset_after_fork(self):
+        # The poller thread is not inherited; the child starts its own on first use
+        self._reset()
+
+    @property
+    def resume_id(self):
+        """Version a client can resume from: no change at or below it is still awaited."""
+        return min(self._gaps) - 1 if self._gaps else self.latest_id
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            cursor = db.get_cursor(dictionary=True)
+            try:
+                self.latest_id = current_version(cursor)
+            finally:
+                cursor.close()
+            self._thread = threading.Thread(target=self._run, name="event-broadcaster", daemon=True)
+            self._thread.start()
+
+    def notify(self):
+        """Wakes the poller right away; call after committing a change."""
+        self._wake.set()
+
+    def events_after(self, seq, timeout):
+        """Blocks up to timeout for events delivered after `seq`. Returns a (possibly empty) list,
+        or None when they have already left the in-memory backlog (replay() from the database)."""
+        self.start()
+        with self._cond:
+            if self.seq <= seq:
+                self._cond.wait(timeout)
+            if self._events and self._events[0]['seq'] > seq + 1:
+                return None
+            return [event for event in self._events if event['seq'] > seq]
+
+    def wake_subscribers(self):
+        """Returns every events_after() call early, e.g. so streams notice they are being closed."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def replay(self, after_id):
+        """Yields events for every change after a resume id, read from the change log a batch at a time."""
+        self.start()
+        with self._cond:
+            resume = self.resume_id
+        while True:
+            try:
+                batch = load_events(after_id, BATCH_SIZE)
+            finally:
+                db.release()  # a stream must not hold a pooled connection while it idles
+            for event in batch:
+                event['resume'] = min(event['id'], resume)
+                yield event
+            if len(batch) < BATCH_SIZE:
+                return
+            after_id = batch[-1]['id']
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            try:
+                events = load_events(self.latest_id, BATCH_SIZE)
+                late = load_missing_events(self._gaps) if self._gaps else []
+            except Exception as e:
+                print(f"Event broadcaster poll failed: {e}")
+                continue
+            finally:
+                # End the read snapshot; under REPEATABLE READ the next poll would not see new commits
+                db.release()
+            events = late + events
+            with self._cond:
+                self._track_gaps(events[len(late):], late)
+                resume = self.resume_id
+                for event in events:
+                    self.seq += 1
+                    event['seq'] = self.seq
+                    event['resume'] = min(event['id'], resume)
+                self._events.extend(events)
+                self._cond.notify_all()
+            if not events:
+                continue
+            for listener in event_listeners:
+                try:
+                    listener(events)
+                except Exception as e:
+                    print(f"Event listener failed: {e}")
+            if len(events) - len(late) == BATCH_SIZE:
+                self._wake.set()
+
+    def _track_gaps(self, events, late):
+        """Records the ids skipped over by a poll and clears those that turned up. Holds _cond."""
+        now = time.monotonic()
+        expected = self.latest_id + 1
+        for event in events:
+            if event['id'] - expected <= MAX_TRACKED_GAP:
+                self._gaps.update(dict.fromkeys(range(expected, event['id']), now))
+            expected = event['id'] + 1
+        if events:
+            self.latest_id = events[-1]['id']
+        for event in late:
+            self._gaps.pop(event['id'], None)
+        # Still missing after the grace period: rolled back, never coming
+        expired = [change_id for change_id, missed in self._gaps.items() if now - missed > CHANGE_GAP_GRACE_SECONDS]
+        for change_id in expired:
+            del self._gaps[change_id]
+
+
+def _select_changes(cursor, where, params):
+    cursor.execute(f"SELECT change_id, entity, entity_id, action FROM Changes WHERE {where}", params)
+    return cursor.fetchall()
+
+def load_events(after_id, limit):
+    """Builds SSE events for change log rows after after_id, in change_id order."""
+    cursor = db.get_cursor(dictionary=True)
+    try:
+        changes = _select_changes(cursor, "change_id > %s ORDER BY change_id LIMIT %s", (after_id, limit))
+        return build_events(cursor, changes)
+    finally:
+        cursor.close()
+
+def load_missing_events(change_ids):
+    """Events for those of the given change_ids that are visible now."""
+    cursor = db.get_cursor(dictionary=True)
+    try:
+        # One range scan rather than an IN list that can grow to MAX_TRACKED_GAP ids
+        changes = _select_changes(cursor, "change_id BETWEEN %s AND %s ORDER BY change_id",
+                                  (min(change_ids), max(change_ids)))
+        return build_events(cursor, [change for change in changes if change['change_id'] in change_ids])
+    finally:
+        cursor.close()
+
+def build_events(cursor, changes):
+    """SSE events for change rows.
+
+    Item and category events carry the row as the public listings show it. Claim events carry
+    only ids and status: claim rows include claimant emails, which the public stream must not leak.
+    """
+    if not changes:
+        return []
+
+    item_ids = list({c['entity_id'] for c in changes if c['entity'] == Change.ENTITIES['ITEM']})
+    items = {row['item_id']: row for row in fetch_items(cursor, item_ids)}
+
+    category_ids = list({c['entity_id'] for c in changes if c['entity'] == Change.ENTITIES['CATEGORY']})
+    categories = {}
+    if category_ids:
+        placeholders, params = in_list(category_ids)
+        cursor.execute(f"SELECT category_id, name FROM Categories WHERE category_id IN ({placeholders})", params)
+        categories = {row['category_id']: row for row in cursor.fetchall()}
+
+    claim_ids = list({c['entity_id'] for c in changes if c['entity'] == Change.ENTITIES['CLAIM']})
+    claims = {}
+    if claim_ids:
+        placeholders, params = in_list(claim_ids)
+        cursor.execute(f"SELECT claim_id, item_id, claim_status FROM Claims WHERE claim_id IN ({placeholders})",
+                       params)
+        claims = {row['claim_id']: row for row in cursor.fetchall()}
+
+    resources = {
+        Change.ENTITIES['ITEM']: items,
+        Change.ENTITIES['CATEGORY']: categories,
+        Change.ENTITIES['CLAIM']: claims,
+    }
+    return [{
+        'id': change['change_id'],
+        'event': f"{change['entity']}.{change['action']}",
+        'data': {
+            'entity': change['entity'],
+            'id': change['entity_id'],
+            'action': change['action'],
+            # Rows reflect the latest state, which may be newer than this particular change
+            'resource': resources[change['entity']].get(change['entity_id']),
+        },
+    } for change in changes]
+
+
+broadcaster = EventBroadcaster()
+register_after_fork(broadcaster.reset_after_fork)
+add_stream_close_listener(broadcaster.wake_subscribers)
+
+def notify_change():
+    """Call after commit so local SSE listeners hear about the write without waiting for a poll."""
+    broadcaster.notify()
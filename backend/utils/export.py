@@ -0,0 +1,112 @@
+# backend/utils/export.py
+# Bulk export for admins: rows streamed from an unbuffered cursor in fixed-size batches, so memory
+# stays flat however many rows match. Every export is ordered by its primary key; a client that
+# lost the connection resumes with ?after=<last key it received>.
+
+import csv
+import io
+import os
+from datetime import date, datetime
+
+from config.db_connector import db
+from models.claim_model import Claim
+from models.item_model import Item
+from models.notification_model import Notification
+from utils.json_provider import dumps
+from utils.resources import CLAIM_LISTING_QUERY, ITEM_LISTING_QUERY
+
+# Rows fetched from the server (and written to the client) per chunk
+EXPORT_BATCH_ROWS = int(os.getenv('EXPORT_BATCH_ROWS', 1000))
+
+FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+
+class Export:
+    """One exportable table: its SELECT (without WHERE) and the columns the filters apply to."""
+
+    def __init__(self, query, key, date_column, status_column, statuses, category_column=None):
+        self.query = query
+        self.key = key
+        self.date_column = date_column
+        self.status_column = status_column
+        self.statuses = set(statuses)
+        self.category_column = category_column
+
+    def build(self, after=0, date_from=None, date_to=None, status=None, category_id=None):
+        """(sql, params): rows with key > after matching the filters, in key order."""
+        conditions, params = [f"{self.key} > %s"], [after]
+        if date_from is not None:
+            conditions.append(f"{self.date_column} >= %s")
+            params.append(date_from)
+        if date_to is not None:
+            conditions.append(f"{self.date_column} < %s")
+            params.append(date_to)
+        if status is not None:
+            conditions.append(f"{self.status_column} = %s")
+            params.append(status)
+        if category_id is not None:
+            conditions.append(f"{self.category_column} = %s")
+            params.append(category_id)
+        return f"{self.query} WHERE {' AND '.join(conditions)} ORDER BY {self.key}", tuple(params)
+
+
+EXPORTS = {
+    'items': Export(ITEM_LISTING_QUERY, 'i.item_id', 'i.date_reported', 'i.status',
+                    Item.STATUSES.values(), category_column='i.category_id'),
+    'claims': Export(CLAIM_LISTING_QUERY, 'c.claim_id', 'c.claimed_at', 'c.claim_status',
+                     Claim.STATUSES.values(), category_column='i.category_id'),
+    'notifications': Export("""
+        SELECT n.notification_id, n.user_id, u.email, n.message, n.type, n.status, n.created_at
+        FROM Notifications n
+        JOIN Users u ON n.user_id = u.user_id
+    """, 'n.notification_id', 'n.created_at', 'n.status', Notification.STATUSES.values()),
+}
+
+
+def parse_date(value):
+    """ISO 8601 date or datetime from a query parameter; None when absent. Raises ValueError."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    # Stored timestamps are the server's local time without a zone
+    return parsed.astimezone().replace(tzinfo=None) if parsed.tzinfo else parsed
+
+def _csv_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+def ndjson_chunks(cursor):
+    while True:
+        rows = cursor.fetchmany(EXPORT_BATCH_ROWS)
+        if not rows:
+            return
+        yield b''.join(dumps(row) + b'\n' for row in rows)
+
+def csv_chunks(cursor):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(cursor.column_names)
+    while True:
+        rows = cursor.fetchmany(EXPORT_BATCH_ROWS)
+        if not rows:
+            break
+        writer.writerows([_csv_value(row[column]) for column in cursor.column_names] for row in rows)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')  # header only: nothing matched
+
+def stream_rows(cursor, fmt):
+    """Encodes an executed unbuffered dictionary cursor batch by batch, closing it when done."""
+    finished = False
+    try:
+        yield from (ndjson_chunks(cursor) if fmt == 'ndjson' else csv_chunks(cursor))
+        finished = True
+    finally:
+        if finished:
+            cursor.close()
+        else:
+            # Client went away with rows still unread; drop the connection rather than drain them
+            db.discard()
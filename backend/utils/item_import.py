@@ -0,0 +1,242 @@
+# backend/utils/item_import.py
+# Bulk item import for admins migrating existing registers. The upload is read line by line,
+# validated against cached category and user lookups, and inserted IMPORT_BATCH_ROWS at a time:
+# one multi-row INSERT and one commit per batch, so a bad row never costs more than its batch.
+
+import csv
+import json
+import os
+from datetime import datetime
+
+import mysql.connector
+
+from config.db_connector import db
+from models.change_model import Change
+from utils.changes import current_version, record_changes
+from utils.events import notify_change
+from utils.resources import in_list
+
+# Rows per executemany (one multi-row INSERT) and per transaction
+IMPORT_BATCH_ROWS = int(os.getenv('IMPORT_BATCH_ROWS', 1000))
+# Row errors listed in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+# claim_pending is left out: an imported item has no claim behind it
+IMPORTABLE_STATUSES = ('lost', 'found', 'resolved')
+MAX_TITLE_LENGTH = 100
+
+INSERT_ITEMS = """
+    INSERT INTO Items (reported_by, category_id, title, description, status, date_reported)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+
+def read_rows(stream, fmt):
+    """Yields (row number, record) from a CSV (header first) or NDJSON upload as it arrives.
+
+    The row number is the NDJSON line or the CSV record after the header; a record that cannot be
+    parsed is yielded as an error message string instead of a dict.
+    """
+    if fmt == 'csv':
+        lines = (line.decode('utf-8', errors='replace') for line in stream)
+        reader = csv.DictReader(lines)
+        if reader.fieldnames:
+            # A spreadsheet export often starts with a byte order mark
+            reader.fieldnames = [name.lstrip('\ufeff').strip().lower() for name in reader.fieldnames]
+        for number, record in enumerate(reader, start=1):
+            if None in record:
+                yield number, 'More fields than the header has columns.'
+            else:
+                yield number, record
+        return
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except (UnicodeDecodeError, ValueError) as e:
+            yield number, f'Invalid JSON: {e}'
+            continue
+        yield number, record if isinstance(record, dict) else 'Each line must be a JSON object.'
+
+
+def _text(record, key):
+    value = record.get(key)
+    if value is None:
+        return ''
+    return str(value).strip()
+
+def _optional_int(record, key):
+    value = _text(record, key)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{key} must be an integer.")
+
+
+class ItemImporter:
+    """Imports one upload. Columns: title, status, category (name) or category_id, optional
+    description, reporter_email or reported_by (defaults to the importing admin) and date_reported.
+    """
+
+    def __init__(self, cursor, default_reporter):
+        self.cursor = cursor
+        self.default_reporter = default_reporter
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+        self._categories_by_name = {}
+        self._category_ids = set()
+        self._users_by_email = {}
+        self._user_ids = {default_reporter}
+        self._checked_user_ids = {default_reporter}
+        self._now = datetime.now().replace(microsecond=0)
+
+    def run(self, rows):
+        self._load_categories()
+        batch = []
+        for number, record in rows:
+            if isinstance(record, str):
+                self._error(number, record)
+                continue
+            batch.append((number, record))
+            if len(batch) >= IMPORT_BATCH_ROWS:
+                self._import_batch(batch)
+                batch = []
+        if batch:
+            self._import_batch(batch)
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+            "version": current_version(self.cursor),
+        }
+
+    def _error(self, number, message):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": number, "error": message})
+
+    def _load_categories(self):
+        # Small table: read it once per import
+        self.cursor.execute("SELECT category_id, name FROM Categories")
+        for category_id, name in self.cursor.fetchall():
+            self._categories_by_name[name.lower()] = category_id
+            self._category_ids.add(category_id)
+
+    def _load_users(self, batch):
+        """Looks up the batch's reporters not seen yet, one query per kind of reference."""
+        emails = {_text(record, 'reporter_email').lower() for _, record in batch} - {''} - self._users_by_email.keys()
+        if emails:
+            placeholders, params = in_list(sorted(emails))
+            self.cursor.execute(f"SELECT user_id, email FROM Users WHERE email IN ({placeholders})", params)
+            for user_id, email in self.cursor.fetchall():
+                self._users_by_email[email.lower()] = user_id
+                self._user_ids.add(user_id)
+            for email in emails:
+                self._users_by_email.setdefault(email, None)  # cache misses too
+        ids = set()
+        for _, record in batch:
+            try:
+                ids.add(_optional_int(record, 'reported_by'))
+            except ValueError:
+                pass
+        ids = ids - {None} - self._checked_user_ids
+        if ids:
+            placeholders, params = in_list(sorted(ids))
+            self.cursor.execute(f"SELECT user_id FROM Users WHERE user_id IN ({placeholders})", params)
+            self._user_ids.update(row[0] for row in self.cursor.fetchall())
+            self._checked_user_ids.update(ids)
+
+    def _validate(self, record):
+        """Insert parameters for one record; ValueError with a message for the report otherwise."""
+        title = _text(record, 'title')
+        if not title:
+            raise ValueError("title is required.")
+        if len(title) > MAX_TITLE_LENGTH:
+            raise ValueError(f"title is longer than {MAX_TITLE_LENGTH} characters.")
+
+        status = _text(record, 'status').lower()
+        if status not in IMPORTABLE_STATUSES:
+            raise ValueError(f"status must be one of: {', '.join(IMPORTABLE_STATUSES)}.")
+
+        category_id = _optional_int(record, 'category_id')
+        if category_id is None:
+            name = _text(record, 'category')
+            if not name:
+                raise ValueError("category or category_id is required.")
+            category_id = self._categories_by_name.get(name.lower())
+            if category_id is None:
+                raise ValueError(f"Unknown category '{name}'.")
+        elif category_id not in self._category_ids:
+            raise ValueError(f"Unknown category_id {category_id}.")
+
+        email = _text(record, 'reporter_email').lower()
+        reporter = _optional_int(record, 'reported_by')
+        if email:
+            reporter = self._users_by_email.get(email)
+            if reporter is None:
+                raise ValueError(f"No user with email '{email}'.")
+        elif reporter is None:
+            reporter = self.default_reporter
+        elif reporter not in self._user_ids:
+            raise ValueError(f"No user with id {reporter}.")
+
+        date_reported = _text(record, 'date_reported')
+        if date_reported:
+            try:
+                date_reported = datetime.fromisoformat(date_reported)
+            except ValueError:
+                raise ValueError("date_reported must be an ISO 8601 date, e.g. 2024-05-01 or 2024-05-01 14:30.")
+            if date_reported.tzinfo:
+                date_reported = date_reported.astimezone().replace(tzinfo=None)
+        else:
+            # Every row names the column, so the default has to come from here rather than the table
+            date_reported = self._now
+
+        return reporter, category_id, title, _text(record, 'description') or None, status, date_reported
+
+    def _import_batch(self, batch):
+        self._load_users(batch)
+        values, numbers = [], []
+        for number, record in batch:
+            try:
+                values.append(self._validate(record))
+                numbers.append(number)
+            except ValueError as e:
+                self._error(number, str(e))
+        if not values:
+            return
+        try:
+            # One multi-row INSERT; its ids are one consecutive block starting at lastrowid
+            self.cursor.executemany(INSERT_ITEMS, values)
+            item_ids = list(range(self.cursor.lastrowid, self.cursor.lastrowid + len(values)))
+        except mysql.connector.Error:
+            db.conn.rollback()
+            item_ids, numbers = self._insert_rows(values, numbers)
+        try:
+            record_changes(self.cursor, Change.ENTITIES['ITEM'], item_ids, Change.ACTIONS['CREATED'])
+            db.conn.commit()
+        except mysql.connector.Error as err:
+            db.conn.rollback()
+            for number in numbers:
+                self._error(number, f"Batch not saved: {err}")
+            return
+        self.imported += len(item_ids)
+        if item_ids:
+            notify_change()
+
+    def _insert_rows(self, values, numbers):
+        """Slow path for a batch the database rejected: row by row, to find the rows at fault."""
+        item_ids, inserted = [], []
+        for params, number in zip(values, numbers):
+            try:
+                self.cursor.execute(INSERT_ITEMS, params)
+                item_ids.append(self.cursor.lastrowid)
+                inserted.append(number)
+            except mysql.connector.Error as err:
+                self._error(number, f"Database error: {err}")
+        return item_ids, inserted
@@ -0,0 +1,112 @@
+# backend/utils/item_indexes.py
+# In-memory indexes over the open (lost or found) items: match suggestions and duplicate detection.
+# They are filled from one query at startup and kept current from the change log, in every worker.
+
+import threading
+import time
+
+from config.db_connector import db
+from models.change_model import Change
+from utils.changes import current_version
+from utils.events import BATCH_SIZE, add_event_listener, broadcaster, load_events
+from utils.lifecycle import register_after_fork
+
+OPEN_ITEMS_QUERY = """
+    SELECT item_id, reported_by, category_id, title, description, status, date_reported
+    FROM Items WHERE status IN ('lost', 'found')
+"""
+
+class ItemIndexes:
+    """The process's item indexes, loaded at a change-log version and kept current from there.
+
+    An index is any object with rebuild(items), add(item) and remove(item_id), taking rows with
+    at least OPEN_ITEMS_QUERY's columns; add() must drop items that are no longer open.
+    """
+
+    def __init__(self):
+        self.indexes = []
+        self.version = 0
+        self._following = False
+        self._lock = threading.Lock()
+
+    def register(self, index):
+        self.indexes.append(index)
+        return index
+
+    def load(self):
+        started = time.perf_counter()
+        cursor = db.get_cursor(dictionary=True)
+        try:
+            # Version first: anything committed while the rows are read is replayed by follow()
+            version = current_version(cursor)
+            cursor.execute(OPEN_ITEMS_QUERY)
+            items = cursor.fetchall()
+        finally:
+            cursor.close()
+            db.release()
+        for index in self.indexes:
+            index.rebuild(items)
+        self.version = version  # where follow() catches up from
+        print(f"Item indexes: {len(items)} open items in {time.perf_counter() - started:.1f}s")
+
+    def follow(self):
+        """Catches up with the change log since load() and keeps following it via the broadcaster.
+        Called on first use in each worker process.
+
+        The poller is started first: it begins below any change that was still uncommitted then
+        and re-reads such gaps until they show up, so a change the catch-up read missed for
+        committing late still arrives through on_events().
+        """
+        if self._following:
+            return
+        with self._lock:
+            if self._following:
+                return
+            broadcaster.start()
+            after = self.version
+            while True:
+                events = load_events(after, BATCH_SIZE)
+                self._apply(events)
+                if len(events) < BATCH_SIZE:
+                    break
+                after = events[-1]['id']
+            self._following = True
+
+    def on_events(self, events):
+        """Event listener: the broadcaster's poller delivers every new change, from any worker,
+        including ones that committed after changes with higher ids."""
+        with self._lock:
+            if self._following:
+                self._apply(events)
+
+    def _apply(self, events):
+        # Each event carries the row as it is now, so replaying an event or applying events out of
+        # change_id order converges on the current state
+        for event in events:
+            data = event['data']
+            if data['entity'] == Change.ENTITIES['ITEM']:
+                if data['resource'] is None:
+                    self.remove_item(data['id'])
+                else:
+                    self.add_item(data['resource'])
+
+    def add_item(self, item):
+        """Indexes a row, e.g. one this process just committed, before the poller gets to it."""
+        for index in self.indexes:
+            index.add(item)
+
+    def remove_item(self, item_id):
+        for index in self.indexes:
+            index.remove(item_id)
+
+    def reset_after_fork(self):
+        # The indexes are inherited as they are; the child follows the change log from its own poller
+        self._following = False
+        self._lock = threading.Lock()
+
+item_indexes = ItemIndexes()
+register_after_fork(item_indexes.reset_after_fork)
+
+def init_item_indexes():
+    add_event_listener(item_indexes.on_events)
+    item_indexes.load()
@@ -0,0 +1,63 @@
+# backend/utils/json_provider.py
+
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib encoder produces the same output, only slower
+    orjson = None
+
+
+def _default(obj):
+    """Types neither encoder handles natively. Dates are ISO 8601 on both paths."""
+    if isinstance(obj, date):  # datetime included; only reached on the stdlib path
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode('utf-8')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(obj):
+    """Compact UTF-8 JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_body(obj):
+    """Response body as the API sends it (dumps plus a trailing newline, as jsonify does)."""
+    return dumps(obj) + b'\n'
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider on orjson: datetimes are encoded natively (as ISO 8601) instead of going
+    through a per-value Python fallback, and the body is built as bytes without a str round trip.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(json_body(obj), mimetype=self.mimetype)
+
+
+def init_json(app):
+    app.json = FastJSONProvider(app)
+    print(f"JSON encoder: {'orjson' if orjson is not None else 'stdlib json'}")
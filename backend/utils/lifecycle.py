@@ -0,0 +1,91 @@
+# backend/utils/lifecycle.py
+
+import os
+import threading
+import time
+
+from flask import g, request
+
+# Streams that would hold a drain open until the timeout; they are ended by close_streams() instead,
+# and their clients reconnect and resume elsewhere
+DRAIN_EXEMPT_ENDPOINTS = {'event_bp.stream_events'}
+
+# Called by close_streams(), e.g. to wake streams blocked waiting for data so they can end
+stream_close_listeners = []
+
+def add_stream_close_listener(listener):
+    stream_close_listeners.append(listener)
+
+
+def register_after_fork(fn):
+    """Runs fn in the child after os.fork(), e.g. to drop inherited connections, locks and threads.
+
+    Module-level singletons that own sockets, locks or threads register their reset here.
+    """
+    if hasattr(os, 'register_at_fork'):  # POSIX only; there is no fork on Windows
+        os.register_at_fork(after_in_child=fn)
+
+
+class Lifecycle:
+    """Worker readiness and in-flight request tracking for graceful shutdown.
+
+    Once draining, /readyz answers 503 so load balancers stop routing here, and the server waits
+    for in-flight requests to finish before the process exits.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.draining = False
+        self.streams_closed = False
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def init_app(self, app):
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+
+    def _before_request(self):
+        if request.endpoint in DRAIN_EXEMPT_ENDPOINTS:
+            return
+        g.lifecycle_tracked = True
+        with self._cond:
+            self.in_flight += 1
+
+    def _teardown_request(self, exc):
+        if not g.pop('lifecycle_tracked', False):
+            return
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def start_draining(self):
+        self.draining = True
+
+    def close_streams(self):
+        """Asks long-lived streams (DRAIN_EXEMPT_ENDPOINTS) to end; call once no longer accepting."""
+        self.streams_closed = True
+        for listener in stream_close_listeners:
+            listener()
+
+    def wait_drained(self, timeout):
+        """Blocks until no tracked request is in flight or timeout passes. Returns True if drained."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self.in_flight > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def reset_after_fork(self):
+        self._reset()
+
+
+lifecycle = Lifecycle()
+register_after_fork(lifecycle.reset_after_fork)
+
+def init_lifecycle(app):
+    lifecycle.init_app(app)
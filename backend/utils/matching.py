@@ -0,0 +1,229 @@
+# backend/utils/matching.py
+# Lost-to-found matching. Every open (lost or found) item is held in memory as a hashed TF-IDF
+# vector. An item's matches are the items of the opposite status scoring highest on text
+# similarity, same category and closeness in time, scored against all candidates at once with
+# NumPy. The index is built at startup and follows the change log from then on (utils.item_indexes).
+
+import math
+import os
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from utils.item_indexes import item_indexes
+
+# Hashed feature space per item (power of two); memory is 4 bytes x this x open items
+MATCH_DIMENSIONS = int(os.getenv('MATCH_DIMENSIONS', 256))
+# Reports this many days apart still get ~37% of the time-proximity score
+MATCH_TIME_SCALE_DAYS = float(os.getenv('MATCH_TIME_SCALE_DAYS', 14))
+# Candidates scoring below this are not suggested
+MATCH_MIN_SCORE = float(os.getenv('MATCH_MIN_SCORE', 0.3))
+TEXT_WEIGHT, CATEGORY_WEIGHT, TIME_WEIGHT = 0.7, 0.2, 0.1
+# Queries scored per matrix product in match_many(); bounds the (queries x items) score matrix
+QUERY_BATCH = 64
+
+# Open statuses and their counterpart: a lost item matches found ones and vice versa
+OPEN_STATUSES = {'lost': 0, 'found': 1}
+_DEAD = -1
+
+_WORD = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'at', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it', 'its', 'my', 'near',
+    'of', 'on', 'or', 'the', 'this', 'to', 'was', 'with', 'lost', 'found', 'left', 'someone',
+))
+
+
+def tokenize(title, description):
+    """Title words count twice: the title says what the item is, the description adds detail."""
+    def words(text):
+        return [word for word in _WORD.findall((text or '').lower()) if len(word) > 1 and word not in STOPWORDS]
+    return words(title) * 2 + words(description)
+
+def _days(value):
+    """Days since the epoch of a report date (a string on SQLite); now if it has none."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            value = None
+    if isinstance(value, datetime):
+        return value.timestamp() / 86400
+    return time.time() / 86400
+
+
+class MatchIndex:
+    """Open items as L2-normalised hashed TF-IDF rows of one float32 matrix, plus per-row
+    reporter, category, status and report day. Removed items leave a dead row until compaction.
+
+    IDF weights are fitted on the whole corpus by rebuild() and updated as items are added;
+    rows keep the weights they were vectorised with until the next rebuild.
+    """
+
+    def __init__(self, dimensions=MATCH_DIMENSIONS):
+        if dimensions & (dimensions - 1):
+            raise ValueError("MATCH_DIMENSIONS must be a power of two")
+        self.dimensions = dimensions
+        self._lock = threading.RLock()
+        self._clear(1024)
+
+    def _clear(self, capacity):
+        self._rows = {}       # item_id -> row
+        self._size = 0        # rows in use, dead ones included
+        self._df = Counter()  # documents per token
+        self._documents = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.vectors = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        self.item_ids = np.zeros(capacity, dtype=np.int64)
+        self.reporters = np.zeros(capacity, dtype=np.int64)
+        self.categories = np.zeros(capacity, dtype=np.int64)
+        self.statuses = np.full(capacity, _DEAD, dtype=np.int8)
+        self.days = np.zeros(capacity, dtype=np.float32)
+
+    def _resize(self, capacity):
+        """Copies the live rows into arrays of the given capacity (dropping dead rows)."""
+        live = sorted(self._rows.values())
+        old = (self.vectors, self.item_ids, self.reporters, self.categories, self.statuses, self.days)
+        self._allocate(capacity)
+        new = (self.vectors, self.item_ids, self.reporters, self.categories, self.statuses, self.days)
+        for source, target in zip(old, new):
+            target[:len(live)] = source[live]
+        self._rows = {int(item_id): row for row, item_id in enumerate(self.item_ids[:len(live)])}
+        self._size = len(live)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, item_id):
+        return item_id in self._rows
+
+    def _vectorize(self, tokens):
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        mask = self.dimensions - 1
+        for token, count in Counter(tokens).items():
+            digest = zlib.crc32(token.encode('utf-8'))  # stable across processes, unlike hash()
+            idf = math.log((1 + self._documents) / (1 + self._df[token])) + 1
+            # Signed hashing: colliding tokens cancel out on average instead of adding up
+            vector[digest & mask] += (1.0 if digest & 0x80000000 else -1.0) * (1 + math.log(count)) * idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def rebuild(self, items):
+        """Replaces the index with the given listing rows, fitting IDF on all of them first."""
+        items = [item for item in items if item['status'] in OPEN_STATUSES]
+        documents = [tokenize(item['title'], item.get('description')) for item in items]
+        with self._lock:
+            self._clear(max(1024, len(items) * 5 // 4))
+            for tokens in documents:
+                self._df.update(set(tokens))
+            self._documents = len(documents)
+            for item, tokens in zip(items, documents):
+                self._put(item, tokens)
+
+    def add(self, item):
+        """Adds or refreshes one item from its listing row; items no longer open are removed."""
+        with self._lock:
+            if item['status'] not in OPEN_STATUSES:
+                self.remove(item['item_id'])
+                return
+            tokens = tokenize(item['title'], item.get('description'))
+            if item['item_id'] not in self._rows:
+                self._df.update(set(tokens))
+                self._documents += 1
+            self._put(item, tokens)
+
+    def _put(self, item, tokens):
+        row = self._rows.get(item['item_id'])
+        if row is None:
+            if self._size == len(self.item_ids):
+                self._resize(max(1024, len(self._rows) * 2))
+            row = self._size
+            self._size += 1
+            self._rows[item['item_id']] = row
+        self.vectors[row] = self._vectorize(tokens)
+        self.item_ids[row] = item['item_id']
+        self.reporters[row] = item['reported_by']
+        self.categories[row] = item['category_id']
+        self.statuses[row] = OPEN_STATUSES[item['status']]
+        self.days[row] = _days(item.get('date_reported'))
+
+    def remove(self, item_id):
+        with self._lock:
+            row = self._rows.pop(item_id, None)
+            if row is None:
+                return
+            self.statuses[row] = _DEAD
+            self.vectors[row] = 0
+            if self._size > 4096 and len(self._rows) < self._size // 2:
+                self._resize(len(self._rows) * 2)
+
+    def matches(self, item_id, limit=10):
+        """[(item_id, score, text_similarity, same_category, days_apart)] best first, or None if
+        the item is not open."""
+        with self._lock:
+            row = self._rows.get(item_id)
+            if row is None:
+                return None
+            return self._score(np.array([row]), limit)[0]
+
+    def match_many(self, item_ids, limit=10):
+        """matches() for many items, QUERY_BATCH at a time; items not open map to None."""
+        results = {}
+        with self._lock:
+            rows = [(item_id, self._rows.get(item_id)) for item_id in item_ids]
+            for item_id, row in rows:
+                if row is None:
+                    results[item_id] = None
+            open_rows = [(item_id, row) for item_id, row in rows if row is not None]
+            for start in range(0, len(open_rows), QUERY_BATCH):
+                chunk = open_rows[start:start + QUERY_BATCH]
+                scored = self._score(np.array([row for _, row in chunk]), limit)
+                results.update((item_id, matches) for (item_id, _), matches in zip(chunk, scored))
+        return results
+
+    def _score(self, rows, limit):
+        n = self._size
+        # (queries x items) for every feature at once, float32 and in place: at 100k items this is
+        # memory bound, so every temporary avoided counts
+        text = self.vectors[rows] @ self.vectors[:n].T
+        days_apart = np.abs(self.days[rows][:, None] - self.days[:n][None, :])
+        scores = np.multiply(days_apart, np.float32(-1 / MATCH_TIME_SCALE_DAYS))
+        np.exp(scores, out=scores)
+        scores *= np.float32(TIME_WEIGHT)
+        scores += np.float32(TEXT_WEIGHT) * text
+        same_category = self.categories[rows][:, None] == self.categories[:n][None, :]
+        np.add(scores, np.float32(CATEGORY_WEIGHT), out=scores, where=same_category)
+        # Counterparts only (dead rows are nobody's counterpart), never the same reporter, some shared words
+        counterparts = np.stack([self.statuses[:n] == 1, self.statuses[:n] == 0])
+        eligible = counterparts[self.statuses[rows]]
+        eligible &= self.reporters[:n][None, :] != self.reporters[rows][:, None]
+        eligible &= text > 0
+        np.copyto(scores, np.float32(-1), where=~eligible)
+
+        results = []
+        k = min(limit, n)
+        for q in range(len(rows)):
+            if k == 0:
+                results.append([])
+                continue
+            top = np.argpartition(-scores[q], k - 1)[:k]
+            top = top[np.argsort(-scores[q][top])]
+            results.append([
+                (int(self.item_ids[c]), round(float(scores[q, c]), 4), round(float(text[q, c]), 4),
+                 bool(same_category[q, c]), round(float(days_apart[q, c]), 1))
+                for c in top if scores[q, c] >= MATCH_MIN_SCORE
+            ])
+        return results
+
+
+match_index = item_indexes.register(MatchIndex())
+
+def find_matches(item_id, limit=10):
+    item_indexes.follow()
+    return match_index.matches(item_id, limit)
@@ -0,0 +1,170 @@
+# backend/utils/metrics.py
+
+import threading
+import time
+
+from flask import g, request
+
+from config.db_connector import add_query_observer
+from utils.lifecycle import register_after_fork
+
+# Histogram bucket upper bounds (Prometheus "le" labels); +Inf is implied
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+DB_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+RESPONSE_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+PREFIX = 'back2u'
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus layout. Not thread-safe; guarded by Metrics."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name, labels):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{_labels(labels, le=bound)} {cumulative}')
+        lines.append(f'{name}_sum{_labels(labels)} {self.sum:.6f}')
+        lines.append(f'{name}_count{_labels(labels)} {self.count}')
+        return lines
+
+
+class Metrics:
+    """Per-worker request metrics, keyed by Flask endpoint (blueprint route) and method.
+
+    Each request records its latency, response size and how many statements it ran against the
+    database and for how long, so a route whose query count grows with its data (an N+1) shows up
+    next to its p99.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._requests = {}      # (endpoint, method, status) -> count
+        self._latency = {}       # (endpoint, method) -> Histogram
+        self._queries = {}       # (endpoint, method) -> Histogram of statements per request
+        self._db_time = {}       # (endpoint, method) -> Histogram of database seconds per request
+        self._response_size = {} # (endpoint, method) -> Histogram of body bytes
+        self._local = threading.local()
+
+    def init_app(self, app):
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        add_query_observer(self._on_query)
+
+    def reset_after_fork(self):
+        # Each worker reports its own requests
+        self._reset()
+
+    def _before_request(self):
+        g.metrics_started = time.perf_counter()
+        self._local.queries = 0
+        self._local.db_time = 0.0
+        self._local.active = True
+
+    def _on_query(self, statement, params, seconds, cursor):
+        # Statements run outside a request (pollers, startup) are not attributed to any route
+        if getattr(self._local, 'active', False):
+            self._local.queries += 1
+            self._local.db_time += seconds
+
+    def _after_request(self, response):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        self._local.active = False
+        # Streamed bodies (SSE) have no size up front; their latency is time to first byte
+        size = None if response.is_streamed else response.calculate_content_length()
+        self.record(request.endpoint or 'unmatched', request.method, response.status_code,
+                    elapsed, self._local.queries, self._local.db_time, size)
+        return response
+
+    def record(self, endpoint, method, status, elapsed, queries, db_time, size=None):
+        key = (endpoint, method)
+        with self._lock:
+            self._requests[key + (status,)] = self._requests.get(key + (status,), 0) + 1
+            _histogram(self._latency, key, LATENCY_BUCKETS).observe(elapsed)
+            _histogram(self._queries, key, QUERY_COUNT_BUCKETS).observe(queries)
+            _histogram(self._db_time, key, DB_TIME_BUCKETS).observe(db_time)
+            if size is not None:
+                _histogram(self._response_size, key, RESPONSE_SIZE_BUCKETS).observe(size)
+
+    def render(self, extra=None):
+        """Prometheus text exposition (format 0.0.4)."""
+        lines = []
+        with self._lock:
+            lines += _header('http_requests_total', 'counter', 'Requests served, by route, method and status.')
+            for (endpoint, method, status), count in sorted(self._requests.items()):
+                lines.append(f'{PREFIX}_http_requests_total'
+                             f'{_labels({"endpoint": endpoint, "method": method, "status": status})} {count}')
+            for name, kind, help_text, histograms in (
+                ('http_request_duration_seconds', 'histogram', 'Request latency.', self._latency),
+                ('db_queries_per_request', 'histogram', 'Database statements executed per request.', self._queries),
+                ('db_seconds_per_request', 'histogram', 'Time spent in database statements per request.', self._db_time),
+                ('http_response_size_bytes', 'histogram', 'Response body size (non-streamed responses).', self._response_size),
+            ):
+                lines += _header(name, kind, help_text)
+                for (endpoint, method), histogram in sorted(histograms.items()):
+                    lines += histogram.render(f'{PREFIX}_{name}', {'endpoint': endpoint, 'method': method})
+        lines += extra or []
+        return '\n'.join(lines) + '\n'
+
+
+def _histogram(histograms, key, buckets):
+    histogram = histograms.get(key)
+    if histogram is None:
+        histogram = histograms[key] = Histogram(buckets)
+    return histogram
+
+def _header(name, kind, help_text):
+    return [f'# HELP {PREFIX}_{name} {help_text}', f'# TYPE {PREFIX}_{name} {kind}']
+
+def _labels(labels, **extra):
+    labels = {**labels, **extra}
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in labels.values())
+    return '{' + ','.join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + '}'
+
+def render_admission(snapshot):
+    """Prometheus lines for the rate limiter's AdmissionController.snapshot()."""
+    lines = _header('admission_admitted_total', 'counter', 'Requests admitted past the concurrency cap.')
+    lines.append(f'{PREFIX}_admission_admitted_total {snapshot["admitted"]}')
+    lines += _header('admission_rejected_total', 'counter', 'Requests shed with 503 because the server was at capacity.')
+    lines.append(f'{PREFIX}_admission_rejected_total {snapshot["rejected_overload"]}')
+    lines += _header('admission_in_flight', 'gauge', 'Requests currently holding an admission slot.')
+    lines.append(f'{PREFIX}_admission_in_flight {snapshot["in_flight"]}')
+    lines += _header('admission_max_concurrent', 'gauge', 'Admission slots per worker.')
+    lines.append(f'{PREFIX}_admission_max_concurrent {snapshot["max_concurrent"]}')
+    lines += _header('rate_limited_total', 'counter', 'Requests refused with 429, by route class.')
+    for route_class, count in sorted(snapshot['rate_limited'].items()):
+        lines.append(f'{PREFIX}_rate_limited_total{_labels({"class": route_class})} {count}')
+    return lines
+
+
+metrics = Metrics()
+register_after_fork(metrics.reset_after_fork)
+
+def init_metrics(app):
+    metrics.init_app(app)
@@ -1,6 +1,8 @@
 # backend/utils/notification.py
 
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
@@ -52,7 +54,9 @@ def send_email(recipient_email, subject, body):
 
     try:
         server = smtplib.SMTP(os.getenv('EMAIL_HOST'), int(os.getenv('EMAIL_PORT', 587)))
-        server.starttls()  
+        # EMAIL_USE_TLS=0 only for a local relay or test sink that does not offer STARTTLS
+        if os.getenv('EMAIL_USE_TLS', '1') == '1':
+            server.starttls()
         server.login(os.getenv('EMAIL_USER'), os.getenv('EMAIL_PASS'))
         server.sendmail(sender_email, recipient_email, msg.as_string())
         server.quit()
@@ -66,6 +70,9 @@ def send_email(recipient_email, subject, body):
             f.write(f"{error_msg}\n")
         return False
 
+# Wakes long-polling inbox requests in this process when a notification is inserted
+_inbox_condition = threading.Condition()
+
 def insert_notification(user_id, message, notification_type):
     """Logs the notification in the database."""
     cursor = db.get_cursor()
@@ -73,6 +80,28 @@ def insert_notification(user_id, message, notification_type):
     cursor.execute(query, (user_id, message, notification_type, Notification.STATUSES['SENT']))
     db.conn.commit()
     cursor.close()
+    with _inbox_condition:
+        _inbox_condition.notify_all()
+
+def wait_for_notifications(check, timeout, recheck_interval=2.0):
+    """Long-poll helper: calls check() until it returns something truthy or timeout expires.
+
+    Inserts from this process wake the waiter at once; recheck_interval bounds the delay for
+    inserts made by other worker processes. The thread's pooled connections are returned before
+    every wait, so waiters do not hold the pool; each check() starts from a fresh snapshot.
+    """
+    deadline = time.monotonic() + timeout
+    db.release()
+    result = check()
+    while not result:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        db.release()
+        with _inbox_condition:
+            _inbox_condition.wait(min(recheck_interval, remaining))
+        result = check()
+    return result
 
 def send_claim_resolved_emails(item_id, claimant_id, admin_id):
     """Sends resolution emails to both the reporter and the claimant."""
@@ -0,0 +1,85 @@
+# backend/utils/query_log.py
+
+import os
+import re
+import threading
+import traceback
+from datetime import datetime
+
+from config.db_connector import db, add_query_observer
+
+# Statements slower than this are logged; 0 logs everything, a negative value disables the log
+SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', 200))
+SLOW_QUERY_LOG = os.getenv('SLOW_QUERY_LOG', 'slow_query.log')
+# 1 = also record EXPLAIN for slow SELECT/UPDATE/DELETE statements
+SLOW_QUERY_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', '0') == '1'
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SKIP_FILES = (os.path.join('config', 'db_connector.py'), os.path.join('utils', 'query_log.py'))
+_EXPLAINABLE = re.compile(r'^\s*(SELECT|UPDATE|DELETE)\b', re.IGNORECASE)
+_write_lock = threading.Lock()
+
+
+def param_shape(params):
+    """Describes parameters by type only, e.g. "(int, str, None)"; values never reach the log."""
+    if params is None:
+        return '()'
+    if isinstance(params, dict):
+        return '{' + ', '.join(f'{key}: {_type_name(value)}' for key, value in params.items()) + '}'
+    if isinstance(params, list) and params and isinstance(params[0], (tuple, list, dict)):
+        # executemany: one shape for the batch
+        return f'{len(params)} x {param_shape(params[0])}'
+    return '(' + ', '.join(_type_name(value) for value in params) + ')'
+
+def _type_name(value):
+    return 'None' if value is None else type(value).__name__
+
+def call_site():
+    """First frame outside the database layer, as "routes/item_routes.py:57 in get_all_items"."""
+    for frame in reversed(traceback.extract_stack()):
+        if frame.filename.endswith(_SKIP_FILES):
+            continue
+        filename = frame.filename
+        if filename.startswith(_BACKEND_DIR):
+            filename = os.path.relpath(filename, _BACKEND_DIR)
+        return f'{filename}:{frame.lineno} in {frame.name}'
+    return 'unknown'
+
+def _normalize(statement):
+    return ' '.join(statement.split())
+
+def _explain(statement, params):
+    # A raw cursor on the same connection, so the EXPLAIN itself is not observed
+    cursor = db.conn.cursor(dictionary=True, buffered=True)
+    try:
+        cursor.execute('EXPLAIN ' + statement, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+def log_slow_query(statement, params, seconds, cursor):
+    """Query observer: appends statements over SLOW_QUERY_MS to SLOW_QUERY_LOG."""
+    elapsed_ms = seconds * 1000
+    if elapsed_ms < SLOW_QUERY_MS:
+        return
+    lines = [
+        f"[{datetime.now().isoformat(timespec='seconds')}] {elapsed_ms:.1f} ms, "
+        f"rows={cursor.rowcount}, params={param_shape(params)}, at {call_site()}",
+        f"    {_normalize(statement)}",
+    ]
+    if SLOW_QUERY_EXPLAIN and _EXPLAINABLE.match(statement) and not isinstance(params, list):
+        try:
+            for row in _explain(statement, params):
+                lines.append('    EXPLAIN ' + ', '.join(f'{key}={value}' for key, value in row.items()))
+        except Exception as e:
+            lines.append(f'    EXPLAIN failed: {e}')
+    with _write_lock:
+        with open(SLOW_QUERY_LOG, 'a') as f:
+            f.write('\n'.join(lines) + '\n')
+
+def init_slow_query_log():
+    if SLOW_QUERY_MS < 0:
+        return
+    add_query_observer(log_slow_query)
+    print(f"Slow query log: statements over {SLOW_QUERY_MS:g} ms -> {SLOW_QUERY_LOG}"
+          f"{' (with EXPLAIN)' if SLOW_QUERY_EXPLAIN else ''}")
@@ -0,0 +1,212 @@
+# backend/utils/rate_limit.py
+
+import hashlib
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import g, request, jsonify
+
+from utils.lifecycle import register_after_fork
+
+# Route class -> (bucket capacity, tokens refilled per second), per client.
+# Override with e.g. RATE_LIMIT_AUTH="10,0.2".
+DEFAULT_LIMITS = {
+    'auth': (10, 0.2),      # login/signup burn bcrypt: 10 burst, then 12 per minute
+    'search': (20, 2.0),    # ?search= is a full LIKE scan
+    'write': (30, 1.0),
+    'default': (120, 20.0),
+}
+# Requests processed at once per worker, kept below what the database can serve; the rest are shed
+MAX_CONCURRENT_REQUESTS = int(os.getenv('MAX_CONCURRENT_REQUESTS', 32))
+# How long a request may wait for a free slot before being shed
+ADMISSION_WAIT_SECONDS = float(os.getenv('ADMISSION_WAIT_SECONDS', 0.05))
+# Only trust X-Forwarded-For when running behind a proxy that sets it
+TRUST_PROXY = os.getenv('RATE_LIMIT_TRUST_PROXY', '0') == '1'
+
+# Long-lived requests that would otherwise hold an admission slot for minutes
+UNLIMITED_ENDPOINTS = {'event_bp.stream_events', 'healthz', 'readyz'}
+# Rate limited, but exempt from the concurrency cap while long-polling (?wait=)
+LONG_POLL_ENDPOINTS = {'notification_bp.list_notifications'}
+
+def _load_limits():
+    limits = dict(DEFAULT_LIMITS)
+    for route_class in limits:
+        value = os.getenv(f'RATE_LIMIT_{route_class.upper()}')
+        if value:
+            capacity, refill = value.split(',')
+            limits[route_class] = (float(capacity), float(refill))
+    return limits
+
+
+class MemoryBackend:
+    """Token buckets in this process. Each worker enforces its own budget."""
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self.reset_after_fork()
+
+    def reset_after_fork(self):
+        self._buckets = OrderedDict()  # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, refill_rate):
+        """Takes one token. Returns (allowed, retry_after_seconds)."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, 0 if allowed else math.ceil((1 - tokens) / refill_rate)
+
+
+class RedisBackend:
+    """Token buckets in Redis, shared by every worker and host. Needs the optional `redis` package."""
+
+    # Refill and take atomically on the server
+    SCRIPT = """
+        local capacity = tonumber(ARGV[1])
+        local rate = tonumber(ARGV[2])
+        local now = tonumber(ARGV[3])
+        local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+        local tokens = tonumber(bucket[1]) or capacity
+        local ts = tonumber(bucket[2]) or now
+        tokens = math.min(capacity, tokens + (now - ts) * rate)
+        local allowed = 0
+        if tokens >= 1 then
+            tokens = tokens - 1
+            allowed = 1
+        end
+        redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+        redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+        return {allowed, tostring(tokens)}
+    """
+
+    def __init__(self, url):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package") from e
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    def take(self, key, capacity, refill_rate):
+        allowed, tokens = self._script(keys=[f"ratelimit:{key}"], args=[capacity, refill_rate, time.time()])
+        if allowed:
+            return True, 0
+        return False, math.ceil((1 - float(tokens)) / refill_rate)
+
+
+def make_backend():
+    backend = os.getenv('RATE_LIMIT_BACKEND', 'memory')
+    if backend == 'redis':
+        return RedisBackend(os.getenv('RATE_LIMIT_REDIS_URL', 'redis://localhost:6379/0'))
+    return MemoryBackend()
+
+
+class AdmissionController:
+    """Per-client token-bucket rate limiting plus a global concurrency cap for the Flask app."""
+
+    def __init__(self, backend=None, limits=None, max_concurrent=MAX_CONCURRENT_REQUESTS,
+                 admission_wait=ADMISSION_WAIT_SECONDS):
+        self.backend = backend or make_backend()
+        self.limits = limits or _load_limits()
+        self.max_concurrent = max_concurrent
+        self.admission_wait = admission_wait
+        self._reset()
+
+    def _reset(self):
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._metrics_lock = threading.Lock()
+        self.metrics = {'admitted': 0, 'rejected_overload': 0, 'in_flight': 0,
+                        'rate_limited': {route_class: 0 for route_class in self.limits}}
+
+    def reset_after_fork(self):
+        # Slots and counters are per worker process
+        self._reset()
+        if hasattr(self.backend, 'reset_after_fork'):
+            self.backend.reset_after_fork()
+
+    def init_app(self, app):
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+
+    def _before_request(self):
+        if request.endpoint in UNLIMITED_ENDPOINTS or request.method == 'OPTIONS':
+            return None
+
+        route_class = classify_request()
+        capacity, refill_rate = self.limits[route_class]
+        allowed, retry_after = self.backend.take(f"{route_class}:{client_key()}", capacity, refill_rate)
+        if not allowed:
+            self._count_rate_limited(route_class)
+            return _reject(429, 'Too many requests, slow down.', retry_after)
+
+        if request.endpoint in LONG_POLL_ENDPOINTS and request.args.get('wait'):
+            return None
+        if not self._slots.acquire(timeout=self.admission_wait):
+            self._count('rejected_overload')
+            return _reject(503, 'Server is busy, please retry shortly.', 1)
+        g.admission_slot = True
+        with self._metrics_lock:
+            self.metrics['admitted'] += 1
+            self.metrics['in_flight'] += 1
+        return None
+
+    def _teardown_request(self, exc):
+        if g.pop('admission_slot', False):
+            with self._metrics_lock:
+                self.metrics['in_flight'] -= 1
+            self._slots.release()
+
+    def _count(self, key):
+        with self._metrics_lock:
+            self.metrics[key] += 1
+
+    def _count_rate_limited(self, route_class):
+        with self._metrics_lock:
+            self.metrics['rate_limited'][route_class] += 1
+
+    def snapshot(self):
+        with self._metrics_lock:
+            return {**self.metrics, 'rate_limited': dict(self.metrics['rate_limited']),
+                    'max_concurrent': self.max_concurrent}
+
+
+def classify_request():
+    """Maps the current request to a budget: auth, search, write or default."""
+    if request.blueprint == 'auth_bp' and request.endpoint != 'auth_bp.logout':
+        return 'auth'
+    if request.endpoint == 'item_bp.get_all_items' and request.args.get('search', '').strip():
+        return 'search'
+    if request.method in ('POST', 'PUT', 'PATCH', 'DELETE'):
+        return 'write'
+    return 'default'
+
+def client_key():
+    """Client identity for rate limiting: the caller's address (first X-Forwarded-For hop behind a trusted proxy)."""
+    address = request.remote_addr or 'unknown'
+    if TRUST_PROXY and request.headers.get('X-Forwarded-For'):
+        address = request.headers['X-Forwarded-For'].split(',')[0].strip()
+    return hashlib.sha1(address.encode('utf-8')).hexdigest()[:16]
+
+def _reject(status, message, retry_after):
+    response = jsonify({'error': message})
+    response.status_code = status
+    response.headers['Retry-After'] = str(max(1, int(retry_after)))
+    return response
+
+
+admission = AdmissionController()
+register_after_fork(admission.reset_after_fork)
+
+def init_rate_limiting(app):
+    admission.init_app(app)
@@ -0,0 +1,64 @@
+# backend/utils/read_routing.py
+
+import os
+import re
+import threading
+import time
+
+from flask import request
+
+from config.db_connector import db, add_query_observer
+
+# After a client writes, its reads stay on the primary this long; keep it above REPLICA_MAX_LAG_SECONDS
+REPLICA_STICKY_SECONDS = float(os.getenv('REPLICA_STICKY_SECONDS', 5))
+# Response header carrying the sticky deadline (unix time); clients echo it back on later requests
+STICKY_HEADER = 'X-Primary-Until'
+
+_READ_STATEMENT = re.compile(r'^\s*(SELECT|SHOW|EXPLAIN)\b', re.IGNORECASE)
+
+
+class ReadRouting:
+    """Read-your-writes for replica reads.
+
+    A request that writes is pinned to the primary from that point on, and its response carries
+    X-Primary-Until. A client that sends the header back before that time is read from the primary
+    in whichever worker serves it, so it never sees a replica that hasn't caught up with its write.
+    """
+
+    def __init__(self, sticky_seconds=REPLICA_STICKY_SECONDS):
+        self.sticky_seconds = sticky_seconds
+        self._local = threading.local()
+
+    def init_app(self, app):
+        if not db.replicas:
+            return
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        add_query_observer(self._on_query)
+        print(f"Read replicas: {', '.join(replica.name for replica in db.replicas)}")
+
+    def _before_request(self):
+        self._local.wrote = False
+        try:
+            primary_until = float(request.headers.get(STICKY_HEADER, 0))
+        except ValueError:
+            primary_until = 0
+        if primary_until > time.time():
+            db.pin_primary()
+
+    def _on_query(self, statement, params, seconds, cursor):
+        if not _READ_STATEMENT.match(statement):
+            self._local.wrote = True
+            db.pin_primary()
+
+    def _after_request(self, response):
+        if getattr(self._local, 'wrote', False):
+            response.headers[STICKY_HEADER] = f"{time.time() + self.sticky_seconds:.3f}"
+            self._local.wrote = False
+        return response
+
+
+read_routing = ReadRouting()
+
+def init_read_routing(app):
+    read_routing.init_app(app)
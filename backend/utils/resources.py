@@ -0,0 +1,85 @@
+# backend/utils/resources.py
+# Canonical row shapes shared by listings, write responses and change feeds, so a client can
+# drop a row returned by any of them straight into a list it got from another.
+
+ITEM_LISTING_QUERY = """
+    SELECT i.*, u.name AS reporter_name, c.name AS category_name
+    FROM Items i
+    JOIN Users u ON i.reported_by = u.user_id
+    JOIN Categories c ON i.category_id = c.category_id
+"""
+
+LISTED_STATUSES = ['lost', 'found']
+
+def _build_listing_query(include_resolved, by_status, by_search):
+    query = ITEM_LISTING_QUERY + (" WHERE i.status IN (%s, %s, %s)" if include_resolved else " WHERE i.status IN (%s, %s)")
+    if by_status:
+        query += " AND i.status = %s"
+    if by_search:
+        query += " AND (i.title LIKE %s OR i.description LIKE %s)"
+    return query
+
+# Every public listing variant built once, so each is one fixed statement text (and one prepared plan)
+LISTING_QUERIES = {
+    (include_resolved, by_status, by_search): _build_listing_query(include_resolved, by_status, by_search)
+    for include_resolved in (False, True) for by_status in (False, True) for by_search in (False, True)
+}
+
+def listing_query(status_filter, search_query, include_resolved):
+    """(sql, params) for the public item listing, shared by the Flask and asyncio read paths."""
+    allowed_statuses = LISTED_STATUSES + ['resolved'] if include_resolved else LISTED_STATUSES
+    by_status = status_filter in allowed_statuses
+    params = allowed_statuses[:]
+    if by_status:
+        params.append(status_filter)
+    if search_query:
+        like_pattern = f"%{search_query}%"
+        params.extend([like_pattern, like_pattern])
+    return LISTING_QUERIES[(include_resolved, by_status, bool(search_query))], tuple(params)
+
+CATEGORY_LISTING_QUERY = "SELECT category_id, name FROM Categories ORDER BY name ASC"
+
+CLAIM_LISTING_QUERY = """
+    SELECT
+        c.claim_id, c.claim_status, c.claimed_at, c.verification_details,
+        i.item_id, i.title AS item_title, i.status AS item_status, i.reported_by,
+        u_claim.name AS claimant_name, u_claim.email AS claimant_email
+    FROM Claims c
+    JOIN Items i ON c.item_id = i.item_id
+    JOIN Users u_claim ON c.claimant_id = u_claim.user_id
+"""
+
+def in_list(values):
+    """Placeholders and params for a non-empty `IN (...)` list, padded to the next power of two by
+    repeating the last value, so lists of 3..4, 5..8, ... ids share one statement (and one prepared plan).
+    """
+    values = list(values)
+    size = 1
+    while size < len(values):
+        size *= 2
+    params = values + values[-1:] * (size - len(values))
+    return ','.join(['%s'] * size), tuple(params)
+
+def fetch_items(cursor, item_ids):
+    """Listing rows for the given ids (dictionary cursor). Missing ids are simply absent."""
+    if not item_ids:
+        return []
+    placeholders, params = in_list(item_ids)
+    cursor.execute(ITEM_LISTING_QUERY + f" WHERE i.item_id IN ({placeholders})", params)
+    return cursor.fetchall()
+
+def fetch_item(cursor, item_id):
+    rows = fetch_items(cursor, [item_id])
+    return rows[0] if rows else None
+
+def fetch_claims(cursor, claim_ids):
+    """Claim rows as the admin listing shows them (dictionary cursor)."""
+    if not claim_ids:
+        return []
+    placeholders, params = in_list(claim_ids)
+    cursor.execute(CLAIM_LISTING_QUERY + f" WHERE c.claim_id IN ({placeholders})", params)
+    return cursor.fetchall()
+
+def fetch_claim(cursor, claim_id):
+    rows = fetch_claims(cursor, [claim_id])
+    return rows[0] if rows else None
@@ -1,59 +1,286 @@
 # backend/utils/security.py
+import hashlib
 import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
 from functools import wraps
 from flask import request, jsonify
 import jwt
 import bcrypt
 
+from utils.lifecycle import register_after_fork
+
 # --- Secret Key ---
 SECRET_KEY = os.getenv('SECRET_KEY', 'default-secret-key')
 
+# --- Token settings ---
+TOKEN_TTL_SECONDS = int(os.getenv('TOKEN_TTL_SECONDS', 8 * 3600))
+TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', 10000))
+DENYLIST_SYNC_SECONDS = int(os.getenv('DENYLIST_SYNC_SECONDS', 30))
+
+# --- Password hashing settings ---
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
+# bcrypt releases the GIL, so each worker can keep one core busy
+PASSWORD_WORKERS = int(os.getenv('PASSWORD_WORKERS', os.cpu_count() or 2))
+PASSWORD_QUEUE_LIMIT = int(os.getenv('PASSWORD_QUEUE_LIMIT', PASSWORD_WORKERS * 4))
+PASSWORD_TIMEOUT_SECONDS = float(os.getenv('PASSWORD_TIMEOUT_SECONDS', 5))
+
+class PasswordPoolSaturated(Exception):
+    """Raised when the bcrypt pool and its queue are full; callers should answer 503."""
+
+    def __init__(self, retry_after=1):
+        super().__init__("Password hashing capacity exhausted")
+        self.retry_after = retry_after
+
+class PasswordPool:
+    """Dedicated, bounded executor for bcrypt work.
+
+    Request threads hand hashing off here and wait; once PASSWORD_WORKERS are busy and
+    PASSWORD_QUEUE_LIMIT more are queued, new work is refused immediately instead of piling up,
+    so a login storm sheds load rather than tying up every request thread on CPU.
+    """
+
+    def __init__(self, workers=PASSWORD_WORKERS, queue_limit=PASSWORD_QUEUE_LIMIT,
+                 timeout=PASSWORD_TIMEOUT_SECONDS):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._start()
+
+    def _start(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='bcrypt')
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_limit)
+
+    def reset_after_fork(self):
+        # The parent's worker threads do not exist in the child
+        self._start()
+
+    def run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolSaturated(retry_after=self._retry_after())
+        try:
+            future = self._executor.submit(fn, *args)
+        except RuntimeError:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise PasswordPoolSaturated(retry_after=self._retry_after())
+
+    def _retry_after(self):
+        # Roughly how long the queue ahead would take to drain at ~0.25s per hash
+        return max(1, int((self.workers + self.queue_limit) * 0.25 / self.workers))
+
+password_pool = PasswordPool()
+register_after_fork(password_pool.reset_after_fork)
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+def _check(password, hashed_password):
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
 def hash_password(password):
-    """Hash a password using bcrypt."""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    """Hash a password using bcrypt at BCRYPT_ROUNDS, on the password pool."""
+    return password_pool.run(_hash, password, BCRYPT_ROUNDS)
 
 def verify_password(password, hashed_password):
-    """Verify a password against a hashed password using bcrypt."""
-    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+    """Verify a password against a hashed password using bcrypt, on the password pool."""
+    return password_pool.run(_check, password, hashed_password)
+
+def needs_rehash(hashed_password):
+    """True when a stored hash was made with a different cost than BCRYPT_ROUNDS."""
+    try:
+        return int(hashed_password.split('$')[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+def password_pool_busy_response(error):
+    """503 with Retry-After for a PasswordPoolSaturated error."""
+    response = jsonify({'error': 'Server is busy, please retry shortly.'})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
 
 def encode_auth_token(user_id, role):
-    """Generate a JWT token for authentication."""
+    """Generate a JWT token for authentication, valid for TOKEN_TTL_SECONDS."""
     try:
-        payload = {'user_id': user_id, 'role': role}
+        now = int(time.time())
+        payload = {
+            'user_id': user_id,
+            'role': role,
+            'iat': now,
+            'exp': now + TOKEN_TTL_SECONDS,
+            'jti': uuid.uuid4().hex,  # identifies the token for revocation
+        }
         return jwt.encode(payload, SECRET_KEY, algorithm='HS256')
     except Exception as e:
         return str(e)
 
-# --- Authentication Decorator ---
-def token_required(f):
-    """Decorator to require a valid JWT token."""
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        token = request.headers.get('Authorization')
-        if not token or not token.startswith('Bearer '):
-            return jsonify({'error': 'Token is missing or invalid!'}), 401
+# --- Verified-token cache ---
+class VerifiedTokenCache:
+    """Bounded LRU of already-verified tokens, keyed by a SHA-256 digest of the token.
 
-        token = token.split(' ')[1]
+    Lets hot endpoints skip the HMAC verification and JSON decoding of tokens seen before. Entries
+    are only served until the token's own exp, so the cache never extends a token's lifetime.
+    """
 
+    def __init__(self, max_size=TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest):
+        with self._lock:
+            claims = self._entries.get(digest)
+            if claims is None:
+                return None
+            if claims['exp'] <= time.time():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return claims
+
+    def put(self, digest, claims):
+        with self._lock:
+            self._entries[digest] = claims
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def reset_after_fork(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+# --- Revocation denylist ---
+class TokenDenylist:
+    """In-memory set of revoked token ids (jti), re-synced from RevokedTokens every
+    DENYLIST_SYNC_SECONDS so revocations made by other workers take effect within that window.
+    """
+
+    def __init__(self, sync_seconds=DENYLIST_SYNC_SECONDS):
+        self.sync_seconds = sync_seconds
+        self._revoked = {}  # jti -> expires_at (unix time)
+        self._synced_at = None  # never; monotonic time starts near 0 at boot, so 0.0 would not do
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def is_revoked(self, jti):
+        if self._synced_at is None or time.monotonic() - self._synced_at > self.sync_seconds:
+            self.sync()
+        return jti in self._revoked
+
+    def revoke(self, jti, user_id, expires_at):
+        # Imported here: config.db_connector imports this module
+        from config.db_connector import db
+        cursor = db.get_cursor()
+        try:
+            cursor.execute("INSERT IGNORE INTO RevokedTokens (jti, user_id, expires_at) VALUES (%s, %s, %s)",
+                           (jti, user_id, _to_datetime(expires_at)))
+            db.conn.commit()
+        finally:
+            cursor.close()
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def reset_after_fork(self):
+        # Fresh locks (another thread may have held them at fork) and a sync on first use
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._synced_at = None
+
+    def sync(self):
+        # One thread refreshes; the others keep using the current set meanwhile
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        # Stamped up front so a failing database is retried once per interval, not per request
+        self._synced_at = time.monotonic()
+        try:
+            from config.db_connector import db
+            cursor = db.get_cursor()
+            try:
+                cursor.execute("SELECT jti, expires_at FROM RevokedTokens WHERE expires_at > %s",
+                               (_to_datetime(time.time()),))
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+            revoked = {jti: expires_at.replace(tzinfo=timezone.utc).timestamp() for jti, expires_at in rows}
+            with self._lock:
+                self._revoked = revoked
+        except Exception as e:
+            print(f"Token denylist sync failed: {e}")
+        finally:
+            self._sync_lock.release()
+
+def _to_datetime(timestamp):
+    # RevokedTokens stores naive UTC
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None)
+
+token_cache = VerifiedTokenCache()
+token_denylist = TokenDenylist()
+register_after_fork(token_cache.reset_after_fork)
+register_after_fork(token_denylist.reset_after_fork)
+
+def revoke_token(claims):
+    """Revokes a decoded token (e.g. on logout) until its natural expiry."""
+    token_denylist.revoke(claims['jti'], claims.get('user_id'), claims['exp'])
+
+def _authenticate():
+    """Verifies the bearer token and attaches user info to request. Returns an error response or None."""
+    token = request.headers.get('Authorization')
+    if not token or not token.startswith('Bearer '):
+        return jsonify({'error': 'Token is missing or invalid!'}), 401
+
+    token = token.split(' ')[1]
+    digest = hashlib.sha256(token.encode('utf-8')).digest()
+    claims = token_cache.get(digest)
+    if claims is None:
         try:
-            # Decode token and attach user info to request
-            data = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-            request.user_id = data['user_id']
-            request.user_role = data['role']
+            claims = jwt.decode(token, SECRET_KEY, algorithms=["HS256"],
+                                options={'require': ['exp', 'iat', 'jti']})
         except jwt.ExpiredSignatureError:
             return jsonify({'error': 'Token has expired!'}), 401
         except jwt.InvalidTokenError:
             return jsonify({'error': 'Token is invalid!'}), 401
-            
+        token_cache.put(digest, claims)
+
+    if token_denylist.is_revoked(claims['jti']):
+        return jsonify({'error': 'Token has been revoked!'}), 401
+
+    request.user_id = claims['user_id']
+    request.user_role = claims['role']
+    request.token_claims = claims
+    return None
+
+# --- Authentication Decorator ---
+def token_required(f):
+    """Decorator to require a valid JWT token."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        error = _authenticate()
+        if error is not None:
+            return error
         return f(*args, **kwargs)
     return decorated
 
 def admin_required(f):
     """Decorator to require admin role."""
     @wraps(f)
-    @token_required
     def decorated(*args, **kwargs):
+        error = _authenticate()
+        if error is not None:
+            return error
         if request.user_role != 'admin':
             return jsonify({'error': 'Admin access required!'}), 403
         return f(*args, **kwargs)
-    return decorated
\ No newline at end of file
+    return decorated
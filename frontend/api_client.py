@@ -1,93 +1,156 @@
 # frontend/api_client.py
 
+import os
+
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import brotli  # noqa: F401  urllib3 decodes br responses when it is installed
+except ImportError:
+    brotli = None
 
 API_BASE_URL = "http://127.0.0.1:5000/api"
-TOKEN = None
-USER_ROLE = None
-
-def set_auth(token, role):
-    global TOKEN, USER_ROLE
-    TOKEN = token
-    USER_ROLE = (role or "").strip().lower()
-
-def get_headers():
-    headers = {"Content-Type": "application/json"}
-    if TOKEN:
-        headers["Authorization"] = f"Bearer {TOKEN}"
-    return headers
-
-def login_user(email, password):
-    url = f"{API_BASE_URL}/auth/login"
-    data = {"email": email, "password": password}
-    try:
-        response = requests.post(url, json=data)
-        if response.status_code == 200:
-            result = response.json()
-            set_auth(result['token'], result['role'])
-            return result
-        return {"error": response.json().get('error', 'Login failed.')}
-    except requests.exceptions.RequestException as e:
-        return {"error": f"Network error: {e}"}
-
-def signup_user(name, email, password, role="student"):
-    url = f"{API_BASE_URL}/auth/signup"
-    data = {"name": name, "email": email, "password": password, "role": role}
-    try:
-        response = requests.post(url, json=data)
-        if response.status_code == 201:
-            return response.json()
-        return {"error": response.json().get('error', 'Signup failed.')}
-    except requests.exceptions.RequestException as e:
-        return {"error": f"Network error: {e}"}
-
-def get_items(status=None, search=None, include_resolved=False):
-    url = f"{API_BASE_URL}/items"
-    params = []
-    if status:
-        params.append(f"status={status}")
-    if search:
-        params.append(f"search={search}")
-    if include_resolved:
-        params.append("include_resolved=true")
-    if params:
-        url += "?" + "&".join(params)
-    try:
-        response = requests.get(url, headers=get_headers())
-        if response.status_code == 200:
-            return response.json()
-        return []
-    except requests.exceptions.RequestException:
-        return []
-
-def claim_item_api(item_id, verification_details):
-    url = f"{API_BASE_URL}/items/{item_id}/claim"
-    data = {"verification_details": verification_details}
-    try:
-        response = requests.post(url, json=data, headers=get_headers())
-        if response.status_code == 201:
-            return response.json()
-        return {"error": response.json().get('error', 'Claim failed.')}
-    except requests.exceptions.RequestException as e:
-        return {"error": f"Network error: {e}"}
-
-def get_categories():
-    # Attempt to fetch categories from backend; return an empty list if unavailable
-    url = f"{API_BASE_URL}/categories"
-    try:
-        response = requests.get(url, headers=get_headers())
-        if response.status_code == 200:
-            return response.json()
-        return []
-    except requests.exceptions.RequestException:
-        return []
-
-def report_item_api(report_data):
-    url = f"{API_BASE_URL}/items"
+
+# One pooled transport shared by every session in the process. Identity lives on the
+# per-session ApiClient and is sent as a header, never stored on the transport.
+_http = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=int(os.getenv('API_POOL_SIZE', 32)))
+_http.mount("http://", _adapter)
+_http.mount("https://", _adapter)
+# Large listings come back compressed; offer br only when urllib3 can decode it
+_http.headers["Accept-Encoding"] = "br, gzip, deflate" if brotli is not None else "gzip, deflate"
+
+
+class ApiClient:
+    """API access for one Flet session (one browser tab). Holds that session's token and role."""
+
+    def __init__(self):
+        self.token = None
+        self.role = None
+        # Read-your-writes: echoed back so the API reads from the primary until replicas caught up
+        self.primary_until = None
+        # Called after a request was refused with 401 (token expired or revoked) and the token dropped
+        self.on_unauthorized = None
+
+    def set_auth(self, token, role):
+        self.token = token
+        self.role = (role or "").strip().lower()
+
+    def get_headers(self):
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if self.primary_until:
+            headers["X-Primary-Until"] = self.primary_until
+        return headers
+
+    def request(self, method, path, **kwargs):
+        """Raw request on the shared transport with this session's auth headers."""
+        headers = self.get_headers()
+        headers.update(kwargs.pop('headers', None) or {})
+        response = _http.request(method, f"{API_BASE_URL}{path}", headers=headers, **kwargs)
+        self.primary_until = response.headers.get("X-Primary-Until", self.primary_until)
+        if response.status_code == 401 and self.token:
+            # The session is over server-side; stop sending the token and let the UI ask for a login
+            self.set_auth(None, None)
+            if self.on_unauthorized:
+                self.on_unauthorized()
+        return response
+
+    def login_user(self, email, password):
+        data = {"email": email, "password": password}
+        try:
+            response = self.request("POST", "/auth/login", json=data)
+            if response.status_code == 200:
+                result = response.json()
+                self.set_auth(result['token'], result['role'])
+                return result
+            return {"error": response.json().get('error', 'Login failed.')}
+        except requests.exceptions.RequestException as e:
+            return {"error": f"Network error: {e}"}
+
+    def logout_user(self):
+        """Revokes the token server-side (best effort) and forgets it locally."""
+        if self.token:
+            try:
+                self.request("POST", "/auth/logout")
+            except requests.exceptions.RequestException:
+                pass
+        self.set_auth(None, None)
+
+    def signup_user(self, name, email, password, role="student"):
+        data = {"name": name, "email": email, "password": password, "role": role}
+        try:
+            response = self.request("POST", "/auth/signup", json=data)
+            if response.status_code == 201:
+                return response.json()
+            return {"error": response.json().get('error', 'Signup failed.')}
+        except requests.exceptions.RequestException as e:
+            return {"error": f"Network error: {e}"}
+
+    def get_items(self, status=None, search=None, include_resolved=False, with_version=False):
+        """Item listing; with_version=True returns (items, change version) for use with get_item_changes."""
+        params = {}
+        if status:
+            params["status"] = status
+        if search:
+            params["search"] = search
+        if include_resolved:
+            params["include_resolved"] = "true"
+        items, version = [], None
+        try:
+            response = self.request("GET", "/items", params=params)
+            if response.status_code == 200:
+                items = response.json()
+                version = parse_version(response.headers.get('X-Change-Version'))
+        except requests.exceptions.RequestException:
+            pass
+        return (items, version) if with_version else items
+
+    def get_item_changes(self, since):
+        """Delta since a change version: {version, has_more, items, removed}, or None on failure."""
+        try:
+            response = self.request("GET", "/items/changes", params={"since": since})
+            if response.status_code == 200:
+                return response.json()
+            return None
+        except (requests.exceptions.RequestException, ValueError):
+            return None
+
+    def claim_item_api(self, item_id, verification_details):
+        data = {"verification_details": verification_details}
+        try:
+            response = self.request("POST", f"/items/{item_id}/claim", json=data)
+            if response.status_code == 201:
+                return response.json()
+            return {"error": response.json().get('error', 'Claim failed.')}
+        except requests.exceptions.RequestException as e:
+            return {"error": f"Network error: {e}"}
+
+    def report_item_api(self, report_data):
+        try:
+            response = self.request("POST", "/items", json=report_data)
+            if response.status_code == 201:
+                return response.json()
+            return {"error": response.json().get('error', 'Report failed.')}
+        except requests.exceptions.RequestException:
+            return {"error": "Network error or API offline."}
+
+
+def parse_version(header):
+    """Change version from an X-Change-Version header; None if it is missing or malformed, in which
+    case the caller has no version to take deltas from and must reload in full."""
     try:
-        response = requests.post(url, json=report_data, headers=get_headers())
-        if response.status_code == 201:
-            return response.json()
-        return {"error": response.json().get('error', 'Report failed.')}
-    except requests.exceptions.RequestException:
-        return {"error": "Network error or API offline."}
\ No newline at end of file
+        return int(header)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_client(page):
+    """Returns the ApiClient for this page's session, creating it on first use."""
+    client = getattr(page, "api", None)
+    if client is None:
+        client = ApiClient()
+        page.api = client
+    return client
@@ -0,0 +1 @@
+# Frontend benchmarks package
@@ -0,0 +1,110 @@
+# frontend/benchmarks/session_memory.py
+"""Load test: memory cost of each additional Flet session in one process.
+
+Simulates N concurrent browser sessions (page + ApiClient + SubscriptionManager + the state a
+logged-in user holds) against a stub API server, then reports the traced memory per session and
+how many category fetches actually reached the server.
+
+    python -m frontend.benchmarks.session_memory --sessions 50 100 200
+"""
+
+import argparse
+import gc
+import json
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from frontend import api_client
+from frontend.api_client import get_client
+from frontend.category_store import category_store
+from frontend.subscriptions import get_subscriptions
+
+ITEMS = [{"item_id": i, "title": f"Item {i}", "status": "found", "description": "x" * 120,
+          "reporter_name": "Reporter", "category_name": "Other"} for i in range(50)]
+CATEGORIES = [{"category_id": i, "name": f"Category {i}"} for i in range(5)]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    hits = {}
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        _StubHandler.hits[path] = _StubHandler.hits.get(path, 0) + 1
+        body = json.dumps(CATEGORIES if path.endswith('/categories') else ITEMS).encode()
+        self._send(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._send(json.dumps({"token": "t", "role": "student", "user_id": 1}).encode())
+
+    def _send(self, body):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _FakePubSub:
+    def subscribe(self, handler):
+        pass
+
+    def send_all(self, message):
+        pass
+
+
+class _FakePage:
+    def __init__(self):
+        self.pubsub = _FakePubSub()
+
+
+def _open_session():
+    page = _FakePage()
+    api = get_client(page)
+    subscriptions = get_subscriptions(page)
+    api.login_user("user@example.com", "secret")
+    page.items = api.get_items(include_resolved=True)
+    page.categories = category_store.get()
+    subscriptions.subscribe(page, ("items", "items/*"), lambda events: None, coalesce=True)
+    return page
+
+
+def measure(count):
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        sessions = list(pool.map(lambda _: _open_session(), range(count)))
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sessions
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[50, 100, 200])
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_client.API_BASE_URL = f"http://127.0.0.1:{server.server_port}/api"
+
+    _open_session()  # warm up imports and the connection pool
+    print(f"{'sessions':>10} {'total KiB':>12} {'KiB/session':>12} {'category GETs':>14}")
+    for count in args.sessions:
+        _StubHandler.hits.clear()
+        total = measure(count)
+        category_hits = _StubHandler.hits.get('/api/categories', 0)
+        print(f"{count:>10} {total / 1024:>12.1f} {total / 1024 / count:>12.2f} {category_hits:>14}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# frontend/category_store.py
+
+import threading
+import time
+
+import requests
+
+from frontend import api_client
+
+
+class CategoryStore:
+    """Process-wide category list shared by every session and view.
+
+    Loads once, then revalidates with a conditional GET (If-None-Match) so an unchanged list costs
+    a 304 and no re-render. The list object is updated in place, so holders of `get()` see changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._categories = []
+        self._etag = None
+        self._loaded = False
+        self._validated_at = 0.0
+        self.version = 0  # bumped whenever the list actually changes
+
+    def get(self):
+        """Returns the cached list; only the very first call in the process hits the network."""
+        if not self._loaded:
+            self.revalidate()
+        return self._categories
+
+    def revalidate(self, max_age=0.0):
+        """Conditional GET against the API. Returns True when the list changed.
+
+        max_age skips the request if another session already revalidated that recently, which
+        collapses the fan-out when one 'categories' broadcast reaches every session at once.
+        """
+        with self._lock:
+            if self._loaded and time.monotonic() - self._validated_at < max_age:
+                return False
+            headers = {"If-None-Match": self._etag} if self._etag else {}
+            try:
+                response = api_client._http.get(f"{api_client.API_BASE_URL}/categories", headers=headers)
+            except requests.exceptions.RequestException:
+                return False
+            self._validated_at = time.monotonic()
+            if response.status_code == 304:
+                return False
+            if response.status_code != 200:
+                return False
+            try:
+                categories = response.json()
+            except ValueError:
+                return False
+            self._etag = response.headers.get("ETag")
+            self._loaded = True
+            if categories == self._categories:
+                return False
+            self._categories[:] = categories
+            self.version += 1
+            return True
+
+    def apply_changes(self, upserts, removed_ids):
+        """Patches the list from a server delta (e.g. /admin/changes) without a full refetch."""
+        with self._lock:
+            by_id = {c['category_id']: c for c in self._categories}
+            for category_id in removed_ids:
+                by_id.pop(category_id, None)
+            for category in upserts:
+                by_id[category['category_id']] = category
+            # Same ordering as the API (ORDER BY name)
+            self._categories[:] = sorted(by_id.values(), key=lambda c: c['name'])
+            self.version += 1
+
+    def warm(self):
+        """Loads in the background so the first Report form opens without waiting."""
+        threading.Thread(target=self.revalidate, daemon=True).start()
+
+
+category_store = CategoryStore()
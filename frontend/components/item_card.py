@@ -1,7 +1,8 @@
 # frontend/components/item_card.py
 
 import flet as ft
-from frontend.api_client import claim_item_api
+from frontend.api_client import get_client
+from frontend.subscriptions import get_subscriptions
 
 class ItemCard(ft.Card):
     def __init__(self, item_data, page):
@@ -22,11 +23,12 @@ class ItemCard(ft.Card):
                 self.page.show_snack_bar(ft.SnackBar(ft.Text("Please provide verification details.")))
                 self.page.update()
                 return
-            result = claim_item_api(self.item['item_id'], details)
+            result = get_client(self.page).claim_item_api(self.item['item_id'], details)
             if 'error' in result:
                 self.page.show_snack_bar(ft.SnackBar(ft.Text(f"Claim failed: {result['error']}")))
             else:
                 self.page.show_snack_bar(ft.SnackBar(ft.Text("Claim submitted successfully!")))
+                get_subscriptions(self.page).publish_local(f"items/{self.item['item_id']}", result.get('item'))
             self.page.update()
             close_dialog(e)
 
@@ -46,6 +48,11 @@ class ItemCard(ft.Card):
         self.page.dialog.open = True
         self.page.update()
     
+    def update_item(self, fields):
+        """Applies changed fields and re-renders this card only."""
+        self.item.update(fields)
+        self.content = self._build_content()
+
     def _build_content(self):
         status_value = (self.item.get('status') or '').lower()
         status_color = ft.colors.GREEN_700 if status_value == 'found' else ft.colors.RED_700
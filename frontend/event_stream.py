@@ -0,0 +1,116 @@
+# frontend/event_stream.py
+
+import json
+import threading
+
+import requests
+
+from frontend.api_client import get_client
+from frontend.subscriptions import get_subscriptions
+
+# Server change entity -> local pubsub topic
+ENTITY_TOPICS = {
+    "item": lambda entity_id: f"items/{entity_id}",
+    "claim": lambda entity_id: "claims",
+    "category": lambda entity_id: "categories",
+}
+
+
+def parse_sse(lines):
+    """Yields (event_id, event_type, data) from an iterable of decoded SSE lines."""
+    event_id, event_type, data = None, "message", []
+    for line in lines:
+        if line is None:
+            continue
+        if line == "":
+            if data:
+                yield event_id, event_type, "\n".join(data)
+            event_id, event_type, data = None, "message", []
+        elif line.startswith(":"):
+            continue
+        else:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "id":
+                event_id = value
+            elif field == "event":
+                event_type = value
+            elif field == "data":
+                data.append(value)
+
+
+class EventStream:
+    """One SSE connection to /api/events per session.
+
+    Server events are delivered to this page's subscribers only (publish_local), so a change made
+    in another process or on another Flet server reaches every open view without polling.
+    Reconnects resume from the last event id seen. Only the current connection is kept open:
+    the previous response is closed before a reconnect, and stop() closes the current one.
+    """
+
+    def __init__(self, page, reconnect_delay=3.0):
+        self.page = page
+        self.reconnect_delay = reconnect_delay
+        self.last_event_id = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._response = None  # the open stream; closed from stop() to end a blocked read
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="event-stream", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._close_response()
+
+    def _open(self, response):
+        """Makes response the current stream, closing and dropping the previous one first."""
+        self._close_response()
+        with self._lock:
+            self._response = response
+        if self._stop.is_set():  # stop() ran before the response was registered
+            self._close_response()
+
+    def _close_response(self):
+        with self._lock:
+            response, self._response = self._response, None
+        if response is not None:
+            response.close()
+
+    def _run(self):
+        api = get_client(self.page)
+        subscriptions = get_subscriptions(self.page)
+        while not self._stop.is_set():
+            headers = {"Accept": "text/event-stream"}
+            if self.last_event_id is not None:
+                headers["Last-Event-ID"] = self.last_event_id
+            try:
+                # Read timeout comfortably above the server's 15s keepalive
+                with api.request("GET", "/events", headers=headers, stream=True, timeout=(5, 45)) as response:
+                    self._open(response)
+                    if response.status_code != 200:
+                        raise requests.exceptions.RequestException(f"HTTP {response.status_code}")
+                    for event_id, event_type, data in parse_sse(response.iter_lines(decode_unicode=True)):
+                        if self._stop.is_set():
+                            return
+                        self._dispatch(subscriptions, data)
+                        if event_id is not None:
+                            self.last_event_id = event_id
+            except (requests.exceptions.RequestException, OSError, AttributeError, ValueError):
+                # Also what a read raises once stop() closed the response under it
+                pass
+            finally:
+                self._close_response()
+            self._stop.wait(self.reconnect_delay)
+
+    def _dispatch(self, subscriptions, data):
+        try:
+            change = json.loads(data)
+        except ValueError:
+            return
+        topic = ENTITY_TOPICS.get(change.get("entity"))
+        if topic is not None:
+            subscriptions.publish_local(topic(change.get("id")), change.get("resource"))
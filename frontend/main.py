@@ -4,17 +4,21 @@ import sys
 sys.path.insert(0, '..')
 
 import flet as ft
-from frontend.api_client import set_auth, TOKEN as API_TOKEN, USER_ROLE as API_USER_ROLE
+from frontend.api_client import get_client
+from frontend.category_store import category_store
 from frontend.views.login_view import LoginView
 from frontend.views.signup_view import SignupView
 from frontend.views.home_view import HomeView
 from frontend.views.report_item_view import ReportItemView
 from frontend.views.admin_dashboard import AdminDashboard
-
-# Global State
-app_state = {"token": None, "role": None}
+from frontend.subscriptions import get_subscriptions
+from frontend.event_stream import EventStream
 
 def main(page: ft.Page):
+    # Per-session state: every browser session gets its own page, API client and identity
+    app_state = {"token": None, "role": None}
+    api = get_client(page)
+
     page.title = "Back2U - Lost and Found Management System"
     page.theme_mode = ft.ThemeMode.DARK 
     page.padding = 0
@@ -22,7 +26,25 @@ def main(page: ft.Page):
     # App-wide pubsub for simple cross-view notifications (e.g., refresh items)
     if not hasattr(page, "pubsub"):
         page.pubsub = ft.PubSub()
+    subscriptions = get_subscriptions(page)
+    # Server-side changes from any process arrive over one SSE connection per session
+    event_stream = EventStream(page)
+    event_stream.start()
+
+    def on_disconnect(e):
+        event_stream.stop()
+        subscriptions.unsubscribe_all()
+    page.on_disconnect = on_disconnect
     
+    def on_unauthorized():
+        # A request came back 401: the token expired or was revoked, and the client already dropped it
+        app_state["token"] = None
+        app_state["role"] = None
+        page.snack_bar = ft.SnackBar(content=ft.Text("Your session has expired. Please log in again."), bgcolor=ft.colors.RED_400)
+        page.snack_bar.open = True
+        page.go("/login")
+    api.on_unauthorized = on_unauthorized
+
     # --- Theme Mode Toggle ---
     def toggle_theme(e):
         page.theme_mode = ft.ThemeMode.LIGHT if page.theme_mode == ft.ThemeMode.DARK else ft.ThemeMode.DARK
@@ -31,15 +53,15 @@ def main(page: ft.Page):
         
     # --- Navbar ---
     def create_navbar():
-        effective_token = app_state["token"] or API_TOKEN
-        effective_role = (app_state["role"] or API_USER_ROLE or "").lower()
+        effective_token = app_state["token"] or api.token
+        effective_role = (app_state["role"] or api.role or "").lower()
         is_logged_in = effective_token is not None
         is_admin = effective_role == "admin"
         
         def logout(e):
             app_state["token"] = None
             app_state["role"] = None
-            set_auth(None, None)  # Clear API client token
+            api.logout_user()  # Revoke and clear API client token
             # Notify and force UI refresh
             page.snack_bar = ft.SnackBar(content=ft.Text("Logged out"))
             page.snack_bar.open = True
@@ -119,6 +141,9 @@ def main(page: ft.Page):
 
     # --- Routing Logic ---
     def route_change(route):
+        # Release subscriptions held by the views being replaced
+        for control in page.controls:
+            subscriptions.unsubscribe(control)
         page.controls.clear()
 
         # Add navbar
@@ -141,8 +166,8 @@ def main(page: ft.Page):
                 page.go("/login")
                 return  # Prevent further execution
         elif page.route == "/admin":
-            effective_token = app_state["token"] or API_TOKEN
-            effective_role = (app_state["role"] or API_USER_ROLE or "").lower()
+            effective_token = app_state["token"] or api.token
+            effective_role = (app_state["role"] or api.role or "").lower()
             if effective_token and effective_role == "admin":
                 page.controls.append(AdminDashboard(page))
             elif effective_token:
@@ -167,4 +192,5 @@ def main(page: ft.Page):
     page.go(page.route)
 
 if __name__ == "__main__":
+    category_store.warm()
     ft.app(target=main, view=ft.WEB_BROWSER)
\ No newline at end of file
@@ -0,0 +1,114 @@
+# frontend/subscriptions.py
+
+import threading
+
+# Older broadcast messages that are still sent as plain strings map onto topics
+LEGACY_TOPICS = {
+    "refresh_items": "items",
+    "refresh_categories": "categories",
+}
+
+
+def topic_matches(pattern, topic):
+    """Exact match, or a trailing '/*' wildcard matching any child topic (e.g. 'items/*' matches 'items/42')."""
+    if pattern == topic:
+        return True
+    if pattern.endswith("/*"):
+        return topic.startswith(pattern[:-1])
+    return False
+
+
+class SubscriptionManager:
+    """Per-page registry that ties pubsub handlers to the lifetime of the view that owns them.
+
+    Flet's PubSub only lets a session unsubscribe all of its handlers at once, so the manager
+    registers a single dispatcher per page and fans messages out to the live owners itself.
+    Handlers always receive a list of (topic, payload) events; with coalesce=True a burst of
+    messages arriving within `coalesce_delay` seconds is delivered as one call.
+    """
+
+    def __init__(self, page, coalesce_delay=0.15):
+        self.page = page
+        self.coalesce_delay = coalesce_delay
+        self._lock = threading.Lock()
+        self._subscriptions = []  # [(owner, patterns, handler, coalesce)]
+        self._pending = {}  # (id(owner), patterns) -> [events]
+        self._timers = {}
+        page.pubsub.subscribe(self._on_message)
+
+    def subscribe(self, owner, patterns, handler, coalesce=False):
+        """Registers handler for one topic pattern or a tuple of them (coalesced together)."""
+        if isinstance(patterns, str):
+            patterns = (patterns,)
+        with self._lock:
+            self._subscriptions.append((owner, tuple(patterns), handler, coalesce))
+
+    def unsubscribe(self, owner):
+        """Drops every handler registered by owner, including reloads that are still pending."""
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s[0] is not owner]
+            for key in [k for k in self._timers if k[0] == id(owner)]:
+                self._timers.pop(key).cancel()
+                self._pending.pop(key, None)
+
+    def unsubscribe_all(self):
+        with self._lock:
+            self._subscriptions = []
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+            self._pending.clear()
+
+    def publish_local(self, topic, payload=None):
+        """Delivers to this page's subscribers only."""
+        self.deliver(topic, payload)
+
+    def _on_message(self, message):
+        if isinstance(message, tuple) and len(message) == 2:
+            topic, payload = message
+        elif isinstance(message, str):
+            topic, payload = LEGACY_TOPICS.get(message, message), None
+        else:
+            return
+        self.deliver(topic, payload)
+
+    def deliver(self, topic, payload=None):
+        immediate = []
+        with self._lock:
+            for owner, patterns, handler, coalesce in self._subscriptions:
+                if not any(topic_matches(p, topic) for p in patterns):
+                    continue
+                if not coalesce:
+                    immediate.append(handler)
+                    continue
+                key = (id(owner), patterns)
+                self._pending.setdefault(key, []).append((topic, payload))
+                if key not in self._timers:
+                    timer = threading.Timer(self.coalesce_delay, self._flush, args=(key, handler))
+                    timer.daemon = True
+                    self._timers[key] = timer
+                    timer.start()
+        for handler in immediate:
+            self._call(handler, [(topic, payload)])
+
+    def _flush(self, key, handler):
+        with self._lock:
+            self._timers.pop(key, None)
+            events = self._pending.pop(key, None)
+        if events:
+            self._call(handler, events)
+
+    def _call(self, handler, events):
+        try:
+            handler(events)
+        except Exception as e:
+            print(f"Error in pubsub handler: {e}")
+
+
+def get_subscriptions(page):
+    """Returns the page's SubscriptionManager, creating it on first use."""
+    manager = getattr(page, "subscriptions", None)
+    if manager is None:
+        manager = SubscriptionManager(page)
+        page.subscriptions = manager
+    return manager
@@ -1,13 +1,16 @@
 # frontend/views/admin_dashboard.py
 
 import flet as ft
-from frontend.api_client import get_headers, API_BASE_URL
+from frontend.api_client import get_client, parse_version
+from frontend.category_store import category_store
+from frontend.subscriptions import get_subscriptions
 import requests
 
 class AdminDashboard(ft.Container):
     def __init__(self, page: ft.Page):
         super().__init__(expand=True, padding=20)
         self.page = page
+        self.api = get_client(page)
         self.claims_data_table = ft.DataTable(columns=[
             ft.DataColumn(ft.Text("Claim ID")),
             ft.DataColumn(ft.Text("Item Title")),
@@ -15,22 +18,29 @@ class AdminDashboard(ft.Container):
             ft.DataColumn(ft.Text("Verification Details")),
             ft.DataColumn(ft.Text("Actions")),
         ], rows=[])
+        self.claim_rows = {}  # claim_id -> DataRow currently in the table
+        self.version = None  # change version the tables reflect; deltas are fetched from here
         # Categories management controls
         self.category_name_input = ft.TextField(label="New category name", width=300)
         self.categories_list = ft.ListView(expand=True, spacing=5, padding=10)
+        self.category_rows = {}  # category_id -> (render key, row control)
         self.edit_mode = None  # Track which category is being edited
         
         self.message_text = ft.Text("", color=ft.colors.RED_500)
         self.content = self._build_ui()
         self._load_pending_claims()
         self._load_categories()
+        get_subscriptions(page).subscribe(self, "categories", self._on_categories_changed, coalesce=True)
+        # Claims filed or resolved elsewhere arrive over the event stream
+        get_subscriptions(page).subscribe(self, "claims", lambda events: self._on_claims_changed(), coalesce=True)
 
     def _load_pending_claims(self, e=None):
+        """Full reload; used on open and by the Refresh button. Clicks patch rows via _reconcile."""
         self.claims_data_table.rows.clear()
+        self.claim_rows.clear()
         
         try:
-            url = f"{API_BASE_URL}/admin/claims/pending"
-            response = requests.get(url, headers=get_headers())
+            response = self.api.request("GET", "/admin/claims/pending")
             
             if response.status_code == 200:
                 try:
@@ -39,13 +49,10 @@ class AdminDashboard(ft.Container):
                     self.message_text.value = "Error loading claims: Unexpected response format."
                     self.page.update()
                     return
-                if not claims:
-                    self.message_text.value = "No claims to review."
-                else:
-                    self.message_text.value = ""
-                
+                self.version = parse_version(response.headers.get('X-Change-Version'))
                 for claim in claims:
-                    self.claims_data_table.rows.append(self._build_claim_row(claim))
+                    self._upsert_claim_row(claim)
+                self._update_empty_message()
             else:
                 try:
                     error_msg = response.json().get('error')
@@ -57,19 +64,22 @@ class AdminDashboard(ft.Container):
             
         self.page.update()
         
-    def _handle_resolve_action(self, claim_id, resolution_type):
+    def _handle_resolve_action(self, claim_id, item_id, resolution_type):
         try:
-            url = f"{API_BASE_URL}/admin/claims/resolve"
             data = {"claim_id": claim_id, "resolution_type": resolution_type}
-            response = requests.post(url, json=data, headers=get_headers())
+            response = self.api.request("POST", "/admin/claims/resolve", json=data)
             
             if response.status_code == 200:
                 if self.page:
                     self.page.snack_bar = ft.SnackBar(ft.Text(f"Claim {resolution_type}d successfully!"), open=True)
-                # Notify other views (e.g., HomeView) to refresh their data
-                if hasattr(self.page, "pubsub"):
-                    self.page.pubsub.send_all("refresh_items")
-                self._load_pending_claims()
+                # Notify other views (e.g., HomeView) that this item changed
+                try:
+                    item = response.json().get('item')
+                except ValueError:
+                    item = None
+                get_subscriptions(self.page).publish_local(f"items/{item_id}", item)
+                self._remove_claim_row(claim_id)
+                self._reconcile()
             else:
                 try:
                     error_msg = response.json().get('error', 'API error.')
@@ -81,8 +91,57 @@ class AdminDashboard(ft.Container):
         self.page.update()
 
 
+    def _upsert_claim_row(self, claim):
+        row = self._build_claim_row(claim)
+        old_row = self.claim_rows.get(claim['claim_id'])
+        if old_row is not None:
+            self.claims_data_table.rows[self.claims_data_table.rows.index(old_row)] = row
+        else:
+            self.claims_data_table.rows.append(row)
+        self.claim_rows[claim['claim_id']] = row
+
+    def _remove_claim_row(self, claim_id):
+        row = self.claim_rows.pop(claim_id, None)
+        if row is not None:
+            self.claims_data_table.rows.remove(row)
+        self._update_empty_message()
+
+    def _update_empty_message(self):
+        self.message_text.value = "" if self.claim_rows else "No claims to review."
+
+    def _reconcile(self):
+        """Applies server-side changes since self.version to both tables without refetching them."""
+        if self.version is None:
+            # The last listing came without a version, so there is nothing to take a delta from
+            self._load_pending_claims()
+            return
+        has_more = True
+        while has_more:
+            try:
+                response = self.api.request("GET", "/admin/changes", params={"since": self.version})
+                if response.status_code != 200:
+                    return
+                delta = response.json()
+            except (requests.exceptions.RequestException, ValueError):
+                return
+            for claim_id in delta.get('removed_claims', []):
+                self._remove_claim_row(claim_id)
+            for claim in delta.get('claims', []):
+                self._upsert_claim_row(claim)
+            if delta.get('categories') or delta.get('removed_categories'):
+                category_store.apply_changes(delta.get('categories', []), delta.get('removed_categories', []))
+                self._sync_category_rows()
+            self._update_empty_message()
+            self.version = delta.get('version', self.version)
+            has_more = delta.get('has_more', False)
+
+    def _on_claims_changed(self):
+        self._reconcile()
+        self.page.update()
+
     def _build_claim_row(self, claim):
         claim_id = claim['claim_id']
+        item_id = claim['item_id']
         return ft.DataRow(
             cells=[
                 ft.DataCell(ft.Text(str(claim_id))),
@@ -91,8 +150,8 @@ class AdminDashboard(ft.Container):
                 ft.DataCell(ft.Text(claim['verification_details'][:30] + '...' if len(claim['verification_details']) > 30 else claim['verification_details'])),
                 ft.DataCell(
                     ft.Row([
-                        ft.IconButton(ft.icons.CHECK, tooltip="Approve & Resolve", on_click=lambda e, cid=claim_id: self._handle_resolve_action(cid, 'approve'), icon_color=ft.colors.GREEN_500),
-                        ft.IconButton(ft.icons.CLOSE, tooltip="Reject Claim", on_click=lambda e, cid=claim_id: self._handle_resolve_action(cid, 'reject'), icon_color=ft.colors.RED_500),
+                        ft.IconButton(ft.icons.CHECK, tooltip="Approve & Resolve", on_click=lambda e, cid=claim_id, iid=item_id: self._handle_resolve_action(cid, iid, 'approve'), icon_color=ft.colors.GREEN_500),
+                        ft.IconButton(ft.icons.CLOSE, tooltip="Reject Claim", on_click=lambda e, cid=claim_id, iid=item_id: self._handle_resolve_action(cid, iid, 'reject'), icon_color=ft.colors.RED_500),
                     ])
                 ),
             ]
@@ -122,23 +181,32 @@ class AdminDashboard(ft.Container):
     # -----------------------------
 
     def _load_categories(self, e: ft.ControlEvent | None = None):
-        self.categories_list.controls.clear()
-        try:
-            url = f"{API_BASE_URL}/admin/categories"
-            response = requests.get(url, headers=get_headers())
-            if response.status_code == 200:
-                try:
-                    categories = response.json() or []
-                except ValueError:
-                    self.page.snack_bar = ft.SnackBar(ft.Text("Failed to load categories: Unexpected response format."), bgcolor=ft.colors.RED_400, open=True)
-                    self.page.update()
-                    return
-                for i, cat in enumerate(categories, 1):
-                    self.categories_list.controls.append(self._build_category_row(cat, i))
-            else:
-                self.page.snack_bar = ft.SnackBar(ft.Text("Failed to load categories"), bgcolor=ft.colors.RED_400, open=True)
-        except requests.exceptions.RequestException as err:
-            self.page.snack_bar = ft.SnackBar(ft.Text(f"Network error: {err}"), bgcolor=ft.colors.RED_400, open=True)
+        # Rendered from the shared store, so opening the dashboard costs no request
+        if not category_store.get():
+            self.page.snack_bar = ft.SnackBar(ft.Text("Failed to load categories"), bgcolor=ft.colors.RED_400, open=True)
+        self._sync_category_rows()
+        self.page.update()
+
+    def _sync_category_rows(self):
+        """Reuses row controls for unchanged categories; only new, renamed or renumbered rows are rebuilt."""
+        categories = category_store.get()
+        controls = []
+        for i, cat in enumerate(categories, 1):
+            cid = cat.get('category_id')
+            key = (cat.get('name'), i, cid == self.edit_mode)
+            cached = self.category_rows.get(cid)
+            if cached is None or cached[0] != key:
+                cached = (key, self._build_category_row(cat, i))
+                self.category_rows[cid] = cached
+            controls.append(cached[1])
+        live_ids = {cat.get('category_id') for cat in categories}
+        for cid in [cid for cid in self.category_rows if cid not in live_ids]:
+            del self.category_rows[cid]
+        self.categories_list.controls[:] = controls
+
+    def _on_categories_changed(self, events):
+        category_store.revalidate(max_age=1.0)
+        self._sync_category_rows()
         self.page.update()
 
     def _handle_create_category(self, e: ft.ControlEvent):
@@ -147,14 +215,13 @@ class AdminDashboard(ft.Container):
             self.page.snack_bar = ft.SnackBar(ft.Text("Enter category name"), bgcolor=ft.colors.RED_400, open=True)
             return
         try:
-            url = f"{API_BASE_URL}/admin/categories"
-            response = requests.post(url, json={"name": name}, headers=get_headers())
+            response = self.api.request("POST", "/admin/categories", json={"name": name})
             if response.status_code == 201:
                 self.category_name_input.value = ""
                 self.page.snack_bar = ft.SnackBar(ft.Text("Category created"), open=True)
-                self._load_categories()
-                if hasattr(self.page, "pubsub"):
-                    self.page.pubsub.send_all("refresh_categories")
+                self._reconcile()
+                self._sync_category_rows()
+                get_subscriptions(self.page).publish_local("categories")
             else:
                 try:
                     err_msg = response.json().get('error', 'Create failed')
@@ -167,13 +234,12 @@ class AdminDashboard(ft.Container):
 
     def _handle_delete_category(self, category_id: int):
         try:
-            url = f"{API_BASE_URL}/admin/categories/{category_id}"
-            response = requests.delete(url, headers=get_headers())
+            response = self.api.request("DELETE", f"/admin/categories/{category_id}")
             if response.status_code == 200:
                 self.page.snack_bar = ft.SnackBar(ft.Text("Category deleted"), open=True)
-                self._load_categories()
-                if hasattr(self.page, "pubsub"):
-                    self.page.pubsub.send_all("refresh_categories")
+                self._reconcile()
+                self._sync_category_rows()
+                get_subscriptions(self.page).publish_local("categories")
             else:
                 try:
                     err_msg = response.json().get('error', 'Delete failed')
@@ -191,14 +257,13 @@ class AdminDashboard(ft.Container):
             self.page.update()
             return
         try:
-            url = f"{API_BASE_URL}/admin/categories/{cid}"
-            response = requests.put(url, json={"name": new_name}, headers=get_headers())
+            response = self.api.request("PUT", f"/admin/categories/{cid}", json={"name": new_name})
             if response.status_code == 200:
                 self.page.snack_bar = ft.SnackBar(ft.Text("Category updated"), open=True)
                 self.edit_mode = None
-                self._load_categories()
-                if hasattr(self.page, "pubsub"):
-                    self.page.pubsub.send_all("refresh_categories")
+                self._reconcile()
+                self._sync_category_rows()
+                get_subscriptions(self.page).publish_local("categories")
             else:
                 try:
                     err_msg = response.json().get('error', 'Update failed')
@@ -1,8 +1,12 @@
 # frontend/views/home_view.py
 
 import flet as ft
-from frontend.api_client import get_items
+from frontend.api_client import get_client
 from frontend.components.item_card import ItemCard
+from frontend.subscriptions import get_subscriptions
+
+# Statuses the listing returns (include_resolved=True); anything else drops out of it
+LISTED_STATUSES = ('lost', 'found', 'resolved')
 
 class HomeView(ft.Container):
     def __init__(self, page: ft.Page):
@@ -11,6 +15,10 @@ class HomeView(ft.Container):
         
         self.search_field = ft.TextField(label="Search by keyword or location", width=500)
         self.items_list = ft.ListView(expand=True, spacing=10)
+        self.cards = {}  # item_id -> ItemCard currently on screen
+        self.version = None  # change version the list reflects; deltas are fetched from here
+        self.empty_text = ft.Text("No items found. Report one!", size=16)
+        self.solved_header = [ft.Divider(height=20), ft.Text("Solved Cases", size=20)]
         self.status_filter = ft.Dropdown(
             label="Filter Status",
             width=200,
@@ -27,14 +35,84 @@ class HomeView(ft.Container):
         # Initial load
         self._load_items(None)
 
-        # Subscribe to global pubsub to refresh when admin resolves claims or other updates occur
-        def _on_pubsub_message(msg):
-            if msg == "refresh_items":
+        # Refresh when admin resolves claims or other updates occur. Bursts are coalesced into a
+        # single delta request and the subscription is released when the router replaces this view.
+        get_subscriptions(self.page).subscribe(self, ("items", "items/*"), self._on_items_changed, coalesce=True)
+
+    def _on_items_changed(self, events):
+        """Applies the server's item delta since self.version; one request per coalesced burst."""
+        if self.version is None:
+            self._load_items(None)
+            return
+        api = get_client(self.page)
+        has_more = True
+        while has_more:
+            delta = api.get_item_changes(self.version)
+            if delta is None:
                 self._load_items(None)
-        self.page.pubsub.subscribe(_on_pubsub_message)
+                return
+            self._apply_item_changes(delta.get('items', []), delta.get('removed', []))
+            self.version = delta.get('version', self.version)
+            has_more = delta.get('has_more', False)
+        if self.page:
+            self.page.update()
+
+    def _apply_item_changes(self, items, removed_ids):
+        for item in items:
+            item_id = item.get('item_id')
+            card = self.cards.get(item_id)
+            visible = self._matches_filters(item)
+            if card is not None and (not visible or _is_solved(card.item) != _is_solved(item)):
+                self._remove_card(item_id)
+                card = None
+            if not visible:
+                continue
+            if card is not None:
+                card.update_item(item)
+            else:
+                self._insert_card(item)
+        for item_id in removed_ids:
+            self._remove_card(item_id)
+        if not self.cards and self.empty_text not in self.items_list.controls:
+            self.items_list.controls.append(self.empty_text)
+
+    def _matches_filters(self, item):
+        """Client-side mirror of the listing's WHERE clause for the current filters."""
+        status = item.get('status')
+        if status not in LISTED_STATUSES:
+            return False
+        if self.status_filter.value not in (None, 'all') and status != self.status_filter.value:
+            return False
+        search = (self.search_field.value or '').strip().lower()
+        if search:
+            return search in (item.get('title') or '').lower() or search in (item.get('description') or '').lower()
+        return True
+
+    def _insert_card(self, item):
+        controls = self.items_list.controls
+        if self.empty_text in controls:
+            controls.remove(self.empty_text)
+        card = self._make_card(item)
+        if not _is_solved(item):
+            controls.insert(0, card)
+            return
+        if self.solved_header[1] not in controls:
+            controls.extend(self.solved_header)
+        controls.insert(controls.index(self.solved_header[1]) + 1, card)
+
+    def _remove_card(self, item_id):
+        card = self.cards.pop(item_id, None)
+        if card is None:
+            return
+        controls = self.items_list.controls
+        controls.remove(card)
+        if not any(_is_solved(c.item) for c in self.cards.values()) and self.solved_header[1] in controls:
+            for header in self.solved_header:
+                controls.remove(header)
 
     def _load_items(self, e):
         self.items_list.controls.clear()
+        self.cards.clear()
 
         status = self.status_filter.value if self.status_filter.value != 'all' else None
         search = self.search_field.value.strip() if self.search_field.value else None
@@ -44,28 +122,32 @@ class HomeView(ft.Container):
         if self.page:
             self.page.update()
 
-        all_items = get_items(status=status, search=search, include_resolved=True)
+        all_items, self.version = get_client(self.page).get_items(status=status, search=search, include_resolved=True, with_version=True)
         self.items_list.controls.clear()
 
         if not all_items:
-            self.items_list.controls.append(ft.Text("No items found. Report one!", size=16))
+            self.items_list.controls.append(self.empty_text)
         else:
             # Separate resolved items for solved cases section
             unresolved_items = [item for item in all_items if item.get('status') != 'resolved']
             resolved_items = [item for item in all_items if item.get('status') == 'resolved']
 
             for item in unresolved_items:
-                self.items_list.controls.append(ItemCard(item, self.page))
+                self.items_list.controls.append(self._make_card(item))
 
             if resolved_items:
-                self.items_list.controls.append(ft.Divider(height=20))
-                self.items_list.controls.append(ft.Text("Solved Cases", size=20))
+                self.items_list.controls.extend(self.solved_header)
                 for item in resolved_items:
-                    self.items_list.controls.append(ItemCard(item, self.page))
+                    self.items_list.controls.append(self._make_card(item))
 
         if self.page:
             self.page.update()
 
+    def _make_card(self, item):
+        card = ItemCard(item, self.page)
+        self.cards[item.get('item_id')] = card
+        return card
+
     def _build_ui(self):
         return ft.Column(
             [
@@ -84,4 +166,9 @@ class HomeView(ft.Container):
             ],
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             expand=True
-        )
\ No newline at end of file
+        )
+
+
+
+def _is_solved(item):
+    return item.get('status') == 'resolved'
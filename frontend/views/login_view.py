@@ -1,7 +1,7 @@
 # frontend/views/login_view.py
 
 import flet as ft
-from frontend.api_client import login_user
+from frontend.api_client import get_client
 
 class LoginView(ft.Container):
     def __init__(self, page: ft.Page, app_state):
@@ -22,7 +22,7 @@ class LoginView(ft.Container):
         self.message_text.value = "Logging in..."
         self.page.update()
         
-        result = login_user(email, password)
+        result = get_client(self.page).login_user(email, password)
         
         if result and 'token' in result:
             self.app_state["token"] = result['token']
@@ -1,12 +1,15 @@
 # frontend/views/report_item_view.py
 
 import flet as ft
-from frontend.api_client import report_item_api, get_categories
+from frontend.api_client import get_client
+from frontend.category_store import category_store
+from frontend.subscriptions import get_subscriptions
 
 class ReportItemView(ft.Container):
     def __init__(self, page: ft.Page):
         super().__init__()
         self.page = page
+        self.api = get_client(page)
 
         self.title_field = ft.TextField(label="Item Name", width=400)
         self.desc_field = ft.TextField(label="Detailed Description", multiline=True, min_lines=3, width=400)
@@ -15,32 +18,31 @@ class ReportItemView(ft.Container):
             ft.Radio(value="found", label="I Found This Item")
         ]), value="lost")
 
-        categories = get_categories()
-        self.category_options = [ft.dropdown.Option(key=str(c['category_id']), text=c['name']) for c in categories]
-        default_category_key = self.category_options[0].key if self.category_options else None
-        self.category_choice = ft.Dropdown(label="Category", width=400, options=self.category_options, value=default_category_key, disabled=not bool(self.category_options))
+        # Served from the process-wide store: no network round trip once it has loaded
+        self.category_choice = ft.Dropdown(label="Category", width=400)
+        self._apply_categories(category_store.get())
 
         self.message_text = ft.Text("")
 
         self.content = self._build_ui()
 
-        # Subscribe to refresh categories
-        def _on_pubsub_message(msg):
-            if msg == "refresh_categories":
-                self._refresh_categories()
-        self.page.pubsub.subscribe(_on_pubsub_message)
+        # Refresh categories while this view is on screen
+        get_subscriptions(self.page).subscribe(self, "categories", lambda events: self._refresh_categories(), coalesce=True)
 
     def _refresh_categories(self):
-        categories = get_categories()
+        if category_store.revalidate(max_age=1.0) or self._rendered_version != category_store.version:
+            self._apply_categories(category_store.get())
+            self.page.update()
+
+    def _apply_categories(self, categories):
+        self._rendered_version = category_store.version
         self.category_options = [ft.dropdown.Option(key=str(c['category_id']), text=c['name']) for c in categories]
         self.category_choice.options = self.category_options
-        if self.category_options:
-            self.category_choice.value = self.category_options[0].key
-            self.category_choice.disabled = False
-        else:
-            self.category_choice.value = None
-            self.category_choice.disabled = True
-        self.page.update()
+        keys = [o.key for o in self.category_options]
+        if self.category_choice.value not in keys:
+            # Keep the user's selection unless that category is gone
+            self.category_choice.value = keys[0] if keys else None
+        self.category_choice.disabled = not keys
 
     def _handle_report_submit(self, e):
         if not all([self.title_field.value, self.desc_field.value, self.status_choice.value, self.category_choice.value]):
@@ -65,10 +67,11 @@ class ReportItemView(ft.Container):
         self.message_text.value = "Submitting report..."
         self.page.update()
         
-        result = report_item_api(report_data)
+        result = self.api.report_item_api(report_data)
         
         if 'id' in result:
             self.message_text.value = "Report submitted successfully! Check Home for listings."
+            get_subscriptions(self.page).publish_local(f"items/{result['id']}", result.get('item'))
             self.page.go("/")
         else:
             self.message_text.value = result.get('error', 'Report failed.')
@@ -1,7 +1,7 @@
 # frontend/views/signup_view.py
 
 import flet as ft
-from frontend.api_client import signup_user
+from frontend.api_client import get_client
 
 class SignupView(ft.Container):
     def __init__(self, page: ft.Page):
@@ -46,7 +46,7 @@ class SignupView(ft.Container):
         self.page.update()
         
         role = self.role_choice.value
-        result = signup_user(name, email, password, role)
+        result = get_client(self.page).signup_user(name, email, password, role)
         
         if result and 'message' in result:
             self.message_text.value = "Signup successful! Please login."
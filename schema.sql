@@ -50,7 +50,27 @@ CREATE TABLE IF NOT EXISTS Notifications (
     type ENUM('email', 'system') NOT NULL,
     status ENUM('sent', 'pending', 'read') NOT NULL DEFAULT 'pending',
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (user_id) REFERENCES Users(user_id)
+    FOREIGN KEY (user_id) REFERENCES Users(user_id),
+    INDEX idx_notifications_user_status_created (user_id, status, created_at),
+    INDEX idx_notifications_user_id (user_id, notification_id)
+);
+
+-- Changes (change log; change_id is the version clients sync from)
+CREATE TABLE IF NOT EXISTS Changes (
+    change_id BIGINT PRIMARY KEY AUTO_INCREMENT,
+    entity ENUM('item', 'claim', 'category') NOT NULL,
+    entity_id INT NOT NULL,
+    action ENUM('created', 'updated', 'deleted') NOT NULL,
+    changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- RevokedTokens (JWT denylist; rows are useless after expires_at)
+CREATE TABLE IF NOT EXISTS RevokedTokens (
+    jti VARCHAR(64) PRIMARY KEY,
+    user_id INT,
+    expires_at DATETIME NOT NULL,
+    revoked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_revoked_tokens_expires (expires_at)
 );
 
 DROP TRIGGER IF EXISTS update_item_status_on_claim_approval;